@@ -1,6 +1,7 @@
 import sys
 import io
 import faulthandler
+import multiprocessing
 from src.desktop.main import main
 
 
@@ -21,6 +22,8 @@ def init_streams():
 
 
 if __name__ == "__main__":
+    # Frozen builds: roll analysis runs in spawned worker processes
+    multiprocessing.freeze_support()
     init_streams()
     try:
         faulthandler.enable()
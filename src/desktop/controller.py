@@ -1,10 +1,18 @@
 import os
 import time
 from dataclasses import replace
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 import numpy as np
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, QMetaObject, Q_ARG, Qt
+from PyQt6.QtCore import (
+    QObject,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    QMetaObject,
+    Q_ARG,
+    Qt,
+)
 from PyQt6.QtGui import QIcon, QPixmap
 
 from src.desktop.session import DesktopSessionManager, AppState, ToolMode
@@ -13,20 +21,38 @@ from src.desktop.workers.render import (
     RenderTask,
     ThumbnailWorker,
     ThumbnailUpdateTask,
+    ViewportTask,
 )
 from src.desktop.workers.export import ExportWorker, ExportTask
+from src.desktop.workers.index import IndexWorker
+from src.desktop.workers.preview import PreviewTask, PreviewWorker
+from src.services.rendering.analysis_cache import AnalysisCache
+from src.services.rendering.prefetch import PrefetchRequest, PreviewPrefetcher
 from src.services.rendering.preview_manager import PreviewManager
+from src.services.rendering.preview_pyramid import PreviewPyramid
+from src.services.rendering.scheduler import CancellationToken, RenderScheduler
+from src.services.rendering.viewport import Viewport
 from src.infrastructure.filesystem.watcher import FolderWatchService
+from src.infrastructure.storage.array_cache import ArrayDiskCache
+from src.infrastructure.storage.catalog import FileCatalog
+from src.services.assets.indexer import LibraryIndexer
 from src.infrastructure.storage.local_asset_store import LocalAssetStore
 from src.services.view.coordinate_mapping import CoordinateMapping
 from src.kernel.system.config import APP_CONFIG
 from src.desktop.converters import ImageConverter
+from src.services.export.look import export_look_cube
 from src.features.exposure.logic import calculate_wb_shifts
 from src.infrastructure.gpu.resources import GPUTexture
 from src.kernel.system.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Quiet period after the last interactive change before the full-size refine
+PREVIEW_REFINE_DELAY_MS = 150
+
+# Preview metrics the zoomed viewport reuses to match the fitted frame
+VIEWPORT_METRIC_KEYS = ("log_bounds", "log_bounds_buffer_val", "bw_black_point")
+
 
 class AppController(QObject):
     """
@@ -40,6 +66,11 @@ class AppController(QObject):
     export_progress = pyqtSignal(int, int, str)
     export_finished = pyqtSignal(float)
     render_requested = pyqtSignal(RenderTask)
+    viewport_requested = pyqtSignal(ViewportTask)
+    cleanup_requested = pyqtSignal()
+    viewport_updated = pyqtSignal(object, object)  # (ndarray | None, viewport)
+    preview_requested = pyqtSignal(PreviewTask)
+    index_requested = pyqtSignal(list)
     thumbnail_requested = pyqtSignal(list)
     thumbnail_update_requested = pyqtSignal(ThumbnailUpdateTask)
     tool_sync_requested = pyqtSignal()
@@ -54,31 +85,77 @@ class AppController(QObject):
         self._first_render_done = False
         self._export_start_time = 0.0
 
-        self.preview_service = PreviewManager()
+        self.preview_service = PreviewManager(
+            ArrayDiskCache(
+                os.path.join(APP_CONFIG.cache_dir, "previews"),
+                APP_CONFIG.preview_disk_cache_bytes,
+            )
+        )
+        self.prefetcher: PreviewPrefetcher[Tuple[np.ndarray, Tuple[int, int], dict]] = (
+            PreviewPrefetcher(
+                self._prefetch_preview,
+                lambda res: res[0].nbytes,
+                APP_CONFIG.prefetch_cache_bytes,
+            )
+        )
         self.watcher = FolderWatchService()
         self.asset_store = LocalAssetStore(
             APP_CONFIG.cache_dir, APP_CONFIG.user_icc_dir
         )
         self.asset_store.initialize()
 
+        # Measurements persist per file across sessions
+        analysis_cache = AnalysisCache(self.session.repo)
+
         # Thread management
         self.render_thread = QThread()
-        self.render_worker = RenderWorker()
+        self.render_worker = RenderWorker(analysis_cache)
         self.render_worker.moveToThread(self.render_thread)
         self.render_thread.start()
 
         self.export_thread = QThread()
-        self.export_worker = ExportWorker()
+        decode_cache = None
+        if APP_CONFIG.decode_disk_cache_bytes > 0:
+            decode_cache = ArrayDiskCache(
+                os.path.join(APP_CONFIG.cache_dir, "decoded"),
+                APP_CONFIG.decode_disk_cache_bytes,
+            )
+        self.export_worker = ExportWorker(analysis_cache, decode_cache)
         self.export_worker.moveToThread(self.export_thread)
         self.export_thread.start()
 
+        self.preview_thread = QThread()
+        self.preview_worker = PreviewWorker(self.preview_service)
+        self.preview_worker.moveToThread(self.preview_thread)
+        self.preview_thread.start()
+        # Draft on screen, full decode in flight
+        self._pending_preview: Optional[Tuple[PreviewTask, CancellationToken]] = None
+
+        self.catalog = FileCatalog(os.path.join(APP_CONFIG.cache_dir, "catalog.db"))
+        self.catalog.initialize()
+        self.index_thread = QThread()
+        self.index_worker = IndexWorker(LibraryIndexer(self.catalog))
+        self.index_worker.moveToThread(self.index_thread)
+        self.index_thread.start()
+
         self.thumb_thread = QThread()
         self.thumb_worker = ThumbnailWorker(self.asset_store)
         self.thumb_worker.moveToThread(self.thumb_thread)
         self.thumb_thread.start()
 
-        self._is_rendering = False
-        self._pending_render_task: Any = None
+        # Latest-wins: one frame in flight, newer requests replace the pending one
+        self.render_scheduler: RenderScheduler[RenderTask] = RenderScheduler()
+
+        # Zoomed inspection: (viewport, output size) while active
+        self.viewport_scheduler: RenderScheduler[ViewportTask] = RenderScheduler()
+        self._viewport: Optional[Tuple[Viewport, Tuple[int, int]]] = None
+        self._viewport_metrics: Dict[str, Any] = {}
+
+        # Interactive edits render a coarse pyramid level, then refine
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(PREVIEW_REFINE_DELAY_MS)
+        self._refine_timer.timeout.connect(self._on_refine_timeout)
 
         self._connect_signals()
 
@@ -89,12 +166,24 @@ class AppController(QObject):
         self.render_requested.connect(self.render_worker.process)
         self.render_worker.finished.connect(self._on_render_finished)
         self.render_worker.metrics_updated.connect(self._on_metrics_updated)
-        self.render_worker.error.connect(self._on_render_error)
+        self.render_worker.cancelled.connect(self._on_render_cancelled)
+        self.render_worker.error.connect(self._on_render_worker_error)
+        self.viewport_requested.connect(self.render_worker.render_viewport)
+        self.cleanup_requested.connect(self.render_worker.cleanup)
+        self.render_worker.viewport_finished.connect(self._on_viewport_finished)
+        self.render_worker.viewport_cancelled.connect(self._on_viewport_cancelled)
 
         self.export_worker.progress.connect(self.export_progress.emit)
         self.export_worker.finished.connect(self._on_export_finished)
         self.export_worker.error.connect(self._on_render_error)
 
+        self.preview_requested.connect(self.preview_worker.refine)
+        self.preview_worker.finished.connect(self._on_preview_refined)
+
+        self.index_requested.connect(self.index_worker.index)
+        self.index_worker.progress.connect(self.status_progress_requested.emit)
+        self.index_worker.finished.connect(self._on_index_finished)
+
         self.thumbnail_requested.connect(self.thumb_worker.generate)
         self.thumbnail_update_requested.connect(self.thumb_worker.update_rendered)
         self.thumb_worker.finished.connect(self._on_thumbnails_finished)
@@ -112,6 +201,18 @@ class AppController(QObject):
         if missing:
             self.thumbnail_requested.emit(missing)
 
+    def add_files(self, file_paths: List[str]) -> None:
+        """Indexes files in the background, then adds them to the session."""
+        if file_paths:
+            self.set_status(f"Indexing {len(file_paths)} files...")
+            self.index_requested.emit(list(file_paths))
+
+    def _on_index_finished(self, records: List[Any]) -> None:
+        self.set_status(f"Indexed {len(records)} files", 3000)
+        if records:
+            self.session.add_records(records)
+            self.generate_missing_thumbnails()
+
     def _on_thumbnails_finished(self, new_thumbs: Dict[str, Any]) -> None:
         self.set_status("GALLERIES UPDATED", 3000)
         for name, pil_img in new_thumbs.items():
@@ -128,21 +229,110 @@ class AppController(QObject):
         self.loading_started.emit()
         self._first_render_done = False
 
-        # Evacuate VRAM before large allocation
-        self.render_worker.cleanup()
+        # Evacuate VRAM before large allocation. Queued onto the render thread
+        # so it cannot race an in-flight render or viewport task.
+        self.clear_viewport()
+        self.cleanup_requested.emit()
 
+        if self._pending_preview is not None:
+            self._pending_preview[1].cancel()
+            self._pending_preview = None
+
+        color_space = self.state.workspace_color_space
+        use_camera_wb = self.state.config.exposure.use_camera_wb
+        file_hash = self.state.current_file_hash
         try:
-            raw, dims, _ = self.preview_service.load_linear_preview(
-                file_path,
-                self.state.workspace_color_space,
-                use_camera_wb=self.state.config.exposure.use_camera_wb,
-            )
-            self.state.preview_raw = raw
-            self.state.original_res = dims
+            loaded = None
+            if file_hash:
+                loaded = self.prefetcher.take(
+                    PreviewManager.preview_cache_key(
+                        file_hash, color_space, use_camera_wb
+                    )
+                )
+            if loaded is None:
+                loaded = self.preview_service.cached_preview(
+                    file_hash, color_space, use_camera_wb
+                )
+            draft = False
+            if loaded is None and APP_CONFIG.draft_previews:
+                loaded = PreviewManager.load_linear_draft(
+                    file_path, color_space, use_camera_wb
+                )
+                draft = loaded is not None
+            if loaded is None:
+                loaded = self.preview_service.load_preview(
+                    file_path, file_hash, color_space, use_camera_wb=use_camera_wb
+                )
+            raw, dims, _ = loaded
+            self._set_preview(raw, dims, draft)
             self.state.current_file_path = file_path
+            if draft:
+                token = CancellationToken()
+                task = PreviewTask(
+                    file_path, file_hash, color_space, use_camera_wb, token
+                )
+                self._pending_preview = (task, token)
+                self.preview_requested.emit(task)
             self.request_render()
         except Exception as e:
             logger.error(f"Asset load failed: {e}")
+        self._schedule_prefetch()
+
+    def _prefetch_preview(
+        self, req: PrefetchRequest
+    ) -> Tuple[np.ndarray, Tuple[int, int], dict]:
+        return self.preview_service.load_preview(
+            req.file_path,
+            req.file_hash,
+            req.color_space,
+            use_camera_wb=req.use_camera_wb,
+        )
+
+    def _schedule_prefetch(self) -> None:
+        """
+        Decodes the next/previous files of the roll in the background.
+        Neighbours are assumed to share the current colour space and WB mode;
+        a mismatch only costs a miss.
+        """
+        idx = self.state.selected_file_idx
+        files = self.state.uploaded_files
+        if idx < 0:
+            self.prefetcher.cancel_all()
+            return
+
+        order = [idx + i for i in range(1, APP_CONFIG.prefetch_ahead + 1)]
+        order += [idx - i for i in range(1, APP_CONFIG.prefetch_behind + 1)]
+        color_space = self.state.workspace_color_space
+        use_camera_wb = self.state.config.exposure.use_camera_wb
+        requests = [
+            PrefetchRequest(
+                PreviewManager.preview_cache_key(
+                    files[i]["hash"], color_space, use_camera_wb
+                ),
+                files[i]["path"],
+                files[i]["hash"],
+                color_space,
+                use_camera_wb,
+            )
+            for i in order
+            if 0 <= i < len(files) and files[i].get("hash")
+        ]
+        self.prefetcher.schedule(requests)
+
+    def _set_preview(self, raw: np.ndarray, dims: Tuple[int, int], draft: bool) -> None:
+        self.state.preview_raw = raw
+        self.state.preview_pyramid = PreviewPyramid.build(raw)
+        self.state.original_res = dims
+        self.state.preview_is_draft = draft
+
+    def _on_preview_refined(self, task: PreviewTask, result: Any) -> None:
+        """Swaps the draft for the demosaiced preview if still current."""
+        if self._pending_preview is None or self._pending_preview[0] is not task:
+            return
+        self._pending_preview = None
+        raw, dims, _ = result
+        self._set_preview(raw, dims, draft=False)
+        self.request_render()
 
     def handle_canvas_clicked(self, nx: float, ny: float) -> None:
         if self.state.active_tool == ToolMode.WB_PICK:
@@ -266,29 +456,123 @@ class AppController(QObject):
         self.request_render()
 
     def request_render(self, readback_metrics: bool = True) -> None:
-        """Dispatches a render task to the worker thread."""
+        """
+        Dispatches a render task to the worker thread.
+        Slider drags (no metrics readback) render a coarse pyramid level first;
+        the full preview follows once input has been quiet for a moment.
+        """
         if self.state.preview_raw is None:
             return
 
+        buffer = self.state.preview_raw
+        level = -1
+        coarse = False
+        pyramid = self.state.preview_pyramid
+        if pyramid is not None and pyramid.full is buffer:
+            coarse = not readback_metrics and pyramid.top > 0
+            if coarse:
+                level = pyramid.interactive_level()
+                self._refine_timer.start()
+            else:
+                level = pyramid.top
+                self._refine_timer.stop()
+            buffer = pyramid.levels[level]
+
         self.set_status("Rendering...")
+        token = CancellationToken()
+        file_hash = self.state.current_file_hash or "preview"
+        source_hash = file_hash
+        if self.state.preview_is_draft:
+            # Keeps draft stages and analysis apart from the refined preview
+            source_hash = f"{file_hash}:draft"
+
         task = RenderTask(
-            buffer=self.state.preview_raw,
+            buffer=buffer,
             config=self.state.config,
-            source_hash=self.state.current_file_hash or "preview",
+            source_hash=source_hash,
+            file_hash=file_hash,
             preview_size=float(APP_CONFIG.preview_render_size),
             icc_profile_path=self.state.icc_profile_path,
             icc_invert=self.state.icc_invert,
             color_space=self.state.workspace_color_space,
             gpu_enabled=self.state.gpu_enabled,
             readback_metrics=readback_metrics,
+            pyramid_level=level,
+            cancel_token=token,
         )
 
-        if self._is_rendering:
-            self._pending_render_task = task
+        # Coarse frames are cheap and keep the drag visibly live, so they are
+        # allowed to finish; full-size frames are cancelled once superseded.
+        self._dispatch(
+            self.render_scheduler.submit(task, token, preemptible=not coarse)
+        )
+
+    def _dispatch(self, ticket: Any) -> None:
+        if ticket is not None:
+            self.render_requested.emit(ticket.task)
+
+    def request_viewport(
+        self, nx1: float, ny1: float, nx2: float, ny2: float, out_w: int, out_h: int
+    ) -> None:
+        """
+        Zooms into a normalized rect of the displayed frame, rendered natively.
+        """
+        if not self.state.current_file_path:
             return
+        self._viewport = ((nx1, ny1, nx2, ny2), (out_h, out_w))
+        self._submit_viewport()
 
-        self._is_rendering = True
-        self.render_requested.emit(task)
+    def clear_viewport(self) -> None:
+        """Returns to the fitted preview."""
+        if self._viewport is None:
+            return
+        self._viewport = None
+        self.viewport_scheduler.cancel_all()
+        self.viewport_updated.emit(None, None)
+
+    def _submit_viewport(self) -> None:
+        if self._viewport is None or not self.state.current_file_path:
+            return
+        viewport, out_size = self._viewport
+        token = CancellationToken()
+        task = ViewportTask(
+            file_path=self.state.current_file_path,
+            config=self.state.config,
+            source_hash=self.state.current_file_hash or "preview",
+            viewport=viewport,
+            out_size=out_size,
+            color_space=self.state.workspace_color_space,
+            preview_metrics=dict(self._viewport_metrics),
+            cancel_token=token,
+        )
+        # Panning cancels the in-flight frame; finished tiles stay cached
+        ticket = self.viewport_scheduler.submit(task, token)
+        if ticket is not None:
+            self.viewport_requested.emit(ticket.task)
+
+    def _on_viewport_finished(self, result: Any, viewport: Any) -> None:
+        ticket = self.viewport_scheduler.complete()
+        if self._viewport is not None:
+            self.viewport_updated.emit(result, viewport)
+        if ticket is not None:
+            self.viewport_requested.emit(ticket.task)
+
+    def _on_viewport_cancelled(self) -> None:
+        ticket = self.viewport_scheduler.complete(cancelled=True)
+        if ticket is not None:
+            self.viewport_requested.emit(ticket.task)
+
+    def render_stats(self) -> Dict[str, float]:
+        """
+        Queue latency and frame time (seconds) plus completed/cancelled counts.
+        """
+        return self.render_scheduler.stats.snapshot()
+
+    def prefetch_stats(self) -> Dict[str, float]:
+        """
+        Neighbour prefetch hits/misses and hit rate.
+        """
+        return self.prefetcher.stats.snapshot()
 
     def request_export(self) -> None:
         if not self.state.current_file_path:
@@ -316,6 +600,16 @@ class AppController(QObject):
             ]
         )
 
+    def request_look_export(self, path: str) -> None:
+        """
+        Saves the current colour look (crosstalk, saturation, toning) as a .cube.
+        """
+        try:
+            saved = export_look_cube(self.state.config, path)
+            self.set_status(f"LUT saved: {os.path.basename(saved)}", 3000)
+        except Exception as e:
+            logger.error(f"LUT export failed: {e}")
+
     def request_batch_export(self) -> None:
         # Synchronize ICC state to export config
         export_conf = replace(
@@ -347,8 +641,23 @@ class AppController(QObject):
             Q_ARG(list, tasks),
         )
 
+    def _on_refine_timeout(self) -> None:
+        self.request_render()
+
     def _on_render_finished(self, result: Any, metrics: Dict[str, Any]) -> None:
-        self._is_rendering = False
+        self._dispatch(self.render_scheduler.complete())
+
+        pyramid = self.state.preview_pyramid
+        level = metrics.get("pyramid_level", -1)
+        if pyramid is not None and 0 <= level <= pyramid.top:
+            pyramid.record_frame(level, metrics.get("render_seconds", 0.0))
+
+        # Settings changed: refresh the zoomed viewport once the full frame lands
+        if pyramid is None or level < 0 or level == pyramid.top:
+            self._viewport_metrics = {
+                k: metrics[k] for k in VIEWPORT_METRIC_KEYS if k in metrics
+            }
+            self._submit_viewport()
 
         # Only update thumbnail on the very first render of a file
         should_update_thumb = not self._first_render_done
@@ -365,9 +674,16 @@ class AppController(QObject):
         self.state.last_metrics.update(metrics)
         self.metrics_available.emit(metrics)
 
+    def _on_render_cancelled(self) -> None:
+        self._dispatch(self.render_scheduler.complete(cancelled=True))
+
+    def _on_render_worker_error(self, message: str) -> None:
+        self._on_render_error(message)
+        # Newer settings may render fine
+        self._dispatch(self.render_scheduler.complete(cancelled=True))
+
     def _on_render_error(self, message: str) -> None:
-        self.state.is_processing = self._is_rendering = False
-        self._pending_render_task = None
+        self.state.is_processing = False
         logger.error(f"Worker failure: {message}")
 
     def _on_export_finished(self) -> None:
@@ -408,6 +724,11 @@ class AppController(QObject):
         self.render_thread.wait()
         self.export_thread.quit()
         self.export_thread.wait()
+        self.preview_thread.quit()
+        self.preview_thread.wait()
+        self.prefetcher.shutdown()
+        self.index_thread.quit()
+        self.index_thread.wait()
         self.thumb_thread.quit()
         self.thumb_thread.wait()
         self.render_worker.destroy_all()
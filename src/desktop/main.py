@@ -39,7 +39,9 @@ def main() -> None:
             f.write("\n--- Booting NegPy ---\n")
 
     try:
-        os.environ["NUMBA_THREADING_LAYER"] = "workqueue"
+        # Thread-safe layers first so export tiles can render concurrently;
+        # workqueue (not thread-safe) only where neither tbb nor omp loads
+        os.environ.setdefault("NUMBA_THREADING_LAYER_PRIORITY", "tbb omp workqueue")
 
         # Platform-specific safeguards for display and GPU stability
         if sys.platform == "linux":
@@ -1,8 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QAbstractListModel, QModelIndex, Qt
 from src.domain.models import WorkspaceConfig
+from src.infrastructure.storage.catalog import FileRecord
 from src.infrastructure.storage.repository import StorageRepository
 
 
@@ -30,9 +31,13 @@ class AppState:
         default_factory=dict
     )  # filename -> QIcon/QPixmap
     selected_file_idx: int = -1
+    # (key, descending) applied to the file list; None keeps insertion order
+    file_sort: Optional[Tuple[str, bool]] = None
     active_adjustment_idx: int = 0
     last_metrics: Dict[str, Any] = field(default_factory=dict)
     preview_raw: Optional[Any] = None
+    preview_pyramid: Optional[Any] = None
+    preview_is_draft: bool = False
     original_res: tuple[int, int] = (0, 0)
     clipboard: Optional[WorkspaceConfig] = None
 
@@ -362,6 +367,57 @@ class DesktopSessionManager(QObject):
         self.asset_model.refresh()
         self.state_changed.emit()
 
+    def add_records(self, records: List[FileRecord]) -> None:
+        """
+        Adds indexed files (hash and header facts already known).
+        """
+        known = {f["hash"] for f in self.state.uploaded_files}
+        for rec in records:
+            if rec.file_hash in known:
+                continue
+            known.add(rec.file_hash)
+            self.state.uploaded_files.append(rec.to_file_info())
+
+        if self.state.file_sort is not None:
+            self.sort_files(*self.state.file_sort)
+        self.asset_model.refresh()
+        self.state_changed.emit()
+
+    def sort_files(self, key: str, descending: bool = False) -> None:
+        """
+        Reorders the file list by an indexed field, keeping the selection.
+        Files added without an index sort by name. The order is kept for
+        files indexed later.
+        """
+        self.state.file_sort = (key, descending)
+        current = self.state.current_file_hash
+        files = self.state.uploaded_files
+        if key == "pixels":
+            files.sort(
+                key=lambda f: f.get("width", 0) * f.get("height", 0),
+                reverse=descending,
+            )
+        elif key in ("size", "mtime"):
+            files.sort(key=lambda f: f.get(key, 0), reverse=descending)
+        else:
+            files.sort(key=lambda f: f["name"].lower(), reverse=descending)
+
+        if current is not None:
+            self.state.selected_file_idx = next(
+                (i for i, f in enumerate(files) if f["hash"] == current), -1
+            )
+        self.asset_model.refresh()
+
+    @staticmethod
+    def matches_filter(file_info: Dict[str, Any], text: str) -> bool:
+        """
+        Case-insensitive match of the file name or sensor type.
+        """
+        text = text.strip().lower()
+        return not text or any(
+            text in str(file_info.get(k, "")).lower() for k in ("name", "sensor")
+        )
+
     def clear_files(self) -> None:
         """
         Purges all loaded files from the session.
@@ -392,6 +448,7 @@ class DesktopSessionManager(QObject):
                 self.state.current_file_path = None
                 self.state.current_file_hash = None
                 self.state.preview_raw = None
+                self.state.preview_pyramid = None
                 self.state.config = WorkspaceConfig()
             else:
                 # Clamp index to new bounds
@@ -2,7 +2,7 @@ import numpy as np
 import sys
 from typing import Optional, Tuple
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QImage, QMouseEvent, QColor, QPen
+from PyQt6.QtGui import QPainter, QImage, QMouseEvent, QColor, QPen, QWheelEvent
 from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QSize
 from src.desktop.converters import ImageConverter
 from src.desktop.session import ToolMode, AppState
@@ -10,6 +10,10 @@ from src.desktop.view.widgets.overlays import ImageInfoOverlay
 from src.desktop.view.styles.theme import THEME
 from src.kernel.system.config import APP_CONFIG
 
+# Wheel step zoom factor and the maximum magnification (x native pixels)
+ZOOM_STEP = 1.25
+MAX_NATIVE_ZOOM = 2.0
+
 
 class CanvasOverlay(QWidget):
     """
@@ -18,6 +22,9 @@ class CanvasOverlay(QWidget):
 
     clicked = pyqtSignal(float, float)
     crop_completed = pyqtSignal(float, float, float, float)
+    # Normalized (x1, y1, x2, y2) of the frame plus output size in pixels
+    viewport_changed = pyqtSignal(float, float, float, float, int, int)
+    viewport_reset = pyqtSignal()
 
     def __init__(self, state: AppState, parent=None):
         super().__init__(parent)
@@ -36,11 +43,20 @@ class CanvasOverlay(QWidget):
         self._tool_mode: ToolMode = ToolMode.NONE
         self._mouse_pos: QPointF = QPointF()
 
+        # Zoom State (1.0 = fitted preview), center in normalized frame coords
+        self._zoom: float = 1.0
+        self._zoom_center: Tuple[float, float] = (0.5, 0.5)
+        self._zoom_image: Optional[QImage] = None
+        self._zoom_image_viewport: Tuple[float, float, float, float] = (0, 0, 1, 1)
+        self._pan_anchor: Optional[QPointF] = None
+
         self.setMouseTracking(True)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
     def set_tool_mode(self, mode: ToolMode) -> None:
         self._tool_mode = mode
+        if mode == ToolMode.CROP_MANUAL:
+            self.reset_zoom()
         if mode != ToolMode.CROP_MANUAL:
             self._crop_p1 = None
             self._crop_p2 = None
@@ -86,6 +102,10 @@ class CanvasOverlay(QWidget):
         elif self._current_size:
             size = QSize(self._current_size[0], self._current_size[1])
 
+        if size and self.is_zoomed and self._content_rect:
+            # Zoomed view shows the frame only, without paper borders
+            size = QSize(self._content_rect[2], self._content_rect[3])
+
         if size:
             widget_size = self.size()
             ratio = min(
@@ -97,11 +117,145 @@ class CanvasOverlay(QWidget):
             y = (widget_size.height() - new_h) // 2
             self._display_rect = QRectF(x, y, new_w, new_h)
 
-            if self._qimage:
+            if self.is_zoomed:
+                self._draw_zoomed(painter)
+            elif self._qimage:
                 painter.drawImage(self._display_rect, self._qimage)
 
         self._draw_widget_ui(painter)
 
+    @property
+    def is_zoomed(self) -> bool:
+        return self._zoom > 1.0
+
+    def viewport(self) -> Tuple[float, float, float, float]:
+        """
+        Visible part of the frame, normalized (x1, y1, x2, y2).
+        """
+        half = 0.5 / self._zoom
+        cx = float(np.clip(self._zoom_center[0], half, 1.0 - half))
+        cy = float(np.clip(self._zoom_center[1], half, 1.0 - half))
+        return cx - half, cy - half, cx + half, cy + half
+
+    def set_viewport_image(
+        self,
+        buffer: Optional[np.ndarray],
+        color_space: str,
+        viewport: Optional[Tuple[float, float, float, float]] = None,
+    ) -> None:
+        """Native resolution render of a (possibly outdated) viewport."""
+        if buffer is None or viewport is None or not self.is_zoomed:
+            self._zoom_image = None
+        else:
+            self._zoom_image = ImageConverter.to_qimage(buffer, color_space)
+            self._zoom_image_viewport = viewport
+        self.update()
+
+    def reset_zoom(self) -> None:
+        if not self.is_zoomed:
+            return
+        self._zoom = 1.0
+        self._zoom_image = None
+        self._pan_anchor = None
+        self.viewport_reset.emit()
+        self.update()
+
+    def _content_source_rect(self) -> Optional[QRectF]:
+        """Frame area of the fitted preview image (excludes paper borders)."""
+        if not self._qimage:
+            return None
+        if self._content_rect:
+            cx, cy, cw, ch = self._content_rect
+            return QRectF(cx, cy, cw, ch)
+        return QRectF(0, 0, self._qimage.width(), self._qimage.height())
+
+    def _draw_zoomed(self, painter: QPainter) -> None:
+        x1, y1, x2, y2 = self.viewport()
+        d = self._display_rect
+
+        # Upscaled preview underneath until the native render catches up
+        src = self._content_source_rect()
+        if src is not None and self._qimage is not None:
+            crop = QRectF(
+                src.x() + x1 * src.width(),
+                src.y() + y1 * src.height(),
+                (x2 - x1) * src.width(),
+                (y2 - y1) * src.height(),
+            )
+            painter.drawImage(d, self._qimage, crop)
+
+        if self._zoom_image is not None:
+            # Last native render, placed where its viewport sits now (pan)
+            ix1, iy1, ix2, iy2 = self._zoom_image_viewport
+            sx, sy = d.width() / (x2 - x1), d.height() / (y2 - y1)
+            target = QRectF(
+                d.x() + (ix1 - x1) * sx,
+                d.y() + (iy1 - y1) * sy,
+                (ix2 - ix1) * sx,
+                (iy2 - iy1) * sy,
+            )
+            painter.save()
+            painter.setClipRect(d)
+            painter.drawImage(target, self._zoom_image)
+            painter.restore()
+
+    def _max_zoom(self) -> float:
+        long_edge = max(self.state.original_res)
+        shown = max(self._display_rect.width(), self._display_rect.height())
+        if long_edge <= 0 or shown <= 0:
+            return 1.0
+        return max(1.0, MAX_NATIVE_ZOOM * long_edge / shown)
+
+    def _emit_viewport(self) -> None:
+        if not self.is_zoomed:
+            self.viewport_reset.emit()
+            return
+        x1, y1, x2, y2 = self.viewport()
+        self._zoom_center = ((x1 + x2) / 2, (y1 + y2) / 2)
+        ratio = self.devicePixelRatioF()
+        self.viewport_changed.emit(
+            x1,
+            y1,
+            x2,
+            y2,
+            int(self._display_rect.width() * ratio),
+            int(self._display_rect.height() * ratio),
+        )
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        if (
+            self._display_rect.isEmpty()
+            or self._tool_mode == ToolMode.CROP_MANUAL
+            or self._crop_active
+        ):
+            return
+        steps = event.angleDelta().y() / 120.0
+        if steps == 0:
+            return
+
+        pos = event.position()
+        anchor = self._map_to_image_coords(pos)
+        zoom = float(np.clip(self._zoom * ZOOM_STEP**steps, 1.0, self._max_zoom()))
+        if zoom <= 1.0:
+            self.reset_zoom()
+            return
+
+        if anchor is not None:
+            # Keep the frame point under the cursor in place
+            fx = (pos.x() - self._display_rect.x()) / self._display_rect.width()
+            fy = (pos.y() - self._display_rect.y()) / self._display_rect.height()
+            self._zoom_center = (
+                anchor[0] + (0.5 - fx) / zoom,
+                anchor[1] + (0.5 - fy) / zoom,
+            )
+        self._zoom = zoom
+        self._emit_viewport()
+        self.update()
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        if self.is_zoomed and self._tool_mode == ToolMode.NONE:
+            self.reset_zoom()
+
     def _draw_widget_ui(self, painter: QPainter) -> None:
         if self._crop_p1 and self._crop_p2:
             rect = (
@@ -145,8 +299,10 @@ class CanvasOverlay(QWidget):
 
         max_screen_dim = max(self._display_rect.width(), self._display_rect.height())
         radius = (
-            conf.manual_dust_size / APP_CONFIG.preview_render_size
-        ) * max_screen_dim
+            (conf.manual_dust_size / APP_CONFIG.preview_render_size)
+            * max_screen_dim
+            * self._zoom
+        )
 
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.setPen(QPen(Qt.GlobalColor.white, 1.0, Qt.PenStyle.SolidLine))
@@ -164,6 +320,10 @@ class CanvasOverlay(QWidget):
         nb_x = (pos.x() - self._display_rect.x()) / self._display_rect.width()
         nb_y = (pos.y() - self._display_rect.y()) / self._display_rect.height()
 
+        if self.is_zoomed:
+            x1, y1, x2, y2 = self.viewport()
+            return x1 + nb_x * (x2 - x1), y1 + nb_y * (y2 - y1)
+
         if self._content_rect and self._current_size:
             bw, bh = self._current_size
             cx, cy, cw, ch = self._content_rect
@@ -176,6 +336,9 @@ class CanvasOverlay(QWidget):
         return float(nb_x), float(nb_y)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
+        if self.is_zoomed and self._tool_mode == ToolMode.NONE:
+            self._pan_anchor = event.position()
+            return
         coords = self._map_to_image_coords(event.position())
         if coords:
             self.clicked.emit(*coords)
@@ -186,7 +349,17 @@ class CanvasOverlay(QWidget):
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         self._mouse_pos = event.position()
-        if self._crop_active:
+        if self._pan_anchor is not None:
+            delta = event.position() - self._pan_anchor
+            self._pan_anchor = event.position()
+            x1, y1, x2, y2 = self.viewport()
+            self._zoom_center = (
+                (x1 + x2) / 2 - delta.x() / self._display_rect.width() / self._zoom,
+                (y1 + y2) / 2 - delta.y() / self._display_rect.height() / self._zoom,
+            )
+            self._emit_viewport()
+            self.update()
+        elif self._crop_active:
             pos = event.position()
             ratio_str = self.state.config.geometry.autocrop_ratio
 
@@ -249,6 +422,7 @@ class CanvasOverlay(QWidget):
             self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self._pan_anchor = None
         if self._crop_active:
             r = (
                 QRectF(self._crop_p1, self._crop_p2)
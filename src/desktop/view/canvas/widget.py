@@ -20,6 +20,8 @@ class ImageCanvas(QWidget):
 
     clicked = pyqtSignal(float, float)
     crop_completed = pyqtSignal(float, float, float, float)
+    viewport_changed = pyqtSignal(float, float, float, float, int, int)
+    viewport_reset = pyqtSignal()
 
     def __init__(self, state: AppState, parent=None):
         super().__init__(parent)
@@ -46,6 +48,8 @@ class ImageCanvas(QWidget):
 
         self.overlay.clicked.connect(self.clicked)
         self.overlay.crop_completed.connect(self.crop_completed)
+        self.overlay.viewport_changed.connect(self.viewport_changed)
+        self.overlay.viewport_reset.connect(self.viewport_reset)
 
     def set_tool_mode(self, mode: ToolMode) -> None:
         self.overlay.set_tool_mode(mode)
@@ -53,8 +57,13 @@ class ImageCanvas(QWidget):
     def clear(self) -> None:
         """Total viewport reset."""
         self.gpu_widget.clear()
+        self.overlay.reset_zoom()
         self.overlay.update_buffer(None, "sRGB", None)
 
+    def update_viewport(self, buffer: Any, viewport: Any, color_space: str) -> None:
+        """Native resolution render of the zoomed region (None leaves zoom)."""
+        self.overlay.set_viewport_image(buffer, color_space, viewport)
+
     def update_buffer(
         self,
         buffer: Any,
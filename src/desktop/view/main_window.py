@@ -1,5 +1,4 @@
 import os
-from src.kernel.system.config import APP_CONFIG
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -94,6 +93,13 @@ class MainWindow(QMainWindow):
         self.controller.loading_started.connect(self.canvas.clear)
         self.canvas.clicked.connect(self.controller.handle_canvas_clicked)
         self.canvas.crop_completed.connect(self.controller.handle_crop_completed)
+        self.canvas.viewport_changed.connect(self.controller.request_viewport)
+        self.canvas.viewport_reset.connect(self.controller.clear_viewport)
+        self.controller.viewport_updated.connect(
+            lambda buf, vp: self.canvas.update_viewport(
+                buf, vp, self.state.workspace_color_space
+            )
+        )
 
         self.controller.export_progress.connect(self._on_export_progress)
         self.controller.export_finished.connect(self._on_export_finished)
@@ -141,7 +147,8 @@ class MainWindow(QMainWindow):
                         export_conf.export_border_size,
                         export_conf.export_print_size,
                         export_conf.export_border_color,
-                        APP_CONFIG.preview_render_size,
+                        # Coarse pyramid frames are smaller than the preview
+                        float(max(buffer.shape[:2])),
                     )
                     buffer = np.array(pil_img).astype(np.float32) / 255.0
                 except Exception as e:
@@ -1,3 +1,4 @@
+import os
 from PyQt6.QtWidgets import (
     QComboBox,
     QPushButton,
@@ -72,7 +73,7 @@ class ExportSidebar(BaseSidebar):
         self.orig_res_btn.setIcon(
             qta.icon("fa5s.compress-arrows-alt", color=THEME.text_primary)
         )
-        self._update_orig_res_style(conf.use_original_res)
+        self._update_toggle_style(self.orig_res_btn, conf.use_original_res)
         self.layout.addWidget(self.orig_res_btn)
 
         self.size_container = QWidget()
@@ -157,6 +158,25 @@ class ExportSidebar(BaseSidebar):
         path_layout.addWidget(self.browse_btn)
         self.layout.addLayout(path_layout)
 
+        self.roll_bounds_btn = QPushButton(" Shared Roll Density")
+        self.roll_bounds_btn.setCheckable(True)
+        self.roll_bounds_btn.setChecked(conf.shared_roll_bounds)
+        self.roll_bounds_btn.setToolTip(
+            "Batch export: measure every frame and normalize the whole roll\n"
+            "with one density range (same emulsion, consistent prints)."
+        )
+        self.roll_bounds_btn.setIcon(qta.icon("fa5s.film", color=THEME.text_primary))
+        self._update_toggle_style(self.roll_bounds_btn, conf.shared_roll_bounds)
+        self.layout.addWidget(self.roll_bounds_btn)
+
+        self.look_export_btn = QPushButton(" Export Look LUT (.cube)")
+        self.look_export_btn.setToolTip(
+            "Save crosstalk, saturation and toning of the current frame\n"
+            "as a 3D LUT for other editors."
+        )
+        self.look_export_btn.setIcon(qta.icon("fa5s.palette", color=THEME.text_primary))
+        self.layout.addWidget(self.look_export_btn)
+
         self.batch_export_btn = QPushButton(" EXPORT ALL LOADED")
         self.batch_export_btn.setFixedHeight(40)
         self.batch_export_btn.setIcon(qta.icon("fa5s.images", color="white"))
@@ -179,6 +199,7 @@ class ExportSidebar(BaseSidebar):
         self.cs_combo.currentTextChanged.connect(lambda _: self.update_timer.start())
         self.ratio_combo.currentTextChanged.connect(lambda _: self.update_timer.start())
         self.orig_res_btn.toggled.connect(self._on_orig_res_toggled)
+        self.roll_bounds_btn.toggled.connect(self._on_roll_bounds_toggled)
 
         self.size_input.valueChanged.connect(lambda _: self.update_timer.start())
         self.dpi_input.valueChanged.connect(lambda _: self.update_timer.start())
@@ -188,6 +209,7 @@ class ExportSidebar(BaseSidebar):
         self.browse_btn.clicked.connect(self._on_browse_clicked)
         self.pattern_input.textChanged.connect(lambda _: self.update_timer.start())
         self.path_input.textChanged.connect(lambda _: self.update_timer.start())
+        self.look_export_btn.clicked.connect(self._on_look_export_clicked)
         self.batch_export_btn.clicked.connect(self.controller.request_batch_export)
 
     def _persist_all_export_settings(self) -> None:
@@ -205,13 +227,18 @@ class ExportSidebar(BaseSidebar):
             export_border_size=self.border_input.value(),
             filename_pattern=self.pattern_input.text(),
             export_path=self.path_input.text(),
+            shared_roll_bounds=self.roll_bounds_btn.isChecked(),
         )
 
     def _on_orig_res_toggled(self, checked: bool) -> None:
-        self._update_orig_res_style(checked)
+        self._update_toggle_style(self.orig_res_btn, checked)
         self.size_container.setVisible(not checked)
         self.update_timer.start()
 
+    def _on_roll_bounds_toggled(self, checked: bool) -> None:
+        self._update_toggle_style(self.roll_bounds_btn, checked)
+        self.update_timer.start()
+
     def _on_color_clicked(self) -> None:
         color = QColorDialog.getColor(
             QColor(self.state.config.export.export_border_color)
@@ -229,13 +256,13 @@ class ExportSidebar(BaseSidebar):
                 "export", persist=True, render=False, export_border_color=hex_color
             )
 
-    def _update_orig_res_style(self, checked: bool) -> None:
+    def _update_toggle_style(self, button: QPushButton, checked: bool) -> None:
         if checked:
-            self.orig_res_btn.setStyleSheet(
+            button.setStyleSheet(
                 f"background-color: {THEME.accent_primary}; color: white; font-weight: bold;"
             )
         else:
-            self.orig_res_btn.setStyleSheet("")
+            button.setStyleSheet("")
 
     def _on_browse_clicked(self) -> None:
         from PyQt6.QtWidgets import QFileDialog
@@ -246,6 +273,18 @@ class ExportSidebar(BaseSidebar):
         if path:
             self.path_input.setText(path)
 
+    def _on_look_export_clicked(self) -> None:
+        from PyQt6.QtWidgets import QFileDialog
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Look LUT",
+            os.path.join(self.state.config.export.export_path, "look.cube"),
+            "Cube LUT (*.cube)",
+        )
+        if path:
+            self.controller.request_look_export(path)
+
     def _update_color_btn(self, hex_color: str) -> None:
         self.color_btn.setStyleSheet(
             f"background-color: {hex_color}; border: 1px solid #555;"
@@ -259,8 +298,10 @@ class ExportSidebar(BaseSidebar):
             self.cs_combo.setCurrentText(conf.export_color_space)
             self.ratio_combo.setCurrentText(conf.paper_aspect_ratio)
             self.orig_res_btn.setChecked(conf.use_original_res)
-            self._update_orig_res_style(conf.use_original_res)
+            self._update_toggle_style(self.orig_res_btn, conf.use_original_res)
             self.size_container.setVisible(not conf.use_original_res)
+            self.roll_bounds_btn.setChecked(conf.shared_roll_bounds)
+            self._update_toggle_style(self.roll_bounds_btn, conf.shared_roll_bounds)
             self.size_input.setValue(conf.export_print_size)
             self.dpi_input.setValue(conf.export_dpi)
             self.border_input.setValue(conf.export_border_size)
@@ -276,6 +317,7 @@ class ExportSidebar(BaseSidebar):
             self.cs_combo,
             self.ratio_combo,
             self.orig_res_btn,
+            self.roll_bounds_btn,
             self.size_input,
             self.dpi_input,
             self.border_input,
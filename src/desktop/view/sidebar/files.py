@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -7,6 +8,8 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
     QGroupBox,
+    QComboBox,
+    QLineEdit,
 )
 from PyQt6.QtCore import pyqtSignal, QSize, QTimer
 
@@ -14,7 +17,6 @@ import qtawesome as qta
 from src.desktop.controller import AppController
 from src.desktop.view.styles.theme import THEME
 from src.infrastructure.filesystem.watcher import FolderWatchService
-from src.infrastructure.loaders.constants import SUPPORTED_RAW_EXTENSIONS
 from src.infrastructure.loaders.helpers import get_supported_raw_wildcards
 
 
@@ -25,10 +27,21 @@ class FileBrowser(QWidget):
 
     file_selected = pyqtSignal(str)
 
+    # Combo label -> DesktopSessionManager.sort_files key (None: as added)
+    SORT_OPTIONS = {
+        "Added": None,
+        "Name": "name",
+        "Date": "mtime",
+        "Size": "size",
+        "Resolution": "pixels",
+    }
+
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
         self.session = controller.session
+        # Folder of the latest add; the list itself may be re-sorted
+        self._watch_folder: Optional[str] = None
 
         self.scan_timer = QTimer(self)
         self.scan_timer.setInterval(2000)  # Check every 2 seconds
@@ -73,6 +86,25 @@ class FileBrowser(QWidget):
 
         layout.addWidget(action_group)
 
+        view_row = QHBoxLayout()
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter name or sensor...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems(list(self.SORT_OPTIONS))
+        self.sort_combo.setToolTip("Sort by indexed file facts")
+        self.sort_desc_btn = QPushButton()
+        self.sort_desc_btn.setCheckable(True)
+        self.sort_desc_btn.setFixedWidth(30)
+        self.sort_desc_btn.setToolTip("Descending")
+        self.sort_desc_btn.setIcon(
+            qta.icon("fa5s.sort-amount-down", color=THEME.text_primary)
+        )
+        view_row.addWidget(self.filter_input)
+        view_row.addWidget(self.sort_combo)
+        view_row.addWidget(self.sort_desc_btn)
+        layout.addLayout(view_row)
+
         self.list_view = QListView()
         self.list_view.setModel(self.session.asset_model)
         self.list_view.setViewMode(QListView.ViewMode.IconMode)
@@ -95,6 +127,26 @@ class FileBrowser(QWidget):
         self.unload_btn.clicked.connect(self.session.clear_files)
         self.list_view.clicked.connect(self._on_item_clicked)
         self.hot_folder_btn.toggled.connect(self._on_hot_folder_toggled)
+        self.sort_combo.currentTextChanged.connect(lambda _: self._apply_sort())
+        self.sort_desc_btn.toggled.connect(lambda _: self._apply_sort())
+        self.filter_input.textChanged.connect(lambda _: self._apply_filter())
+        # Rows added or reordered by indexing must honour the filter
+        self.session.asset_model.layoutChanged.connect(self._apply_filter)
+
+    def _apply_sort(self) -> None:
+        key = self.SORT_OPTIONS[self.sort_combo.currentText()]
+        if key is None:
+            # Keep the current order for files added from now on
+            self.session.state.file_sort = None
+            return
+        self.session.sort_files(key, self.sort_desc_btn.isChecked())
+
+    def _apply_filter(self) -> None:
+        text = self.filter_input.text()
+        for row, info in enumerate(self.session.state.uploaded_files):
+            self.list_view.setRowHidden(
+                row, not self.session.matches_filter(info, text)
+            )
 
     def _on_hot_folder_toggled(self, checked: bool) -> None:
         self._update_hot_folder_style(checked)
@@ -118,14 +170,14 @@ class FileBrowser(QWidget):
             return
 
         # Watch directory of the most recently added file
-        last_file = self.session.state.uploaded_files[-1]
-        folder_path = os.path.dirname(last_file["path"])
+        folder_path = self._watch_folder or os.path.dirname(
+            self.session.state.uploaded_files[-1]["path"]
+        )
         existing = {f["path"] for f in self.session.state.uploaded_files}
 
         new_files = FolderWatchService.scan_for_new_files(folder_path, existing)
         if new_files:
-            self.session.add_files(new_files)
-            self.controller.generate_missing_thumbnails()
+            self.controller.add_files(sorted(new_files))
 
     def _on_add_files(self) -> None:
         wildcards = get_supported_raw_wildcards()
@@ -136,21 +188,17 @@ class FileBrowser(QWidget):
             f"Supported Images ({wildcards})",
         )
         if files:
-            self.session.add_files(files)
-            self.controller.generate_missing_thumbnails()
+            self._watch_folder = os.path.dirname(files[-1])
+            self.controller.add_files(files)
 
     def _on_add_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
-            valid_exts = tuple(SUPPORTED_RAW_EXTENSIONS)
-            paths = []
-            for f in os.listdir(folder):
-                if f.lower().endswith(valid_exts):
-                    paths.append(os.path.join(folder, f))
-
+            self._watch_folder = folder
+            existing = {f["path"] for f in self.session.state.uploaded_files}
+            paths = FolderWatchService.scan_for_new_files(folder, existing)
             if paths:
-                self.session.add_files(paths)
-                self.controller.generate_missing_thumbnails()
+                self.controller.add_files(sorted(paths))
 
     def _on_item_clicked(self, index) -> None:
         self.session.select_file(index.row())
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, List, Optional
 import os
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from src.domain.models import WorkspaceConfig, ExportConfig, ExportFormat
+from src.features.exposure.processor import seed_log_bounds
+from src.infrastructure.storage.array_cache import ArrayDiskCache
+from src.services.rendering.analysis_cache import AnalysisCache
 from src.services.rendering.image_processor import ImageProcessor
+from src.services.rendering.roll_analysis import FrameAnalysisTask, analyze_roll
 from src.services.export.templating import render_export_filename
 
 
@@ -27,25 +31,43 @@ class ExportWorker(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        analysis_cache: Optional[AnalysisCache] = None,
+        decode_cache: Optional[ArrayDiskCache] = None,
+    ) -> None:
         super().__init__()
-        self._processor = ImageProcessor()
+        self._processor = ImageProcessor(analysis_cache, decode_cache)
 
     @pyqtSlot(list)
     def run_batch(self, tasks: List[ExportTask]) -> None:
         """Processes an ordered list of export tasks."""
         total = len(tasks)
         try:
+            roll = None
+            if total > 1 and tasks[0].export_settings.shared_roll_bounds:
+                self.progress.emit(0, total, "Analyzing roll")
+                roll = analyze_roll(
+                    [FrameAnalysisTask(t.file_info["path"], t.params) for t in tasks]
+                )
+
             for i, task in enumerate(tasks):
                 full_name = task.file_info["name"]
                 name = os.path.splitext(full_name)[0]
                 self.progress.emit(i + 1, total, name)
 
+                metrics: Dict[str, Any] = {}
+                if roll is not None:
+                    seed_log_bounds(
+                        metrics, roll.bounds, task.params.exposure.analysis_buffer
+                    )
+
                 bits, _ = self._processor.process_export(
                     task.file_info["path"],
                     task.params,
                     task.export_settings,
                     task.file_info["hash"],
+                    metrics=metrics,
                     prefer_gpu=task.gpu_enabled,
                 )
 
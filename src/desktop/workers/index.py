@@ -0,0 +1,28 @@
+from typing import List
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from src.services.assets.indexer import LibraryIndexer
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class IndexWorker(QObject):
+    """
+    Background library indexer (hashing + header probes off the UI thread).
+    """
+
+    progress = pyqtSignal(int, int)  # done, total (files needing a probe)
+    finished = pyqtSignal(list)  # List[FileRecord]
+
+    def __init__(self, indexer: LibraryIndexer) -> None:
+        super().__init__()
+        self._indexer = indexer
+
+    @pyqtSlot(list)
+    def index(self, paths: List[str]) -> None:
+        try:
+            records = self._indexer.index(paths, progress=self.progress.emit)
+        except Exception as e:
+            logger.error(f"Indexing failure: {e}")
+            records = []
+        self.finished.emit(records)
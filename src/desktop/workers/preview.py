@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Optional
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from src.services.rendering.preview_manager import PreviewManager
+from src.services.rendering.scheduler import CancellationToken
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PreviewTask:
+    """Full quality preview decode for a file shown as a draft."""
+
+    file_path: str
+    file_hash: Optional[str]
+    color_space: str
+    use_camera_wb: bool = False
+    cancel_token: Optional[CancellationToken] = None
+
+
+class PreviewWorker(QObject):
+    """
+    Background preview decoder.
+    Replaces half-size drafts with the demosaiced preview.
+    """
+
+    finished = pyqtSignal(object, object)  # (PreviewTask, (buffer, dims, meta))
+
+    def __init__(self, preview_service: PreviewManager) -> None:
+        super().__init__()
+        self._service = preview_service
+
+    @pyqtSlot(PreviewTask)
+    def refine(self, task: PreviewTask) -> None:
+        """Decodes (and disk-caches) the full quality preview."""
+        # Skip files the user has already moved past
+        if task.cancel_token is not None and task.cancel_token.cancelled:
+            return
+        try:
+            result = self._service.load_preview(
+                task.file_path,
+                task.file_hash,
+                task.color_space,
+                use_camera_wb=task.use_camera_wb,
+            )
+            self.finished.emit(task, result)
+        except Exception as e:
+            logger.error(f"Preview refine failure: {e}")
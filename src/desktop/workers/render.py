@@ -1,9 +1,13 @@
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from src.domain.models import WorkspaceConfig
+from src.services.rendering.analysis_cache import AnalysisCache
 from src.services.rendering.image_processor import ImageProcessor
+from src.services.rendering.scheduler import CancellationToken, RenderCancelled
+from src.services.rendering.viewport import Viewport
 from src.kernel.system.logging import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +26,24 @@ class RenderTask:
     color_space: str = "Adobe RGB"
     gpu_enabled: bool = True
     readback_metrics: bool = True
+    pyramid_level: int = -1
+    cancel_token: Optional[CancellationToken] = None
+    # Grain seed source; source_hash may carry a draft suffix
+    file_hash: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ViewportTask:
+    """Native resolution render of the visible part of the frame."""
+
+    file_path: str
+    config: WorkspaceConfig
+    source_hash: str
+    viewport: Viewport
+    out_size: Tuple[int, int]
+    color_space: str = "Adobe RGB"
+    preview_metrics: Optional[Dict[str, Any]] = None
+    cancel_token: Optional[CancellationToken] = None
 
 
 @dataclass(frozen=True)
@@ -41,18 +63,22 @@ class RenderWorker(QObject):
 
     finished = pyqtSignal(object, dict)  # (ndarray|GPUTexture, metrics)
     metrics_updated = pyqtSignal(dict)  # Late-arriving metrics (histogram, etc.)
+    cancelled = pyqtSignal()  # Superseded before completion, no frame emitted
+    viewport_finished = pyqtSignal(object, object)  # (ndarray, viewport)
+    viewport_cancelled = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self) -> None:
+    def __init__(self, analysis_cache: Optional[AnalysisCache] = None) -> None:
         super().__init__()
-        self._processor = ImageProcessor()
+        self._processor = ImageProcessor(analysis_cache)
 
     @property
     def processor(self) -> ImageProcessor:
         return self._processor
 
+    @pyqtSlot()
     def cleanup(self) -> None:
-        """Evacuates transient GPU resources."""
+        """Evacuates transient GPU resources and the viewport source."""
         self._processor.cleanup()
 
     def destroy_all(self) -> None:
@@ -63,6 +89,7 @@ class RenderWorker(QObject):
     def process(self, task: RenderTask) -> None:
         """Executes the rendering pipeline for a single frame."""
         try:
+            start = time.perf_counter()
             img_src = task.buffer.copy()
 
             result, metrics = self._processor.run_pipeline(
@@ -72,6 +99,9 @@ class RenderWorker(QObject):
                 render_size_ref=task.preview_size,
                 prefer_gpu=task.gpu_enabled,
                 readback_metrics=task.readback_metrics,
+                cancel_token=task.cancel_token,
+                color_space=task.color_space,
+                file_hash=task.file_hash,
             )
 
             from src.infrastructure.gpu.resources import GPUTexture
@@ -92,15 +122,44 @@ class RenderWorker(QObject):
                     65535.0 if arr.dtype == np.uint16 else 255.0
                 )
 
+            # Drop frames superseded while the GPU pass was in flight
+            if task.cancel_token is not None:
+                task.cancel_token.raise_if_cancelled()
+
             # Ensure ground truth is stored in metrics for view consumption
             metrics["base_positive"] = result
+            metrics["pyramid_level"] = task.pyramid_level
+            metrics["render_seconds"] = time.perf_counter() - start
 
             self.finished.emit(result, metrics)
             self.metrics_updated.emit(metrics)
 
+        except RenderCancelled:
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(str(e))
 
+    @pyqtSlot(ViewportTask)
+    def render_viewport(self, task: ViewportTask) -> None:
+        """Renders the zoomed viewport from the full resolution source."""
+        try:
+            result = self._processor.render_viewport(
+                task.file_path,
+                task.config,
+                task.source_hash,
+                task.viewport,
+                color_space=task.color_space,
+                metrics=task.preview_metrics,
+                out_size=task.out_size,
+                cancel_token=task.cancel_token,
+            )
+            self.viewport_finished.emit(result, task.viewport)
+        except RenderCancelled:
+            self.viewport_cancelled.emit()
+        except Exception as e:
+            logger.error(f"Viewport render failure: {e}")
+            self.viewport_cancelled.emit()
+
 
 class ThumbnailWorker(QObject):
     """Asynchronous thumbnail generation worker."""
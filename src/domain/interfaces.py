@@ -22,6 +22,13 @@ class PipelineContext:
     process_mode: str = "C41"
     active_roi: Optional[ROI] = None
     metrics: dict[str, Any] = field(default_factory=dict)
+    # Tiled runs: window (y1, y2, x1, x2) of the geometry-space frame being processed
+    tile_rect: Optional[ROI] = None
+    frame_size: Optional[Dimensions] = None
+    # Cache key of the current stage's input; None when it is not cacheable
+    upstream_hash: Optional[str] = None
+    # Per-file grain seed (kernel.image.noise)
+    noise_seed: int = 0
 
 
 class IImageSource(Protocol):
@@ -41,6 +48,14 @@ class IRepository(Protocol):
 
     def load_file_settings(self, file_hash: str) -> Optional[WorkspaceConfig]: ...
 
+    def save_analysis(
+        self, file_hash: str, kind: str, params_key: str, data: bytes
+    ) -> None: ...
+
+    def load_analysis(
+        self, file_hash: str, kind: str, params_key: str
+    ) -> Optional[bytes]: ...
+
     def save_global_setting(self, key: str, value: Any) -> None: ...
     def get_global_setting(self, key: str, default: Any = None) -> Any: ...
     def initialize(self) -> None: ...
@@ -67,10 +82,13 @@ class IAssetStore(Protocol):
 class IImageLoader(Protocol):
     """
     Loads specific image formats. Returns (context, metadata).
+    probe() reads header facts only (width, height, sensor, has_thumbnail).
     """
 
     def load(self, file_path: str) -> Tuple[ContextManager[Any], dict]: ...
 
+    def probe(self, file_path: str) -> dict: ...
+
 
 class IFilePicker(Protocol):
     """
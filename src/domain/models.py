@@ -72,6 +72,8 @@ class ExportConfig:
     apply_icc: bool = False
     icc_profile_path: Optional[str] = None
     icc_invert: bool = False
+    # Batch exports normalize every frame with one roll-wide density range
+    shared_roll_bounds: bool = False
 
 
 @dataclass(frozen=True)
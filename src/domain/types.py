@@ -36,3 +36,15 @@ class AppConfig:
     default_export_dir: str
     adobe_rgb_profile: str
     use_gpu: bool = True
+    pipeline_cache_bytes: int = 1024 * 1024 * 1024
+    export_memory_bytes: int = 2 * 1024 * 1024 * 1024
+    viewport_cache_bytes: int = 256 * 1024 * 1024
+    preview_disk_cache_bytes: int = 2 * 1024 * 1024 * 1024
+    # Show a half-size RAW decode first, swap in the full demosaic when ready
+    draft_previews: bool = True
+    # Neighbouring previews decoded ahead while browsing
+    prefetch_ahead: int = 2
+    prefetch_behind: int = 1
+    prefetch_cache_bytes: int = 512 * 1024 * 1024
+    # Demosaiced full resolution RAWs reused by repeat exports (0 disables)
+    decode_disk_cache_bytes: int = 8 * 1024 * 1024 * 1024
@@ -0,0 +1,341 @@
+from typing import Optional, Tuple
+import numpy as np
+from numba import njit, prange  # type: ignore
+from src.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
+from src.features.exposure.logic import _characteristic_pixel, get_curve_params
+from src.features.exposure.lut import CurveLUT, _lut_lookup, get_curve_lut
+from src.features.exposure.models import ExposureConfig
+from src.features.exposure.normalization import LogNegativeBounds, _normalize_pixel
+from src.features.toning.logic import (
+    SELENIUM_COLOR,
+    SEPIA_COLOR,
+    _paper_pixel,
+    _tone_pixel,
+    _toning_weights,
+    get_paper_profile,
+)
+from src.kernel.image.validation import ensure_image
+
+
+@njit(inline="always")
+def _positive_value(
+    val: float,
+    do_normalize: bool,
+    floor: float,
+    ceil: float,
+    do_curve: bool,
+    pivot: float,
+    slope: float,
+    toe: float,
+    toe_width: float,
+    toe_hardness: float,
+    shoulder: float,
+    shoulder_width: float,
+    shoulder_hardness: float,
+    cmy_offset: float,
+    inv_gamma: float,
+    use_lut: bool,
+    lut: np.ndarray,
+    ch: int,
+) -> float:
+    if do_normalize:
+        val = np.log10(np.float32(min(max(val, 1e-6), 1.0)))
+        val = _normalize_pixel(val, floor, ceil)
+    if use_lut:
+        val = _lut_lookup(lut, ch, val)
+    elif do_curve:
+        val = _characteristic_pixel(
+            val + cmy_offset,
+            pivot,
+            slope,
+            toe,
+            toe_width,
+            toe_hardness,
+            shoulder,
+            shoulder_width,
+            shoulder_hardness,
+            4.0,
+            inv_gamma,
+        )
+    return val
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_pointwise_chain_jit(
+    img: np.ndarray,
+    do_normalize: bool,
+    floors: np.ndarray,
+    ceils: np.ndarray,
+    do_curve: bool,
+    pivots: np.ndarray,
+    slopes: np.ndarray,
+    toe: float,
+    toe_width: float,
+    toe_hardness: float,
+    shoulder: float,
+    shoulder_width: float,
+    shoulder_hardness: float,
+    cmy_offsets: np.ndarray,
+    use_lut: bool,
+    lut: np.ndarray,
+    to_luma: bool,
+    do_paper: bool,
+    tint: np.ndarray,
+    dmax_boost: float,
+    do_toning: bool,
+    sel_strength: float,
+    sep_strength: float,
+) -> np.ndarray:
+    """
+    Linear -> log -> normalized -> H&D -> paper -> toning, one read & write per pixel.
+    """
+    h, w, c = img.shape
+    res = np.empty_like(img)
+    inv_gamma = 1.0 / 2.2
+
+    for y in prange(h):
+        for x in range(w):
+            r = _positive_value(
+                img[y, x, 0],
+                do_normalize,
+                floors[0],
+                ceils[0],
+                do_curve,
+                pivots[0],
+                slopes[0],
+                toe,
+                toe_width,
+                toe_hardness,
+                shoulder,
+                shoulder_width,
+                shoulder_hardness,
+                cmy_offsets[0],
+                inv_gamma,
+                use_lut,
+                lut,
+                0,
+            )
+            g = _positive_value(
+                img[y, x, 1],
+                do_normalize,
+                floors[1],
+                ceils[1],
+                do_curve,
+                pivots[1],
+                slopes[1],
+                toe,
+                toe_width,
+                toe_hardness,
+                shoulder,
+                shoulder_width,
+                shoulder_hardness,
+                cmy_offsets[1],
+                inv_gamma,
+                use_lut,
+                lut,
+                1,
+            )
+            b = _positive_value(
+                img[y, x, 2],
+                do_normalize,
+                floors[2],
+                ceils[2],
+                do_curve,
+                pivots[2],
+                slopes[2],
+                toe,
+                toe_width,
+                toe_hardness,
+                shoulder,
+                shoulder_width,
+                shoulder_hardness,
+                cmy_offsets[2],
+                inv_gamma,
+                use_lut,
+                lut,
+                2,
+            )
+
+            if to_luma:
+                lum = LUMA_R * r + LUMA_G * g + LUMA_B * b
+                r, g, b = lum, lum, lum
+
+            if do_paper:
+                r = _paper_pixel(r, tint[0], dmax_boost)
+                g = _paper_pixel(g, tint[1], dmax_boost)
+                b = _paper_pixel(b, tint[2], dmax_boost)
+
+            if do_toning:
+                lum_val = LUMA_R * r + LUMA_G * g + LUMA_B * b
+                sel_m, sep_m = _toning_weights(lum_val, sel_strength, sep_strength)
+                r = _tone_pixel(r, sel_m, sep_m, SELENIUM_COLOR[0], SEPIA_COLOR[0])
+                g = _tone_pixel(g, sel_m, sep_m, SELENIUM_COLOR[1], SEPIA_COLOR[1])
+                b = _tone_pixel(b, sel_m, sep_m, SELENIUM_COLOR[2], SEPIA_COLOR[2])
+
+            res[y, x, 0] = r
+            res[y, x, 1] = g
+            res[y, x, 2] = b
+    return res
+
+
+_NO_LUT = np.zeros((3, 2), dtype=np.float32)
+
+_SEGMENT_FIELDS = {
+    "normalize": ("_normalize", "_floors", "_ceils"),
+    "curve": ("_curve", "_pivots", "_slopes", "_shape", "_cmy", "_lut", "_to_luma"),
+    "paper": ("_paper", "_tint", "_dmax_boost"),
+    "toning": ("_toning", "_selenium", "_sepia"),
+}
+
+
+class PointwiseChain:
+    """
+    Composes the per-pixel stages into a single pass. Segments always run in
+    pipeline order (normalize, curve, paper, toning); omitted ones are skipped.
+    The separate stage kernels remain the reference implementation.
+    """
+
+    def __init__(self) -> None:
+        self._normalize = False
+        self._floors = np.zeros(3, dtype=np.float32)
+        self._ceils = np.ones(3, dtype=np.float32)
+
+        self._curve = False
+        self._pivots = np.zeros(3, dtype=np.float32)
+        self._slopes = np.ones(3, dtype=np.float32)
+        self._shape: Tuple[float, float, float, float, float, float] = (
+            0.0,
+            3.0,
+            1.0,
+            0.0,
+            3.0,
+            1.0,
+        )
+        self._cmy = np.zeros(3, dtype=np.float32)
+        self._lut: Optional[CurveLUT] = None
+        self._to_luma = False
+
+        self._paper = False
+        self._tint = np.ones(3, dtype=np.float32)
+        self._dmax_boost = 1.0
+
+        self._toning = False
+        self._selenium = 0.0
+        self._sepia = 0.0
+
+    @property
+    def segments(self) -> Tuple[bool, bool, bool, bool]:
+        return (
+            self._normalize,
+            self._curve or self._to_luma,
+            self._paper,
+            self._toning,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(self.segments)
+
+    def then(self, other: "PointwiseChain") -> "PointwiseChain":
+        """
+        Fuses a downstream chain into this one.
+        """
+        own = [i for i, on in enumerate(self.segments) if on]
+        theirs = [i for i, on in enumerate(other.segments) if on]
+        if own and theirs and min(theirs) <= max(own):
+            raise ValueError("Pointwise chains can only be fused in pipeline order")
+
+        merged = PointwiseChain()
+        merged.__dict__.update(self.__dict__)
+        for i, name in enumerate(("normalize", "curve", "paper", "toning")):
+            if other.segments[i]:
+                for key, value in other.__dict__.items():
+                    if key in _SEGMENT_FIELDS[name]:
+                        setattr(merged, key, value)
+        return merged
+
+    def normalize(self, bounds: LogNegativeBounds) -> "PointwiseChain":
+        """
+        Linear input -> log10 -> 0-1 stretch between bounds.
+        """
+        self._normalize = True
+        self._floors = np.array(bounds.floors, dtype=np.float32)
+        self._ceils = np.array(bounds.ceils, dtype=np.float32)
+        return self
+
+    def curve(
+        self, config: ExposureConfig, to_luma: bool = False, use_lut: bool = True
+    ) -> "PointwiseChain":
+        """
+        H&D curve; to_luma collapses the print to Rec. 709 luminance (B&W).
+        After normalize() the baked LUT replaces the analytic curve.
+        """
+        pivot, slope, cmy_offsets = get_curve_params(config)
+        self._lut = get_curve_lut(config) if use_lut else None
+        self._curve = True
+        self._pivots = np.full(3, pivot, dtype=np.float32)
+        self._slopes = np.full(3, slope, dtype=np.float32)
+        self._shape = (
+            float(config.toe),
+            float(config.toe_width),
+            float(config.toe_hardness),
+            float(config.shoulder),
+            float(config.shoulder_width),
+            float(config.shoulder_hardness),
+        )
+        self._cmy = np.array(cmy_offsets, dtype=np.float32)
+        self._to_luma = to_luma
+        return self
+
+    def paper(self, profile_name: str) -> "PointwiseChain":
+        profile = get_paper_profile(profile_name)
+        self._paper = True
+        self._tint = np.array(profile.tint, dtype=np.float32)
+        self._dmax_boost = float(profile.dmax_boost)
+        return self
+
+    def toning(
+        self, selenium_strength: float, sepia_strength: float
+    ) -> "PointwiseChain":
+        if selenium_strength == 0 and sepia_strength == 0:
+            return self
+        self._toning = True
+        self._selenium = float(selenium_strength)
+        self._sepia = float(sepia_strength)
+        return self
+
+    def apply(self, img: ImageBuffer) -> ImageBuffer:
+        if self.is_empty:
+            return img
+
+        toe, toe_w, toe_h, shoulder, shoulder_w, shoulder_h = self._shape
+        # Normalized input is clamped to [0, 1], the LUT's domain
+        use_lut = self._lut is not None and self._normalize
+        lut = self._lut.table if self._lut is not None else _NO_LUT
+        return ensure_image(
+            _apply_pointwise_chain_jit(
+                np.ascontiguousarray(img, dtype=np.float32),
+                self._normalize,
+                self._floors,
+                self._ceils,
+                self._curve,
+                self._pivots,
+                self._slopes,
+                toe,
+                toe_w,
+                toe_h,
+                shoulder,
+                shoulder_w,
+                shoulder_h,
+                self._cmy,
+                use_lut,
+                lut,
+                self._to_luma,
+                self._paper,
+                self._tint,
+                self._dmax_boost,
+                self._toning,
+                self._selenium,
+                self._sepia,
+            )
+        )
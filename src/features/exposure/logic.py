@@ -3,6 +3,7 @@ from numba import njit, prange  # type: ignore
 from typing import Tuple, Any
 from src.domain.types import ImageBuffer
 from src.kernel.image.validation import ensure_image
+from src.features.exposure.models import ExposureConfig, EXPOSURE_CONSTANTS
 
 
 def _expit(x: Any) -> Any:
@@ -24,6 +25,54 @@ def _fast_sigmoid(x: float) -> float:
         return float(z / (1.0 + z))
 
 
+@njit(inline="always")
+def _characteristic_pixel(
+    val: float,
+    pivot: float,
+    slope: float,
+    toe: float,
+    toe_width: float,
+    toe_hardness: float,
+    shoulder: float,
+    shoulder_width: float,
+    shoulder_hardness: float,
+    d_max: float,
+    inv_gamma: float,
+) -> float:
+    """
+    Single-value H&D curve: log-exposure -> display transmittance.
+    """
+    diff = val - pivot
+    epsilon = 1e-6
+
+    sw_val = shoulder_width * (diff / max(pivot, epsilon))
+    w_s = _fast_sigmoid(sw_val)
+    prot_s = (4.0 * ((w_s - 0.5) ** 2)) ** shoulder_hardness
+    damp_shoulder = shoulder * (1.0 - w_s) * prot_s
+
+    tw_val = toe_width * (diff / max(1.0 - pivot, epsilon))
+    w_t = _fast_sigmoid(tw_val)
+    prot_t = (4.0 * ((w_t - 0.5) ** 2)) ** toe_hardness
+    damp_toe = toe * w_t * prot_t
+
+    k_mod = 1.0 - damp_toe - damp_shoulder
+    if k_mod < 0.1:
+        k_mod = 0.1
+    elif k_mod > 2.0:
+        k_mod = 2.0
+
+    density = d_max * _fast_sigmoid(slope * diff * k_mod)
+
+    transmittance = 10.0 ** (-density)
+    final_val = transmittance**inv_gamma
+
+    if final_val < 0.0:
+        final_val = 0.0
+    elif final_val > 1.0:
+        final_val = 1.0
+    return float(final_val)
+
+
 @njit(parallel=True, cache=True, fastmath=True)
 def _apply_photometric_fused_kernel(
     img: np.ndarray,
@@ -50,37 +99,19 @@ def _apply_photometric_fused_kernel(
     for y in prange(h):
         for x in range(w):
             for ch in range(3):
-                val = img[y, x, ch] + cmy_offsets[ch]
-                diff = val - pivots[ch]
-                epsilon = 1e-6
-
-                sw_val = shoulder_width * (diff / max(float(pivots[ch]), epsilon))
-                w_s = _fast_sigmoid(sw_val)
-                prot_s = (4.0 * ((w_s - 0.5) ** 2)) ** shoulder_hardness
-                damp_shoulder = shoulder * (1.0 - w_s) * prot_s
-
-                tw_val = toe_width * (diff / max(1.0 - float(pivots[ch]), epsilon))
-                w_t = _fast_sigmoid(tw_val)
-                prot_t = (4.0 * ((w_t - 0.5) ** 2)) ** toe_hardness
-                damp_toe = toe * w_t * prot_t
-
-                k_mod = 1.0 - damp_toe - damp_shoulder
-                if k_mod < 0.1:
-                    k_mod = 0.1
-                elif k_mod > 2.0:
-                    k_mod = 2.0
-
-                density = d_max * _fast_sigmoid(float(slopes[ch]) * diff * k_mod)
-
-                transmittance = 10.0 ** (-density)
-                final_val = transmittance**inv_gamma
-
-                if final_val < 0.0:
-                    final_val = 0.0
-                elif final_val > 1.0:
-                    final_val = 1.0
-
-                res[y, x, ch] = final_val
+                res[y, x, ch] = _characteristic_pixel(
+                    img[y, x, ch] + cmy_offsets[ch],
+                    float(pivots[ch]),
+                    float(slopes[ch]),
+                    toe,
+                    toe_width,
+                    toe_hardness,
+                    shoulder,
+                    shoulder_width,
+                    shoulder_hardness,
+                    d_max,
+                    inv_gamma,
+                )
     return res
 
 
@@ -172,6 +203,25 @@ def apply_characteristic_curve(
     return ensure_image(res)
 
 
+def get_curve_params(
+    config: ExposureConfig,
+) -> Tuple[float, float, Tuple[float, float, float]]:
+    """
+    ExposureConfig -> (pivot, slope, cmy_offsets) shared by all channels.
+    """
+    master_ref = 1.0
+    exposure_shift = 0.1 + (config.density * EXPOSURE_CONSTANTS["density_multiplier"])
+    slope = 1.0 + (config.grade * EXPOSURE_CONSTANTS["grade_multiplier"])
+
+    cmy_max = EXPOSURE_CONSTANTS["cmy_max_density"]
+    cmy_offsets = (
+        config.wb_cyan * cmy_max,
+        config.wb_magenta * cmy_max,
+        config.wb_yellow * cmy_max,
+    )
+    return master_ref - exposure_shift, slope, cmy_offsets
+
+
 def cmy_to_density(val: float, log_range: float = 1.0) -> float:
     """
     Converts a CMY slider value (-1.0..1.0) to a physical density shift (D).
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+import numpy as np
+from numba import njit, prange  # type: ignore
+from src.domain.types import ImageBuffer
+from src.features.exposure.logic import (
+    _apply_photometric_fused_kernel,
+    get_curve_params,
+)
+from src.features.exposure.models import ExposureConfig
+from src.kernel.caching.logic import calculate_config_hash
+from src.kernel.caching.manager import KeyedLRU
+from src.kernel.image.validation import ensure_image
+
+CURVE_LUT_SIZE = 16384
+CURVE_LUT_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class CurveLUT:
+    """
+    H&D curve per channel, sampled over normalized log-exposure [0, 1]
+    with the CMY offsets baked in.
+
+    max_error bounds |lut(x) - curve(x)| under linear interpolation:
+    h^2 / 8 * max|f''| (f'' from second differences of the table, h = 1 / (size - 1)),
+    or the measured midpoint error if larger. At 16k entries this is ~1e-7 for
+    default settings and stays below 1e-5 at the slider extremes.
+    """
+
+    table: np.ndarray
+    max_error: float
+
+    @property
+    def size(self) -> int:
+        return int(self.table.shape[1])
+
+
+@njit(inline="always")
+def _lut_lookup(table: np.ndarray, ch: int, val: float) -> float:
+    """
+    Linear interpolation into table[ch] for val in [0, 1].
+    """
+    last = table.shape[1] - 1
+    pos = val * last
+    if pos <= 0.0:
+        return float(table[ch, 0])
+    idx = int(pos)
+    if idx >= last:
+        return float(table[ch, last])
+    frac = pos - idx
+    return float(table[ch, idx] + (table[ch, idx + 1] - table[ch, idx]) * frac)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_curve_lut_jit(img: np.ndarray, table: np.ndarray) -> np.ndarray:
+    h, w, c = img.shape
+    res = np.empty_like(img)
+    for y in prange(h):
+        for x in range(w):
+            for ch in range(3):
+                res[y, x, ch] = _lut_lookup(table, ch, img[y, x, ch])
+    return res
+
+
+def _evaluate_curve(config: ExposureConfig, samples: np.ndarray) -> np.ndarray:
+    """
+    Reference kernel on a 1D sample vector -> (3, n).
+    """
+    pivot, slope, cmy_offsets = get_curve_params(config)
+    grid = np.ascontiguousarray(
+        np.repeat(samples.astype(np.float32)[None, :, None], 3, axis=2)
+    )
+    res = _apply_photometric_fused_kernel(
+        grid,
+        np.full(3, pivot, dtype=np.float32),
+        np.full(3, slope, dtype=np.float32),
+        float(config.toe),
+        float(config.toe_width),
+        float(config.toe_hardness),
+        float(config.shoulder),
+        float(config.shoulder_width),
+        float(config.shoulder_hardness),
+        np.array(cmy_offsets, dtype=np.float32),
+    )
+    return np.ascontiguousarray(res[0].T)
+
+
+def bake_curve_lut(config: ExposureConfig, size: int = CURVE_LUT_SIZE) -> CurveLUT:
+    """
+    Samples the characteristic curve for a fixed exposure config.
+    """
+    nodes = np.linspace(0.0, 1.0, size, dtype=np.float64)
+    table = _evaluate_curve(config, nodes)
+
+    # Second difference ~= h^2 * f'', so h^2 / 8 * max|f''| ~= max|d2| / 8
+    second_diff = np.abs(np.diff(table.astype(np.float64), n=2, axis=1))
+    interp_bound = float(second_diff.max()) / 8.0 if size > 2 else 0.0
+
+    mids = (nodes[:-1] + nodes[1:]) * 0.5
+    exact = _evaluate_curve(config, mids).astype(np.float64)
+    approx = (table[:, :-1].astype(np.float64) + table[:, 1:]) * 0.5
+    mid_error = float(np.abs(exact - approx).max())
+
+    return CurveLUT(table=table, max_error=max(interp_bound, mid_error))
+
+
+_LUT_CACHE: KeyedLRU[CurveLUT] = KeyedLRU(CURVE_LUT_CACHE_SIZE)
+
+
+def curve_lut_key(config: ExposureConfig, size: int = CURVE_LUT_SIZE) -> str:
+    return calculate_config_hash(
+        (
+            get_curve_params(config),
+            config.toe,
+            config.toe_width,
+            config.toe_hardness,
+            config.shoulder,
+            config.shoulder_width,
+            config.shoulder_hardness,
+            size,
+        )
+    )
+
+
+def get_curve_lut(config: ExposureConfig, size: int = CURVE_LUT_SIZE) -> CurveLUT:
+    """
+    Baked curve for the config, shared across preview and export renders.
+    """
+    return _LUT_CACHE.get_or_create(
+        curve_lut_key(config, size), lambda: bake_curve_lut(config, size)
+    )
+
+
+def apply_curve_lut(img: ImageBuffer, lut: CurveLUT) -> ImageBuffer:
+    """
+    Curve lookup for normalized (0-1) log-exposure input.
+    """
+    return ensure_image(
+        _apply_curve_lut_jit(np.ascontiguousarray(img, dtype=np.float32), lut.table)
+    )
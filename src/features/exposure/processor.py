@@ -1,84 +1,140 @@
+from typing import Any, ClassVar, Dict, Optional, Tuple
 import numpy as np
 from src.domain.interfaces import PipelineContext
 from src.domain.types import ImageBuffer
-from src.features.exposure.models import ExposureConfig, EXPOSURE_CONSTANTS
-from src.features.exposure.logic import apply_characteristic_curve
+from src.features.exposure.models import ExposureConfig
+from src.features.exposure.logic import apply_characteristic_curve, get_curve_params
+from src.features.exposure.fused import PointwiseChain
 from src.kernel.image.logic import get_luminance
 from src.features.exposure.normalization import (
-    measure_log_negative_bounds,
+    LogNegativeBounds,
+    measure_linear_bounds,
     normalize_log_image,
     get_analysis_crop,
 )
 from src.domain.models import ProcessMode
 
 
+def cached_log_bounds(
+    metrics: Dict[str, Any], analysis_buffer: float
+) -> Optional[LogNegativeBounds]:
+    """
+    Bounds stored in metrics, if measured with the same analysis buffer.
+    """
+    cached_buffer = metrics.get("log_bounds_buffer_val")
+    if (
+        "log_bounds" in metrics
+        and cached_buffer is not None
+        and abs(cached_buffer - analysis_buffer) < 1e-5
+    ):
+        bounds: LogNegativeBounds = metrics["log_bounds"]
+        return bounds
+    return None
+
+
+def seed_log_bounds(
+    metrics: Dict[str, Any],
+    bounds: LogNegativeBounds,
+    analysis_buffer: float,
+    override: bool = True,
+) -> None:
+    """
+    Precomputed bounds used instead of measuring the frame.
+    override: bounds differ from the frame's own (e.g. roll-wide); False for
+    a stored measurement of the same frame.
+    """
+    metrics["log_bounds"] = bounds
+    metrics["log_bounds_buffer_val"] = analysis_buffer
+    if override:
+        metrics["log_bounds_override"] = True
+
+
+def resolve_log_bounds(
+    image: ImageBuffer, config: ExposureConfig, context: PipelineContext
+) -> LogNegativeBounds:
+    """
+    Bounds cached in metrics for the current buffer setting, else measured
+    on the log of the ROI analysis crop (linear input).
+    """
+    cached = cached_log_bounds(context.metrics, config.analysis_buffer)
+    if cached is not None:
+        return cached
+
+    analysis_img = image
+    if context.active_roi:
+        y1, y2, x1, x2 = context.active_roi
+        analysis_img = image[y1:y2, x1:x2]
+
+    if config.analysis_buffer > 0:
+        analysis_img = get_analysis_crop(analysis_img, config.analysis_buffer)
+
+    bounds = measure_linear_bounds(analysis_img)
+    seed_log_bounds(context.metrics, bounds, config.analysis_buffer, override=False)
+    return bounds
+
+
 class NormalizationProcessor:
     """
     Converts linear RAW to normalized log-density.
     """
 
+    READS: ClassVar[Tuple[str, ...]] = ("exposure.analysis_buffer",)
+
     def __init__(self, config: ExposureConfig):
         self.config = config
 
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
-        epsilon = 1e-6
-        img_log = np.log10(np.clip(image, epsilon, 1.0))
-
-        # Check if bounds are cached and valid for current buffer config
-        cached_buffer = context.metrics.get("log_bounds_buffer_val")
-        if (
-            "log_bounds" in context.metrics
-            and cached_buffer is not None
-            and abs(cached_buffer - self.config.analysis_buffer) < 1e-5
-        ):
-            bounds = context.metrics["log_bounds"]
-        else:
-            analysis_img = img_log
-            if context.active_roi:
-                y1, y2, x1, x2 = context.active_roi
-                analysis_img = img_log[y1:y2, x1:x2]
-
-            if self.config.analysis_buffer > 0:
-                analysis_img = get_analysis_crop(
-                    analysis_img, self.config.analysis_buffer
-                )
-
-            bounds = measure_log_negative_bounds(analysis_img)
-            context.metrics["log_bounds"] = bounds
-            context.metrics["log_bounds_buffer_val"] = self.config.analysis_buffer
-
+        bounds = resolve_log_bounds(image, self.config, context)
+        img_log = np.log10(np.clip(image, 1e-6, 1.0))
         return normalize_log_image(img_log, bounds)
 
 
-class PhotometricProcessor:
+class LogBoundsProcessor:
     """
-    Applies H&D curve simulation.
+    Measures log-density bounds only; the image passes through untouched.
     """
 
+    READS: ClassVar[Tuple[str, ...]] = NormalizationProcessor.READS
+
     def __init__(self, config: ExposureConfig):
         self.config = config
 
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
-        master_ref = 1.0
-        exposure_shift = 0.1 + (
-            self.config.density * EXPOSURE_CONSTANTS["density_multiplier"]
-        )
-        slope = 1.0 + (self.config.grade * EXPOSURE_CONSTANTS["grade_multiplier"])
+        resolve_log_bounds(image, self.config, context)
+        return image
 
-        pivots = [master_ref - exposure_shift] * 3
 
-        cmy_max = EXPOSURE_CONSTANTS["cmy_max_density"]
-        cmy_offsets = (
-            self.config.wb_cyan * cmy_max,
-            self.config.wb_magenta * cmy_max,
-            self.config.wb_yellow * cmy_max,
-        )
+class PhotometricProcessor:
+    """
+    Applies H&D curve simulation.
+    """
+
+    READS: ClassVar[Tuple[str, ...]] = (
+        "process_mode",
+        "exposure.density",
+        "exposure.grade",
+        "exposure.wb_cyan",
+        "exposure.wb_magenta",
+        "exposure.wb_yellow",
+        "exposure.toe",
+        "exposure.toe_width",
+        "exposure.toe_hardness",
+        "exposure.shoulder",
+        "exposure.shoulder_width",
+        "exposure.shoulder_hardness",
+    )
+
+    def __init__(self, config: ExposureConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        pivot, slope, cmy_offsets = get_curve_params(self.config)
 
         img_pos = apply_characteristic_curve(
             image,
-            params_r=(pivots[0], slope),
-            params_g=(pivots[1], slope),
-            params_b=(pivots[2], slope),
+            params_r=(pivot, slope),
+            params_g=(pivot, slope),
+            params_b=(pivot, slope),
             toe=self.config.toe,
             toe_width=self.config.toe_width,
             toe_hardness=self.config.toe_hardness,
@@ -94,3 +150,26 @@ class PhotometricProcessor:
             return res
 
         return img_pos
+
+
+class FusedPhotometricProcessor:
+    """
+    Linear RAW -> positive in one pass (normalization + H&D curve).
+    Expects bounds from LogBoundsProcessor, measures them otherwise.
+    """
+
+    READS: ClassVar[Tuple[str, ...]] = PhotometricProcessor.READS
+
+    def __init__(self, config: ExposureConfig):
+        self.config = config
+
+    def chain(self, image: ImageBuffer, context: PipelineContext) -> PointwiseChain:
+        bounds = resolve_log_bounds(image, self.config, context)
+        return (
+            PointwiseChain()
+            .normalize(bounds)
+            .curve(self.config, to_luma=context.process_mode == ProcessMode.BW)
+        )
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        return self.chain(image, context).apply(image)
@@ -170,6 +170,41 @@ def get_autocrop_coords(
     d_h, d_w = int(h * det_scale), int(w * det_scale)
     img_small = cv2.resize(img, (d_w, d_h), interpolation=cv2.INTER_AREA)
 
+    return detect_autocrop_roi(
+        img_small,
+        (h, w),
+        offset_px=offset_px,
+        scale_factor=scale_factor,
+        target_ratio_str=target_ratio_str,
+        assist_luma=assist_luma,
+    )
+
+
+def get_autocrop_detect_dims(
+    full_shape: Tuple[int, int], detect_res: int = 1800
+) -> Tuple[int, int]:
+    """
+    (h, w) of the downsampled image used for border detection.
+    """
+    h, w = full_shape
+    det_scale = detect_res / max(h, w)
+    return int(h * det_scale), int(w * det_scale)
+
+
+def detect_autocrop_roi(
+    img_small: np.ndarray,
+    full_shape: Tuple[int, int],
+    offset_px: int = 0,
+    scale_factor: float = 1.0,
+    target_ratio_str: str = "3:2",
+    assist_luma: Optional[float] = None,
+) -> ROI:
+    """
+    Border detection on a pre-downsampled image, ROI in full_shape pixels.
+    """
+    h, w = full_shape
+    det_scale = img_small.shape[0] / h
+
     lum = get_luminance(ensure_image(img_small))
 
     threshold = 0.96
@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 import numpy as np
 from src.domain.interfaces import PipelineContext
 from src.domain.types import ImageBuffer
@@ -14,6 +15,8 @@ class GeometryProcessor:
     Rotates and detects crop.
     """
 
+    READS: ClassVar[Tuple[str, ...]] = ("geometry",)
+
     def __init__(self, config: GeometryConfig):
         self.config = config
 
@@ -54,12 +57,14 @@ class GeometryProcessor:
             )
             context.active_roi = roi
         else:
-            roi = get_autocrop_coords(
+            # Detection may be seeded from the analysis cache
+            roi = context.metrics.get("autocrop_roi") or get_autocrop_coords(
                 img,
                 offset_px=self.config.autocrop_offset,
                 scale_factor=context.scale_factor,
                 target_ratio_str=self.config.autocrop_ratio,
             )
+            context.metrics["autocrop_roi"] = roi
             context.active_roi = roi
 
         context.metrics["active_roi"] = context.active_roi
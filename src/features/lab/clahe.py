@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+from numba import njit, prange  # type: ignore
+from src.domain.types import Dimensions
+
+CLAHE_GRID = 8
+# Table resolution: curves are sampled at this many L points and
+# interpolated, 1 MB for the 8x8 grid
+CLAHE_BINS = 4096
+# Histogram resolution: one bin per 16-bit L code, as the OpenCV CLAHE this
+# replaces. With the clip floor of one count it sets the strength of the
+# effect, so it is kept per tile while the tables are built
+CLAHE_HIST_BINS = 65536
+# Preview render size: larger inputs are measured on a downsample, so an
+# export equalizes with the same tile curves as its preview
+CLAHE_ANALYSIS_SIZE = 2000
+
+
+@dataclass(frozen=True)
+class ClaheLUTs:
+    """
+    Per-tile equalization curves over LAB L (0-100), tiles laid out on a
+    fixed grid in normalized frame coordinates.
+    """
+
+    tables: np.ndarray  # (grid, grid, bins) float32, L out per L bin
+
+    @property
+    def grid(self) -> int:
+        return int(self.tables.shape[0])
+
+
+@njit(parallel=True, cache=True)
+def _tile_tables_jit(
+    l_chan: np.ndarray, grid: int, clip_limit: float, hist_bins: int, n_bins: int
+) -> np.ndarray:
+    """
+    Per tile: histogram at hist_bins, OpenCV clip and redistribution (whole
+    batches to every bin, then the residual one count per bin from bin 0 at
+    a fixed step), CDF sampled at n_bins points. Scratch is one CDF per tile.
+    """
+    h, w = l_chan.shape
+    tables = np.empty((grid, grid, n_bins), dtype=np.float32)
+    scale = (hist_bins - 1) / 100.0
+    ratio = (hist_bins - 1) / (n_bins - 1)
+
+    for t in prange(grid * grid):
+        ty = t // grid
+        tx = t % grid
+        y0 = (ty * h + grid - 1) // grid
+        y1 = ((ty + 1) * h + grid - 1) // grid
+        x0 = (tx * w + grid - 1) // grid
+        x1 = ((tx + 1) * w + grid - 1) // grid
+
+        cdf = np.zeros(hist_bins, dtype=np.int64)
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                b = int(l_chan[y, x] * scale)
+                if b < 0:
+                    b = 0
+                elif b >= hist_bins:
+                    b = hist_bins - 1
+                cdf[b] += 1
+
+        total = max((y1 - y0) * (x1 - x0), 1)
+        limit = max(1, int(np.floor(clip_limit * total / hist_bins)))
+        excess = 0
+        for b in range(hist_bins):
+            if cdf[b] > limit:
+                excess += cdf[b] - limit
+                cdf[b] = limit
+
+        batch = excess // hist_bins
+        residual = excess % hist_bins
+        step = max(hist_bins // residual, 1) if residual > 0 else hist_bins
+        acc = 0
+        for b in range(hist_bins):
+            acc += cdf[b] + batch
+            if residual > 0 and b % step == 0 and b // step < residual:
+                acc += 1
+            cdf[b] = acc
+
+        norm = 100.0 / total
+        for c in range(n_bins):
+            pos = c * ratio
+            b0 = min(int(pos), hist_bins - 1)
+            b1 = min(b0 + 1, hist_bins - 1)
+            v = cdf[b0] + (cdf[b1] - cdf[b0]) * (pos - b0)
+            tables[ty, tx, c] = v * norm
+    return tables
+
+
+def build_clahe_luts(
+    l_chan: np.ndarray,
+    clip_limit: float,
+    grid: int = CLAHE_GRID,
+    n_bins: int = CLAHE_BINS,
+) -> ClaheLUTs:
+    """
+    Clipped-histogram CDFs per tile, measured at CLAHE_ANALYSIS_SIZE at most.
+    clip_limit: OpenCV semantics (multiple of the mean bin count, at least
+    one count) over CLAHE_HIST_BINS, so this matches cv2.createCLAHE on
+    16-bit L.
+    """
+    h, w = l_chan.shape[:2]
+    ratio = CLAHE_ANALYSIS_SIZE / max(h, w)
+    if ratio < 1.0:
+        dims = (max(grid, round(w * ratio)), max(grid, round(h * ratio)))
+        l_chan = cv2.resize(l_chan, dims, interpolation=cv2.INTER_AREA)
+
+    tables = _tile_tables_jit(
+        np.ascontiguousarray(l_chan, dtype=np.float32),
+        grid,
+        float(clip_limit),
+        CLAHE_HIST_BINS,
+        n_bins,
+    )
+    return ClaheLUTs(tables)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_clahe_luts_jit(
+    l_chan: np.ndarray,
+    tables: np.ndarray,
+    y_off: int,
+    x_off: int,
+    frame_h: int,
+    frame_w: int,
+) -> np.ndarray:
+    """
+    Bilinear blend of the four nearest tile curves, each linearly
+    interpolated between bins.
+    """
+    h, w = l_chan.shape
+    grid, _, n_bins = tables.shape
+    res = np.empty((h, w), dtype=np.float32)
+    last = grid - 1
+    scale = (n_bins - 1) / 100.0
+
+    for y in prange(h):
+        # Pixel corners, as OpenCV: a half pixel shift is visible on the
+        # steep curves the one-count clip floor produces
+        ty = (y + y_off) / frame_h * grid - 0.5
+        ty0 = int(np.floor(ty))
+        fy = ty - ty0
+        ty1 = min(max(ty0 + 1, 0), last)
+        ty0 = min(max(ty0, 0), last)
+
+        for x in range(w):
+            tx = (x + x_off) / frame_w * grid - 0.5
+            tx0 = int(np.floor(tx))
+            fx = tx - tx0
+            tx1 = min(max(tx0 + 1, 0), last)
+            tx0 = min(max(tx0, 0), last)
+
+            pos = l_chan[y, x] * scale
+            if pos < 0.0:
+                pos = 0.0
+            elif pos > n_bins - 1:
+                pos = n_bins - 1.0
+            b0 = int(pos)
+            b1 = min(b0 + 1, n_bins - 1)
+            fb = pos - b0
+
+            v00 = (
+                tables[ty0, tx0, b0]
+                + (tables[ty0, tx0, b1] - tables[ty0, tx0, b0]) * fb
+            )
+            v01 = (
+                tables[ty0, tx1, b0]
+                + (tables[ty0, tx1, b1] - tables[ty0, tx1, b0]) * fb
+            )
+            v10 = (
+                tables[ty1, tx0, b0]
+                + (tables[ty1, tx0, b1] - tables[ty1, tx0, b0]) * fb
+            )
+            v11 = (
+                tables[ty1, tx1, b0]
+                + (tables[ty1, tx1, b1] - tables[ty1, tx1, b0]) * fb
+            )
+
+            top = v00 + (v01 - v00) * fx
+            bottom = v10 + (v11 - v10) * fx
+            res[y, x] = top + (bottom - top) * fy
+    return res
+
+
+def apply_clahe_luts(
+    l_chan: np.ndarray,
+    luts: ClaheLUTs,
+    origin: Tuple[int, int] = (0, 0),
+    frame: Optional[Dimensions] = None,
+) -> np.ndarray:
+    """
+    Equalized L for l_chan, a window at origin (y, x) of a frame of size
+    frame (defaults to l_chan itself). Resolution independent.
+    """
+    f_h, f_w = frame if frame else l_chan.shape[:2]
+    return np.asarray(
+        _apply_clahe_luts_jit(
+            np.ascontiguousarray(l_chan, dtype=np.float32),
+            luts.tables,
+            int(origin[0]),
+            int(origin[1]),
+            int(f_h),
+            int(f_w),
+        )
+    )
@@ -1,10 +1,22 @@
 import numpy as np
 import cv2
+from functools import partial
 from numba import njit, prange  # type: ignore
-from typing import List, Optional
-from src.domain.types import ImageBuffer
+from typing import List, Optional, Tuple
+from src.domain.types import Dimensions, ImageBuffer
+from src.features.lab.clahe import ClaheLUTs, apply_clahe_luts, build_clahe_luts
+from src.kernel.caching.manager import KeyedLRU
 from src.kernel.image.validation import ensure_image
 
+# Post-CLAHE LAB frames (preview size), reused by sharpen-only changes
+CLAHE_LAB_CACHE_SIZE = 2
+# Two 2000px previews; larger (export) frames bypass the cache
+CLAHE_LAB_CACHE_BYTES = 96 * 1024 * 1024
+# Measured tile curves (1 MB each) for untiled renders
+CLAHE_LUT_CACHE_SIZE = 8
+
+_CLAHE_LUT_CACHE: KeyedLRU[ClaheLUTs] = KeyedLRU(CLAHE_LUT_CACHE_SIZE)
+
 
 @njit(parallel=True, cache=True, fastmath=True)
 def _apply_spectral_crosstalk_jit(
@@ -63,33 +75,29 @@ def apply_spectral_crosstalk(
     return ensure_image(res)
 
 
-def apply_clahe(
-    img: ImageBuffer, strength: float, scale_factor: float = 1.0
-) -> ImageBuffer:
+def clahe_lightness(
+    l_chan: np.ndarray,
+    strength: float,
+    luts: Optional[ClaheLUTs] = None,
+    origin: Tuple[int, int] = (0, 0),
+    frame: Optional[Dimensions] = None,
+    cache_key: Optional[str] = None,
+) -> np.ndarray:
     """
-    L-channel Contrast Limited Adaptive Histogram Equalization.
+    CLAHE blended into LAB L (0-100) by strength.
+    luts: frame-level tile curves (tiled runs); measured from l_chan if None.
+    origin/frame: window offset (y, x) and full frame size for tiled runs.
+    cache_key: identifies l_chan; measured curves are then reused.
     """
-    if strength <= 0:
-        return img
-
-    lab = cv2.cvtColor(img, cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
-
-    l_u16 = (l_chan * (65535.0 / 100.0)).astype(np.uint16)
-
-    clip_limit = strength * 2.5
-    grid_dim = max(2, int(8 * scale_factor))
-    clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(grid_dim, grid_dim))
-    l_enhanced_u16 = clahe.apply(l_u16)
-
-    l_enhanced = l_enhanced_u16.astype(np.float32) * (100.0 / 65535.0)
-
-    l_final = l_chan * (1.0 - strength) + l_enhanced * strength
-
-    lab_enhanced = cv2.merge([l_final, a, b])
-    res = cv2.cvtColor(lab_enhanced, cv2.COLOR_LAB2RGB)
-
-    return ensure_image(np.clip(res, 0.0, 1.0))
+    if luts is None:
+        build = partial(build_clahe_luts, l_chan, strength * 2.5)
+        luts = (
+            build()
+            if cache_key is None
+            else _CLAHE_LUT_CACHE.get_or_create(f"{cache_key}:{strength}", build)
+        )
+    l_enhanced = apply_clahe_luts(l_chan, luts, origin, frame)
+    return np.asarray(l_chan * (1.0 - strength) + l_enhanced * strength)
 
 
 @njit(parallel=True, cache=True, fastmath=True)
@@ -120,33 +128,144 @@ def _apply_unsharp_mask_jit(
     return res
 
 
-def apply_output_sharpening(
-    img: ImageBuffer, amount: float, scale_factor: float = 1.0
-) -> ImageBuffer:
+def sharpen_lightness(
+    l_chan: np.ndarray, amount: float, scale_factor: float = 1.0
+) -> np.ndarray:
     """
-    LAB Lightness sharpening.
+    Unsharp mask on LAB L (0-100).
     """
-    if amount <= 0:
-        return img
-
-    lab = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
-
+    l_chan = np.ascontiguousarray(l_chan, dtype=np.float32)
     k_size = max(3, int(5 * scale_factor) | 1)
     sigma = 1.0 * scale_factor
     l_blur = cv2.GaussianBlur(l_chan, (k_size, k_size), sigma)
+    return _apply_unsharp_mask_jit(
+        l_chan, np.ascontiguousarray(l_blur), float(amount), 2.0
+    )
+
 
-    l_sharpened = _apply_unsharp_mask_jit(
-        np.ascontiguousarray(l_chan),
-        np.ascontiguousarray(l_blur),
-        float(amount),
-        2.0,
+def clahe_lab(
+    img: ImageBuffer,
+    clahe_strength: float,
+    luts: Optional[ClaheLUTs] = None,
+    origin: Tuple[int, int] = (0, 0),
+    frame: Optional[Dimensions] = None,
+    cache_key: Optional[str] = None,
+) -> np.ndarray:
+    """
+    LAB conversion of img with CLAHE applied to L.
+    """
+    lab = cv2.cvtColor(np.asarray(img, dtype=np.float32), cv2.COLOR_RGB2LAB)
+    if clahe_strength > 0:
+        lab[:, :, 0] = clahe_lightness(
+            np.ascontiguousarray(lab[:, :, 0]),
+            clahe_strength,
+            luts,
+            origin,
+            frame,
+            cache_key,
+        )
+    return np.asarray(lab)
+
+
+def clip_lab_to_gamut(lab: np.ndarray) -> np.ndarray:
+    """
+    Clamps LAB in place to what survives an RGB [0, 1] clip and returns
+    that clipped RGB. Only out-of-gamut pixels are converted back.
+    """
+    rgb = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+    np.clip(rgb, 0.0, 1.0, out=rgb)
+    # OpenCV already saturates float LAB2RGB, so clipped pixels sit on 0 or 1
+    out = np.any((rgb <= 0.0) | (rgb >= 1.0), axis=-1)
+    if out.any():
+        lab[out] = cv2.cvtColor(rgb[out][None], cv2.COLOR_RGB2LAB)[0]
+    return rgb
+
+
+_CLAHE_LAB_CACHE: KeyedLRU[np.ndarray] = KeyedLRU(
+    CLAHE_LAB_CACHE_SIZE, CLAHE_LAB_CACHE_BYTES
+)
+
+
+def apply_lightness(
+    img: ImageBuffer,
+    clahe_strength: float,
+    sharpen: float,
+    scale_factor: float = 1.0,
+    luts: Optional[ClaheLUTs] = None,
+    origin: Tuple[int, int] = (0, 0),
+    frame: Optional[Dimensions] = None,
+    cache_key: Optional[str] = None,
+) -> ImageBuffer:
+    """
+    CLAHE then sharpening on L, equivalent to apply_clahe followed by
+    apply_output_sharpening. The intermediate RGB clip is kept by clamping
+    only the out-of-gamut pixels, which saves a full LAB round trip.
+    cache_key: identifies img; the clamped post-CLAHE LAB frame is then
+    reused, so a sharpen-only change skips CLAHE.
+    """
+    if clahe_strength <= 0 and sharpen <= 0:
+        return img
+
+    # The LAB frame is the size of img; export-sized frames are not cached
+    cached = (
+        cache_key is not None
+        and clahe_strength > 0
+        and img.nbytes <= CLAHE_LAB_CACHE_BYTES
     )
+    rgb: Optional[np.ndarray] = None
+    if clahe_strength > 0:
+
+        def build() -> np.ndarray:
+            nonlocal rgb
+            lab = clahe_lab(img, clahe_strength, luts, origin, frame, cache_key)
+            rgb = clip_lab_to_gamut(lab)
+            return lab
+
+        if not cached:
+            lab = build()
+        else:
+            # Shared with later renders: never written to
+            lab = _CLAHE_LAB_CACHE.get_or_create(
+                f"{cache_key}:{clahe_strength}:{origin}:{frame}", build
+            )
+    else:
+        lab = clahe_lab(img, 0.0)
+
+    if sharpen <= 0:
+        if rgb is None:
+            rgb = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+            np.clip(rgb, 0.0, 1.0, out=rgb)
+        return ensure_image(rgb)
+
+    if cached:
+        lab = lab.copy()
+    lab[:, :, 0] = sharpen_lightness(lab[:, :, 0], sharpen, scale_factor)
+    res = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+    return ensure_image(np.clip(res, 0.0, 1.0, out=res))
 
-    res_lab = cv2.merge([l_sharpened, a, b])
-    res_rgb = cv2.cvtColor(res_lab, cv2.COLOR_LAB2RGB)
 
-    return ensure_image(np.clip(res_rgb, 0.0, 1.0))
+def apply_clahe(
+    img: ImageBuffer,
+    strength: float,
+    luts: Optional[ClaheLUTs] = None,
+    origin: Tuple[int, int] = (0, 0),
+    frame: Optional[Dimensions] = None,
+) -> ImageBuffer:
+    """
+    L-channel Contrast Limited Adaptive Histogram Equalization on a fixed
+    8x8 grid, so the look does not depend on resolution.
+    luts/origin/frame: see clahe_lightness.
+    """
+    return apply_lightness(img, strength, 0.0, 1.0, luts, origin, frame)
+
+
+def apply_output_sharpening(
+    img: ImageBuffer, amount: float, scale_factor: float = 1.0
+) -> ImageBuffer:
+    """
+    LAB Lightness sharpening.
+    """
+    return apply_lightness(img, 0.0, amount, scale_factor)
 
 
 def apply_saturation(img: ImageBuffer, saturation: float) -> ImageBuffer:
@@ -1,43 +1,140 @@
 import numpy as np
+from typing import ClassVar, Tuple
 from src.domain.interfaces import PipelineContext
 from src.domain.types import ImageBuffer
 from src.features.lab.models import LabConfig
 from src.features.lab.logic import (
     apply_spectral_crosstalk,
     apply_clahe,
+    apply_lightness,
     apply_output_sharpening,
     apply_saturation,
 )
 
 
+def _window_origin(context: PipelineContext) -> Tuple[int, int]:
+    if context.tile_rect is None:
+        return (0, 0)
+    return (context.tile_rect[0], context.tile_rect[2])
+
+
+class SpectralCrosstalkProcessor:
+    """
+    Color separation via density-space mixing matrix.
+    """
+
+    READS: ClassVar[Tuple[str, ...]] = ("lab.color_separation", "lab.crosstalk_matrix")
+
+    def __init__(self, config: LabConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        c_strength = max(0.0, self.config.color_separation - 1.0)
+        if c_strength <= 0:
+            return image
+
+        epsilon = 1e-6
+        img_dens = -np.log10(np.clip(image, epsilon, 1.0))
+        img_dens = apply_spectral_crosstalk(
+            img_dens, c_strength, self.config.crosstalk_matrix
+        )
+        return np.power(10.0, -img_dens)
+
+
+class SaturationProcessor:
+    READS: ClassVar[Tuple[str, ...]] = ("lab.saturation",)
+
+    def __init__(self, config: LabConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        if self.config.saturation == 1.0:
+            return image
+        return apply_saturation(image, self.config.saturation)
+
+
+class ClaheProcessor:
+    READS: ClassVar[Tuple[str, ...]] = ("lab.clahe_strength",)
+
+    def __init__(self, config: LabConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        if self.config.clahe_strength <= 0:
+            return image
+        return apply_clahe(
+            image,
+            self.config.clahe_strength,
+            luts=context.metrics.get("clahe_luts"),
+            origin=_window_origin(context),
+            frame=context.frame_size,
+        )
+
+
+class SharpeningProcessor:
+    """
+    Final lab step, always leaves the buffer in display range.
+    """
+
+    READS: ClassVar[Tuple[str, ...]] = ("lab.sharpen",)
+
+    def __init__(self, config: LabConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        if self.config.sharpen <= 0:
+            return np.clip(image, 0, 1)
+        return apply_output_sharpening(image, self.config.sharpen, context.scale_factor)
+
+
+LAB_COLOUR_STAGES = (SpectralCrosstalkProcessor, SaturationProcessor)
+# Run as one L sub-pipeline by LightnessProcessor
+LAB_LIGHTNESS_STAGES = (ClaheProcessor, SharpeningProcessor)
+LAB_SUB_STAGES = LAB_COLOUR_STAGES + LAB_LIGHTNESS_STAGES
+
+
+class LightnessProcessor:
+    """
+    CLAHE and sharpening in one LAB round trip. Final lab step, always leaves
+    the buffer in display range. The post-CLAHE frame is cached per upstream
+    image, so a sharpen-only change skips CLAHE.
+    """
+
+    READS: ClassVar[Tuple[str, ...]] = tuple(
+        path for stage in LAB_LIGHTNESS_STAGES for path in stage.READS
+    )
+
+    def __init__(self, config: LabConfig):
+        self.config = config
+
+    def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        if self.config.clahe_strength <= 0 and self.config.sharpen <= 0:
+            return np.clip(image, 0, 1)
+        return apply_lightness(
+            image,
+            self.config.clahe_strength,
+            self.config.sharpen,
+            context.scale_factor,
+            luts=context.metrics.get("clahe_luts"),
+            origin=_window_origin(context),
+            frame=context.frame_size,
+            cache_key=context.upstream_hash,
+        )
+
+
 class PhotoLabProcessor:
+    READS: ClassVar[Tuple[str, ...]] = tuple(
+        path for stage in LAB_SUB_STAGES for path in stage.READS
+    )
+
     def __init__(self, config: LabConfig):
         self.config = config
 
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
         """
-        Apply effects from logic.py in sequence
+        Colour stages in sequence, then CLAHE and sharpening in one LAB pass.
         """
         img = image
-
-        c_strength = max(0.0, self.config.color_separation - 1.0)
-        if c_strength > 0:
-            epsilon = 1e-6
-            img_dens = -np.log10(np.clip(img, epsilon, 1.0))
-            img_dens = apply_spectral_crosstalk(
-                img_dens, c_strength, self.config.crosstalk_matrix
-            )
-            img = np.power(10.0, -img_dens)
-
-        if self.config.saturation != 1.0:
-            img = apply_saturation(img, self.config.saturation)
-
-        if self.config.clahe_strength > 0:
-            img = apply_clahe(img, self.config.clahe_strength, context.scale_factor)
-
-        if self.config.sharpen > 0:
-            img = apply_output_sharpening(
-                img, self.config.sharpen, context.scale_factor
-            )
-
-        return np.clip(img, 0, 1)
+        for stage in LAB_COLOUR_STAGES:
+            img = stage(self.config).process(img, context)
+        return LightnessProcessor(self.config).process(img, context)
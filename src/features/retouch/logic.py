@@ -1,51 +1,49 @@
+from dataclasses import dataclass
+from functools import partial
 import numpy as np
 import cv2
 from numba import njit, prange  # type: ignore
-from typing import List, Tuple
-from src.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
+from typing import Dict, List, Optional, Tuple
+from src.domain.types import ImageBuffer, Dimensions, LUMA_R, LUMA_G, LUMA_B
 from src.kernel.image.validation import ensure_image
 from src.kernel.image.logic import get_luminance
+from src.kernel.image.noise import hash_gaussian
+from src.kernel.caching.manager import KeyedLRU
+
+HEAL_PATCH_CACHE_SIZE = 512
+DUST_CANDIDATE_CACHE_SIZE = 8
 
 
 @njit(parallel=True, cache=True, fastmath=True)
-def _apply_auto_retouch_jit(
+def _dust_candidates_jit(
     img: np.ndarray,
     mean: np.ndarray,
     std: np.ndarray,
     w_std: np.ndarray,
-    dust_threshold: float,
-    dust_size: float,
-    scale_factor: float,
 ) -> np.ndarray:
+    """
+    Pixels that are dust at some threshold >= 0: 1 when the threshold test
+    alone decides, 2 when it must also pass the strong test (interior non-peak).
+    """
     h, w, c = img.shape
-    hit_mask = np.zeros((h, w), dtype=np.float32)
+    cand = np.zeros((h, w), dtype=np.uint8)
 
-    # 1. Detection Pass
     for y in prange(h):
         for x in range(w):
             l_curr = (
                 LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
             )
-            l_mean = mean[y, x]
+            diff = l_curr - mean[y, x]
             local_s = max(0.005, std[y, x])
 
             # Wide-area penalty for textures (rocks, foliage)
             w_s = max(0.0, w_std[y, x] - 0.02)
             wide_penalty = (w_s * w_s * w_s) * 800.0
-            thresh = (dust_threshold * 0.4) + (local_s * 1.0) + wide_penalty
 
             # Multi-stage validation: Contrast, Luminance, and Z-Score
-            if (
-                (l_curr - l_mean) > thresh
-                and l_curr > 0.15
-                and (l_curr - l_mean) / local_s > 3.0
-            ):
-                is_strong = (l_curr - l_mean) > (thresh * 2.5) or (
-                    l_curr - l_mean
-                ) > 0.25
-
+            if diff > local_s + wide_penalty and l_curr > 0.15 and diff / local_s > 3.0:
+                cand[y, x] = 1
                 if 0 < y < h - 1 and 0 < x < w - 1:
-                    is_max = True
                     for dy in range(-1, 2):
                         for dx in range(-1, 2):
                             if dy == 0 and dx == 0:
@@ -56,110 +54,286 @@ def _apply_auto_retouch_jit(
                                 + LUMA_B * img[y + dy, x + dx, 2]
                             )
                             if nl >= l_curr:
-                                is_max = False
+                                cand[y, x] = 2
                                 break
-                        if not is_max:
+                        if cand[y, x] == 2:
                             break
-                    if is_max or is_strong:
-                        hit_mask[y, x] = 1.0
-                else:
-                    hit_mask[y, x] = 1.0
 
-    # 2. Healing Pass: Stochastic Perimeter Sampling (SPS) with Soft Blending
+    return cand
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _candidate_terms_jit(
+    img: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    w_std: np.ndarray,
+    ys: np.ndarray,
+    xs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-candidate contrast, local noise floor and texture penalty.
+    """
+    n = ys.shape[0]
+    diff = np.empty(n, dtype=np.float64)
+    local_s = np.empty(n, dtype=np.float64)
+    wide = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        y, x = ys[i], xs[i]
+        l_curr = LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
+        diff[i] = l_curr - mean[y, x]
+        local_s[i] = max(0.005, std[y, x])
+        w_s = max(0.0, w_std[y, x] - 0.02)
+        wide[i] = (w_s * w_s * w_s) * 800.0
+    return diff, local_s, wide
+
+
+@dataclass(frozen=True)
+class DustCandidates:
+    """
+    Threshold-independent detection result, row-major.
+    hits(t) is the cheap per-threshold step.
+    """
+
+    ys: np.ndarray
+    xs: np.ndarray
+    diff: np.ndarray
+    local_s: np.ndarray
+    wide_penalty: np.ndarray
+    needs_strong: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.ys.shape[0])
+
+    def hits(self, dust_threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        thresh = (dust_threshold * 0.4 + self.local_s) + self.wide_penalty
+        keep = (self.diff > thresh) & (
+            ~self.needs_strong | (self.diff > thresh * 2.5) | (self.diff > 0.25)
+        )
+        return self.ys[keep], self.xs[keep]
+
+
+def find_dust_candidates(
+    img: ImageBuffer, dust_size: int, scale_factor: float
+) -> DustCandidates:
+    """
+    Local statistics and peak tests; everything detection does except the
+    dust_threshold comparison.
+    """
+    base_size, scale = max(1.0, float(dust_size)), max(1.0, float(scale_factor))
+    v_win = int(max(3, base_size * 3.0 * scale)) * 2 + 1
+    w_win = int(max(7, base_size * 4.0 * scale)) * 2 + 1
+
+    gray = get_luminance(img)
+    mean_gray = cv2.blur(gray, (v_win, v_win))
+    std_gray = np.sqrt(
+        np.clip(cv2.blur(gray**2, (v_win, v_win)) - mean_gray**2, 0, None)
+    )
+    w_mean_gray = cv2.blur(gray, (w_win, w_win))
+    w_std_gray = np.sqrt(
+        np.clip(cv2.blur(gray**2, (w_win, w_win)) - w_mean_gray**2, 0, None)
+    )
+
+    src = np.ascontiguousarray(img, dtype=np.float32)
+    mean = np.ascontiguousarray(mean_gray, dtype=np.float32)
+    std = np.ascontiguousarray(std_gray, dtype=np.float32)
+    w_std = np.ascontiguousarray(w_std_gray, dtype=np.float32)
+
+    cand = _dust_candidates_jit(src, mean, std, w_std)
+    ys, xs = _collect_hits_jit(cand)
+    diff, local_s, wide = _candidate_terms_jit(src, mean, std, w_std, ys, xs)
+    return DustCandidates(ys, xs, diff, local_s, wide, cand[ys, xs] == 2)
+
+
+@njit(parallel=True, cache=True)
+def _collect_hits_jit(hit_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-major (ys, xs) of set mask pixels.
+    """
+    h, w = hit_mask.shape
+    counts = np.zeros(h + 1, dtype=np.int64)
+    for y in prange(h):
+        n = 0
+        for x in range(w):
+            if hit_mask[y, x]:
+                n += 1
+        counts[y + 1] = n
+    offsets = np.cumsum(counts)
+
+    ys = np.empty(offsets[h], dtype=np.int32)
+    xs = np.empty(offsets[h], dtype=np.int32)
+    for y in prange(h):
+        k = offsets[y]
+        if k == offsets[y + 1]:
+            continue
+        for x in range(w):
+            if hit_mask[y, x]:
+                ys[k] = y
+                xs[k] = x
+                k += 1
+    return ys, xs
+
+
+@njit(cache=True)
+def _hit_neighbourhood_jit(
+    hit_ys: np.ndarray, hit_xs: np.ndarray, h: int, w: int, exp_rad: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pixels within exp_rad (Euclidean) of any hit, each once, with the squared
+    distance to the nearest hit. Work is O(hits * exp_rad^2); the outputs
+    are sized to the covered pixels, not hits * (2 * exp_rad + 1)^2.
+    """
+    far = 0xFFFF
+    limit = exp_rad * exp_rad + 1
+    d2 = np.full((h, w), far, dtype=np.uint16)
+    n = hit_ys.shape[0]
+    # Pixels inside the radius, counted as they first enter it
+    count = 0
+
+    for k in range(n):
+        y, x = hit_ys[k], hit_xs[k]
+        for ry in range(max(0, y - exp_rad), min(h, y + exp_rad + 1)):
+            dy = ry - y
+            for rx in range(max(0, x - exp_rad), min(w, x + exp_rad + 1)):
+                dx = rx - x
+                d = dy * dy + dx * dx
+                prev = d2[ry, rx]
+                if d < prev:
+                    d2[ry, rx] = d
+                    if d < limit and prev >= limit:
+                        count += 1
+
+    ys = np.empty(count, dtype=np.int32)
+    xs = np.empty(count, dtype=np.int32)
+    dist2 = np.empty(count, dtype=np.int32)
+    m = 0
+    for k in range(n):
+        y, x = hit_ys[k], hit_xs[k]
+        for ry in range(max(0, y - exp_rad), min(h, y + exp_rad + 1)):
+            for rx in range(max(0, x - exp_rad), min(w, x + exp_rad + 1)):
+                d = d2[ry, rx]
+                if d < limit:
+                    ys[m] = ry
+                    xs[m] = rx
+                    dist2[m] = d
+                    m += 1
+                    # Visited
+                    d2[ry, rx] = limit
+    return ys, xs, dist2
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _heal_pixels_jit(
+    img: np.ndarray,
+    res: np.ndarray,
+    ys: np.ndarray,
+    xs: np.ndarray,
+    dist2: np.ndarray,
+    exp_rad: int,
+    p_rad: int,
+) -> None:
+    """
+    Stochastic Perimeter Sampling (SPS) with soft blending, in place on res.
+    """
+    h, w, c = img.shape
+    dy_off = np.array([-p_rad, p_rad, 0, 0, -p_rad, -p_rad, p_rad, p_rad])
+    dx_off = np.array([0, 0, -p_rad, p_rad, -p_rad, p_rad, -p_rad, p_rad])
+
+    for k in prange(ys.shape[0]):
+        y, x = ys[k], xs[k]
+        dist = np.sqrt(float(dist2[k]))
+        feather = 1.0 - (dist / float(exp_rad + 1.0))
+        if feather < 0.0:
+            feather = 0.0
+        feather = feather * feather * (3.0 - 2.0 * feather)
+        if feather <= 0.001:
+            continue
+
+        s_r = np.zeros(8)
+        s_g = np.zeros(8)
+        s_b = np.zeros(8)
+        s_l = np.zeros(8)
+
+        # 8-point perimeter sampling
+        for i in range(8):
+            sy, sx = y + dy_off[i], x + dx_off[i]
+            sy, sx = max(0, min(h - 1, sy)), max(0, min(w - 1, sx))
+            r, g, b = img[sy, sx, 0], img[sy, sx, 1], img[sy, sx, 2]
+            s_r[i], s_g[i], s_b[i] = r, g, b
+            s_l[i] = 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+        # Selection sort for outlier rejection
+        for i in range(8):
+            for j in range(i + 1, 8):
+                if s_l[i] > s_l[j]:
+                    s_l[i], s_l[j] = s_l[j], s_l[i]
+                    s_r[i], s_r[j] = s_r[j], s_r[i]
+                    s_g[i], s_g[j] = s_g[j], s_g[i]
+                    s_b[i], s_b[j] = s_b[j], s_b[i]
+
+        # Average middle 50% (discard 2 brightest, 2 darkest)
+        bg_r = (s_r[2] + s_r[3] + s_r[4] + s_r[5]) / 4.0
+        bg_g = (s_g[2] + s_g[3] + s_g[4] + s_g[5]) / 4.0
+        bg_b = (s_b[2] + s_b[3] + s_b[4] + s_b[5]) / 4.0
+
+        res[y, x, 0] = img[y, x, 0] * (1.0 - feather) + bg_r * feather
+        res[y, x, 1] = img[y, x, 1] * (1.0 - feather) + bg_g * feather
+        res[y, x, 2] = img[y, x, 2] * (1.0 - feather) + bg_b * feather
+
+
+def heal_dust_hits(
+    img: np.ndarray,
+    hit_ys: np.ndarray,
+    hit_xs: np.ndarray,
+    dust_size: float,
+    scale_factor: float,
+) -> np.ndarray:
+    """
+    Heals around detected hits; untouched pixels are copied through.
+    """
     res = img.copy()
+    if hit_ys.shape[0] == 0:
+        return res
+
     exp_rad = int(max(1.0, dust_size * 0.4 * scale_factor))
     if exp_rad > 16:
         exp_rad = 16
     p_rad = exp_rad + int(3 * scale_factor)
 
-    for y in prange(h):
-        for x in range(w):
-            min_d2 = 1e6
-            for dy in range(-exp_rad, exp_rad + 1):
-                for dx in range(-exp_rad, exp_rad + 1):
-                    ry, rx = y + dy, x + dx
-                    if 0 <= ry < h and 0 <= rx < w and hit_mask[ry, rx] > 0.5:
-                        d2 = float(dy * dy + dx * dx)
-                        if d2 < min_d2:
-                            min_d2 = d2
-
-            if min_d2 < float(exp_rad * exp_rad + 1):
-                dist = np.sqrt(min_d2)
-                feather = 1.0 - (dist / float(exp_rad + 1.0))
-                if feather < 0.0:
-                    feather = 0.0
-                feather = feather * feather * (3.0 - 2.0 * feather)
-
-                if feather > 0.001:
-                    s_r = np.zeros(8)
-                    s_g = np.zeros(8)
-                    s_b = np.zeros(8)
-                    s_l = np.zeros(8)
-
-                    # 8-point perimeter sampling
-                    dy_off = np.array(
-                        [-p_rad, p_rad, 0, 0, -p_rad, -p_rad, p_rad, p_rad]
-                    )
-                    dx_off = np.array(
-                        [0, 0, -p_rad, p_rad, -p_rad, p_rad, -p_rad, p_rad]
-                    )
-
-                    for i in range(8):
-                        sy, sx = y + dy_off[i], x + dx_off[i]
-                        sy, sx = max(0, min(h - 1, sy)), max(0, min(w - 1, sx))
-                        r, g, b = img[sy, sx, 0], img[sy, sx, 1], img[sy, sx, 2]
-                        s_r[i], s_g[i], s_b[i] = r, g, b
-                        s_l[i] = 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-                    # Selection sort for outlier rejection
-                    for i in range(8):
-                        for j in range(i + 1, 8):
-                            if s_l[i] > s_l[j]:
-                                s_l[i], s_l[j] = s_l[j], s_l[i]
-                                s_r[i], s_r[j] = s_r[j], s_r[i]
-                                s_g[i], s_g[j] = s_g[j], s_g[i]
-                                s_b[i], s_b[j] = s_b[j], s_b[i]
-
-                    # Average middle 50% (discard 2 brightest, 2 darkest)
-                    bg_r = (s_r[2] + s_r[3] + s_r[4] + s_r[5]) / 4.0
-                    bg_g = (s_g[2] + s_g[3] + s_g[4] + s_g[5]) / 4.0
-                    bg_b = (s_b[2] + s_b[3] + s_b[4] + s_b[5]) / 4.0
-
-                    res[y, x, 0] = img[y, x, 0] * (1.0 - feather) + bg_r * feather
-                    res[y, x, 1] = img[y, x, 1] * (1.0 - feather) + bg_g * feather
-                    res[y, x, 2] = img[y, x, 2] * (1.0 - feather) + bg_b * feather
-
+    h, w = img.shape[:2]
+    ys, xs, dist2 = _hit_neighbourhood_jit(hit_ys, hit_xs, h, w, exp_rad)
+    _heal_pixels_jit(img, res, ys, xs, dist2, exp_rad, p_rad)
     return res
 
 
-@njit(parallel=True, cache=True, fastmath=True)
-def _apply_inpainting_grain_jit(
+@njit(cache=True, fastmath=True)
+def _heal_patch_jit(
     img: np.ndarray,
     img_inpainted: np.ndarray,
-    mask_final: np.ndarray,
-    noise: np.ndarray,
-) -> np.ndarray:
+    mask: np.ndarray,
+    seed: int,
+    gy0: int,
+    gx0: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Grained heal values and luma-keyed blend weights for one patch at frame
+    position (gy0, gx0).
+    """
     h, w, c = img_inpainted.shape
-    res = np.empty_like(img_inpainted)
+    heal = np.empty((h, w, 3), dtype=np.float32)
+    weight = np.empty((h, w), dtype=np.float32)
 
-    for y in prange(h):
+    for y in range(h):
         for x in range(w):
-            lum = (
+            heal_luma = (
                 LUMA_R * img_inpainted[y, x, 0]
                 + LUMA_G * img_inpainted[y, x, 1]
                 + LUMA_B * img_inpainted[y, x, 2]
             ) / 255.0
-            mod = 3.0 * lum * (1.0 - lum)
-            m = mask_final[y, x, 0]
-
+            mod = 3.0 * heal_luma * (1.0 - heal_luma)
             orig_luma = (
                 LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
             )
-            heal_luma = (
-                LUMA_R * img_inpainted[y, x, 0]
-                + LUMA_G * img_inpainted[y, x, 1]
-                + LUMA_B * img_inpainted[y, x, 2]
-            ) / 255.0
 
             luma_key = (orig_luma - heal_luma - 0.04) / 0.08
             if luma_key < 0.0:
@@ -167,15 +341,141 @@ def _apply_inpainting_grain_jit(
             if luma_key > 1.0:
                 luma_key = 1.0
 
-            final_m = m * luma_key
-
+            final_m = mask[y, x] * luma_key
+            weight[y, x] = final_m
             for ch in range(3):
-                val = img_inpainted[y, x, ch] + noise[y, x, ch] * 0.4 * mod * final_m
-                res[y, x, ch] = (
-                    img[y, x, ch] * (1.0 - final_m) + (val / 255.0) * final_m
-                )
+                noise = hash_gaussian(seed, gx0 + x, gy0 + y, ch) * 3.5
+                val = img_inpainted[y, x, ch] + noise * 0.4 * mod * final_m
+                heal[y, x, ch] = val / 255.0
 
-    return res
+    return heal, weight
+
+
+@dataclass(frozen=True)
+class HealPatch:
+    """
+    Healed pixels and blend weights for one spot group at (y0, x0).
+    """
+
+    y0: int
+    x0: int
+    heal: np.ndarray
+    weight: np.ndarray
+
+
+_PATCH_CACHE: KeyedLRU[Optional[HealPatch]] = KeyedLRU(HEAL_PATCH_CACHE_SIZE)
+_CANDIDATE_CACHE: KeyedLRU[DustCandidates] = KeyedLRU(DUST_CANDIDATE_CACHE_SIZE)
+
+
+def _heal_margin(inpaint_rad: int) -> int:
+    # Telea neighbourhood plus the feathered mask edge
+    return inpaint_rad + inpaint_rad // 2 + 1
+
+
+def group_spots(
+    spots: List[Tuple[int, int, int]], inpaint_rad: int
+) -> List[List[Tuple[int, int, int]]]:
+    """
+    Connected groups of spots (cy, cx, radius) that come within the heal
+    margin of each other, so clicks along a scratch inpaint as one mask.
+    Groups are sorted for stable cache keys.
+    """
+    margin = _heal_margin(inpaint_rad)
+    parent = list(range(len(spots)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, (ay, ax, ar) in enumerate(spots):
+        for j in range(i + 1, len(spots)):
+            by, bx, br = spots[j]
+            reach = ar + br + margin
+            if (ay - by) ** 2 + (ax - bx) ** 2 <= reach * reach:
+                parent[find(i)] = find(j)
+
+    groups: Dict[int, List[Tuple[int, int, int]]] = {}
+    for i, spot in enumerate(spots):
+        groups.setdefault(find(i), []).append(spot)
+    return sorted(sorted(set(g)) for g in groups.values())
+
+
+def heal_group(
+    img: ImageBuffer,
+    spots: List[Tuple[int, int, int]],
+    inpaint_rad: int,
+    seed: int = 0,
+    origin: Tuple[int, int] = (0, 0),
+) -> Optional[HealPatch]:
+    """
+    Inpaints a spot group with one mask over its bounding patch; None when
+    it misses img.
+    origin: frame position (y, x) of img, so grain does not depend on tiling.
+    """
+    h, w = img.shape[:2]
+    pad = _heal_margin(inpaint_rad)
+    y0 = max(0, min(cy - r for cy, _, r in spots) - pad)
+    y1 = min(h, max(cy + r for cy, _, r in spots) + pad + 1)
+    x0 = max(0, min(cx - r for _, cx, r in spots) - pad)
+    x1 = min(w, max(cx + r for _, cx, r in spots) + pad + 1)
+    if y0 >= y1 or x0 >= x1:
+        return None
+
+    mask_u8 = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    for cy, cx, radius in spots:
+        cv2.circle(mask_u8, (cx - x0, cy - y0), radius, 255, -1)
+    if not mask_u8.any():
+        return None
+
+    patch = np.ascontiguousarray(img[y0:y1, x0:x1], dtype=np.float32)
+    patch_u8 = np.clip(np.nan_to_num(patch * 255), 0, 255).astype(np.uint8)
+    inpainted = cv2.inpaint(patch_u8, mask_u8, inpaint_rad, cv2.INPAINT_TELEA)
+
+    mask_blur: np.ndarray = cv2.GaussianBlur(
+        mask_u8.astype(np.float32) / 255.0, (inpaint_rad | 1, inpaint_rad | 1), 0
+    )
+
+    heal, weight = _heal_patch_jit(
+        patch,
+        np.ascontiguousarray(inpainted.astype(np.float32)),
+        np.ascontiguousarray(mask_blur.astype(np.float32)),
+        seed,
+        origin[0] + y0,
+        origin[1] + x0,
+    )
+    return HealPatch(y0, x0, heal, weight)
+
+
+def heal_manual_spots(
+    img: ImageBuffer,
+    spots: List[Tuple[int, int, int]],
+    inpaint_rad: int,
+    cache_key: Optional[str] = None,
+    seed: int = 0,
+    origin: Tuple[int, int] = (0, 0),
+) -> ImageBuffer:
+    """
+    Composites per-group patches (pixel cy, cx, radius) over a copy of img.
+    With cache_key (identifying img), patches are reused across renders, so
+    adding a spot re-heals only its group and removing one heals at most that.
+    """
+    res = np.array(img, dtype=np.float32)
+    for group in group_spots(spots, inpaint_rad):
+        if cache_key is None:
+            patch = heal_group(img, group, inpaint_rad, seed, origin)
+        else:
+            patch = _PATCH_CACHE.get_or_create(
+                f"{cache_key}:{seed}:{origin}:{inpaint_rad}:{group}",
+                partial(heal_group, img, group, inpaint_rad, seed, origin),
+            )
+        if patch is None:
+            continue
+        ph, pw = patch.weight.shape
+        region = res[patch.y0 : patch.y0 + ph, patch.x0 : patch.x0 + pw]
+        region += (patch.heal - region) * patch.weight[:, :, None]
+    return ensure_image(res)
 
 
 def apply_dust_removal(
@@ -185,67 +485,60 @@ def apply_dust_removal(
     dust_size: int,
     manual_spots: List[Tuple[float, float, float]],
     scale_factor: float,
+    spot_frame: Optional[Dimensions] = None,
+    spot_origin: Tuple[int, int] = (0, 0),
+    cache_key: Optional[str] = None,
+    noise_seed: int = 0,
 ) -> ImageBuffer:
+    """
+    spot_frame/spot_origin: full frame size and window offset (y, x) when
+    img is a window of the frame spots are normalised against.
+    cache_key: identifies img (the stage input) for reusing dust candidates
+    and manual patches across renders.
+    noise_seed: per-file grain seed (see kernel.image.noise).
+    """
     if not (dust_remove or manual_spots):
         return img
 
     if dust_remove:
-        base_size, scale = max(1.0, float(dust_size)), max(1.0, float(scale_factor))
-        v_win = int(max(3, base_size * 3.0 * scale)) * 2 + 1
-        w_win = int(max(7, base_size * 4.0 * scale)) * 2 + 1
-
-        gray = get_luminance(img)
-        mean_gray = cv2.blur(gray, (v_win, v_win))
-        std_gray = np.sqrt(
-            np.clip(cv2.blur(gray**2, (v_win, v_win)) - mean_gray**2, 0, None)
-        )
-        w_mean_gray = cv2.blur(gray, (w_win, w_win))
-        w_std_gray = np.sqrt(
-            np.clip(cv2.blur(gray**2, (w_win, w_win)) - w_mean_gray**2, 0, None)
-        )
-
-        img = _apply_auto_retouch_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
-            np.ascontiguousarray(mean_gray.astype(np.float32)),
-            np.ascontiguousarray(std_gray.astype(np.float32)),
-            np.ascontiguousarray(w_std_gray.astype(np.float32)),
-            float(dust_threshold),
+        # Threshold changes reuse the candidates and only re-heal
+        if cache_key is None:
+            candidates = find_dust_candidates(img, dust_size, scale_factor)
+        else:
+            candidates = _CANDIDATE_CACHE.get_or_create(
+                f"{cache_key}:{dust_size}",
+                partial(find_dust_candidates, img, dust_size, scale_factor),
+            )
+        hit_ys, hit_xs = candidates.hits(float(dust_threshold))
+        img = heal_dust_hits(
+            np.ascontiguousarray(img, dtype=np.float32),
+            hit_ys,
+            hit_xs,
             float(dust_size),
             float(scale_factor),
         )
 
     if manual_spots:
         h_img, w_img = img.shape[:2]
-        manual_mask_u8 = np.zeros((h_img, w_img), dtype=np.uint8)
-        for spot in manual_spots:
-            nx, ny, s_size = spot
-            radius = int(max(1, s_size * scale_factor))
-            cv2.circle(
-                manual_mask_u8, (int(nx * w_img), int(ny * h_img)), radius, 255, -1
-            )
-
-        img_u8 = np.clip(np.nan_to_num(img * 255), 0, 255).astype(np.uint8)
-        inpaint_rad = int(3 * scale_factor) | 1
-        img_inpainted_u8 = ensure_image(
-            cv2.inpaint(img_u8, manual_mask_u8, inpaint_rad, cv2.INPAINT_TELEA)
-        )
-
-        noise_arr = np.random.normal(0, 3.5, img_inpainted_u8.shape).astype(np.float32)
-        mask_base = manual_mask_u8.astype(np.float32) / 255.0
-        mask_blur = cv2.GaussianBlur(
-            mask_base[:, :, None], (inpaint_rad | 1, inpaint_rad | 1), 0
-        )
-        mask_final = (
-            mask_blur[:, :, None] if mask_blur.ndim == 2 else mask_blur
-        ).astype(np.float32)
-
-        img = ensure_image(
-            _apply_inpainting_grain_jit(
-                np.ascontiguousarray(img.astype(np.float32)),
-                np.ascontiguousarray(img_inpainted_u8.astype(np.float32)),
-                np.ascontiguousarray(mask_final.astype(np.float32)),
-                np.ascontiguousarray(noise_arr.astype(np.float32)),
+        f_h, f_w = spot_frame if spot_frame else (h_img, w_img)
+        o_y, o_x = spot_origin
+        spots = [
+            (
+                int(ny * f_h) - o_y,
+                int(nx * f_w) - o_x,
+                int(max(1, s_size * scale_factor)),
             )
+            for nx, ny, s_size in manual_spots
+        ]
+        if cache_key is not None and dust_remove:
+            cache_key = f"{cache_key}:{dust_threshold}:{dust_size}"
+        img = heal_manual_spots(
+            img,
+            spots,
+            int(3 * scale_factor) | 1,
+            cache_key,
+            seed=noise_seed,
+            origin=spot_origin,
         )
 
     return ensure_image(img)
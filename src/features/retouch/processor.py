@@ -1,3 +1,4 @@
+from typing import ClassVar, Tuple
 from src.domain.interfaces import PipelineContext
 from src.domain.types import ImageBuffer
 from src.features.retouch.models import RetouchConfig
@@ -10,6 +11,13 @@ class RetouchProcessor:
     Applies healing and automatic dust removal.
     """
 
+    READS: ClassVar[Tuple[str, ...]] = (
+        "retouch.dust_remove",
+        "retouch.dust_threshold",
+        "retouch.dust_size",
+        "retouch.manual_dust_spots",
+    )
+
     def __init__(self, config: RetouchConfig):
         self.config = config
 
@@ -54,6 +62,12 @@ class RetouchProcessor:
             self.config.dust_size,
             mapped_spots,
             scale_factor,
+            spot_frame=context.frame_size,
+            spot_origin=(context.tile_rect[0], context.tile_rect[2])
+            if context.tile_rect
+            else (0, 0),
+            cache_key=context.upstream_hash,
+            noise_seed=context.noise_seed,
         )
 
         return img
@@ -6,6 +6,7 @@ struct RetouchUniforms {
     global_offset: vec2<i32>,
     full_dims: vec2<i32>,
     scale_factor: f32,
+    noise_seed: u32,
 };
 
 struct ManualSpot {
@@ -19,14 +20,23 @@ struct ManualSpot {
 @group(0) @binding(2) var<uniform> params: RetouchUniforms;
 @group(0) @binding(3) var<storage, read> manual_spots: array<ManualSpot>;
 
-fn hash(p: vec2<f32>) -> f32 {
-    var p3 = fract(vec3<f32>(p.xyx) * 0.1031);
-    p3 += dot(p3, p3.yzx + 33.33);
-    return fract((p3.x + p3.y) * p3.z);
+// Counter-based hash noise; mirrors src/kernel/image/noise.py
+fn mix32(v: u32) -> u32 {
+    var x = v;
+    x ^= x >> 16u;
+    x *= 0x7feb352du;
+    x ^= x >> 15u;
+    x *= 0x846ca68bu;
+    x ^= x >> 16u;
+    return x;
 }
 
-fn get_noise(p: vec2<f32>) -> f32 {
-    return hash(p) * 2.0 - 1.0;
+fn hash_u32(seed: u32, p: vec2<i32>, ch: u32) -> u32 {
+    return mix32(seed + mix32(u32(p.x) + mix32(u32(p.y) + mix32(ch + 0x9e3779b9u))));
+}
+
+fn hash_uniform(seed: u32, p: vec2<i32>, ch: u32) -> f32 {
+    return f32(hash_u32(seed, p, ch) >> 8u) * (1.0 / 16777216.0);
 }
 
 fn median3x3(coords: vec2<i32>, dims: vec2<i32>) -> vec3<f32> {
@@ -108,6 +118,7 @@ fn main(@builtin(global_invocation_id) gid: vec3<u32>) {
 
     let coords = vec2<i32>(i32(gid.x), i32(gid.y));
     let idims = vec2<i32>(dims);
+    let pixel = coords + params.global_offset;
     let global_coords = vec2<f32>(f32(coords.x + params.global_offset.x) + 0.5, 
                                   f32(coords.y + params.global_offset.y) + 0.5);
     let global_uv = global_coords / vec2<f32>(f32(params.full_dims.x), f32(params.full_dims.y));
@@ -219,7 +230,7 @@ fn main(@builtin(global_invocation_id) gid: vec3<u32>) {
                 (s_b[2] + s_b[3] + s_b[4] + s_b[5]) / 4.0
             );
 
-            let grain = get_noise(global_uv * 1000.0) * 0.003 * (4.0 * mean * (1.0 - mean));
+            let grain = (hash_uniform(params.noise_seed, pixel, 0u) * 2.0 - 1.0) * 0.003 * (4.0 * mean * (1.0 - mean));
             res = mix(original, healed_val + vec3<f32>(grain), feather);
         }
     }
@@ -232,10 +243,9 @@ fn main(@builtin(global_invocation_id) gid: vec3<u32>) {
             let full_f = vec2<f32>(f32(params.full_dims.x), f32(params.full_dims.y));
             let delta = global_uv - spot.pos;
             let pixel_angle = atan2(delta.y, delta.x);
-            let seed = global_coords + f32(i) * 7.77;
             var heal = vec3<f32>(0.0);
             for(var s = 0.0; s < 3.0; s += 1.0) {
-                let jitter = (hash(seed + s * 0.555) - 0.5) * (pi * 0.2);
+                let jitter = (hash_uniform(params.noise_seed, pixel, 1u + i * 3u + u32(s)) - 0.5) * (pi * 0.2);
                 let p_off = vec2<f32>(cos(pixel_angle + jitter), sin(pixel_angle + jitter)) * (spot.radius * 0.95);
                 let pc = vec2<i32>((spot.pos + p_off) * full_f) - params.global_offset;
                 heal += min3x3(pc, idims);
@@ -1,11 +1,66 @@
 import numpy as np
 from numba import njit, prange  # type: ignore
-from typing import Dict
+from typing import Dict, Tuple
 from src.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
 from src.kernel.image.validation import ensure_image
 from src.features.toning.models import PaperSubstrate, PaperProfileName
 
 
+SELENIUM_COLOR = np.array([0.85, 0.75, 0.85], dtype=np.float32)
+SEPIA_COLOR = np.array([1.1, 0.99, 0.825], dtype=np.float32)
+
+
+@njit(inline="always")
+def _paper_pixel(val: float, tint: float, dmax_boost: float) -> float:
+    """
+    Tint & density boost for one channel value.
+    """
+    val = val * tint
+    if dmax_boost != 1.0:
+        val = val**dmax_boost
+    if val < 0.0:
+        val = 0.0
+    elif val > 1.0:
+        val = 1.0
+    return val
+
+
+@njit(inline="always")
+def _toning_weights(
+    lum_val: float, sel_strength: float, sep_strength: float
+) -> Tuple[float, float]:
+    """
+    Selenium (shadows) and sepia (mids) blend weights for a luminance.
+    """
+    sel_m = 0.0
+    if sel_strength > 0:
+        sel_m = 1.0 - lum_val
+        if sel_m < 0.0:
+            sel_m = 0.0
+        sel_m = sel_m * sel_m * sel_strength
+
+    sep_m = 0.0
+    if sep_strength > 0:
+        sep_m = np.exp(-((lum_val - 0.6) ** 2) / 0.08) * sep_strength
+    return sel_m, sep_m
+
+
+@njit(inline="always")
+def _tone_pixel(
+    pixel: float, sel_m: float, sep_m: float, sel_color: float, sep_color: float
+) -> float:
+    if sel_m > 0:
+        pixel = pixel * (1.0 - sel_m) + (pixel * sel_color) * sel_m
+    if sep_m > 0:
+        pixel = pixel * (1.0 - sep_m) + (pixel * sep_color) * sep_m
+
+    if pixel < 0.0:
+        pixel = 0.0
+    elif pixel > 1.0:
+        pixel = 1.0
+    return pixel
+
+
 @njit(parallel=True, cache=True, fastmath=True)
 def _apply_paper_substrate_jit(
     img: np.ndarray, tint: np.ndarray, dmax_boost: float
@@ -18,14 +73,7 @@ def _apply_paper_substrate_jit(
     for y in prange(h):
         for x in range(w):
             for ch in range(3):
-                val = img[y, x, ch] * tint[ch]
-                if dmax_boost != 1.0:
-                    val = val**dmax_boost
-                if val < 0.0:
-                    val = 0.0
-                elif val > 1.0:
-                    val = 1.0
-                res[y, x, ch] = val
+                res[y, x, ch] = _paper_pixel(img[y, x, ch], tint[ch], dmax_boost)
     return res
 
 
@@ -38,8 +86,6 @@ def _apply_chemical_toning_jit(
     """
     h, w, c = img.shape
     res = np.empty_like(img)
-    sel_color = np.array([0.85, 0.75, 0.85], dtype=np.float32)
-    sep_color = np.array([1.1, 0.99, 0.825], dtype=np.float32)
 
     for y in prange(h):
         for x in range(w):
@@ -47,30 +93,12 @@ def _apply_chemical_toning_jit(
             lum_val = (
                 LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
             )
-
-            sel_m = 0.0
-            if sel_strength > 0:
-                sel_m = 1.0 - lum_val
-                if sel_m < 0.0:
-                    sel_m = 0.0
-                sel_m = sel_m * sel_m * sel_strength
-
-            sep_m = 0.0
-            if sep_strength > 0:
-                sep_m = np.exp(-((lum_val - 0.6) ** 2) / 0.08) * sep_strength
+            sel_m, sep_m = _toning_weights(lum_val, sel_strength, sep_strength)
 
             for ch in range(3):
-                pixel = img[y, x, ch]
-                if sel_m > 0:
-                    pixel = pixel * (1.0 - sel_m) + (pixel * sel_color[ch]) * sel_m
-                if sep_m > 0:
-                    pixel = pixel * (1.0 - sep_m) + (pixel * sep_color[ch]) * sep_m
-
-                if pixel < 0.0:
-                    pixel = 0.0
-                elif pixel > 1.0:
-                    pixel = 1.0
-                res[y, x, ch] = pixel
+                res[y, x, ch] = _tone_pixel(
+                    img[y, x, ch], sel_m, sep_m, SELENIUM_COLOR[ch], SEPIA_COLOR[ch]
+                )
     return res
 
 
@@ -88,11 +116,15 @@ PAPER_PROFILES: Dict[str, PaperSubstrate] = {
 }
 
 
+def get_paper_profile(profile_name: str) -> PaperSubstrate:
+    return PAPER_PROFILES.get(profile_name, PAPER_PROFILES[PaperProfileName.NONE])
+
+
 def simulate_paper_substrate(img: ImageBuffer, profile_name: str) -> ImageBuffer:
     """
     Look-up profile -> Apply tint.
     """
-    profile = PAPER_PROFILES.get(profile_name, PAPER_PROFILES[PaperProfileName.NONE])
+    profile = get_paper_profile(profile_name)
     tint = np.ascontiguousarray(np.array(profile.tint, dtype=np.float32))
 
     return ensure_image(
@@ -1,37 +1,61 @@
+from typing import ClassVar, Tuple
 import numpy as np
 from src.domain.interfaces import PipelineContext
 from src.domain.types import ImageBuffer
 from src.features.toning.models import ToningConfig
-from src.features.toning.logic import simulate_paper_substrate, apply_chemical_toning
+from src.features.exposure.fused import PointwiseChain
 from src.kernel.image.logic import get_luminance
 from src.domain.models import ProcessMode
 
 
+BW_BLACK_POINT_PERCENTILE = 0.05
+
+
+def apply_black_point(img: ImageBuffer, black_point: float) -> ImageBuffer:
+    res = (img - black_point) / (1.0 - black_point + 1e-6)
+    return np.clip(res, 0.0, 1.0).astype(np.float32)  # type: ignore
+
+
 # We need to port this helper locally or into logic as well
 def apply_chromaticity_preserving_black_point(
     img: ImageBuffer, percentile: float
 ) -> ImageBuffer:
     lum = get_luminance(img)
     bp = np.percentile(lum, percentile)
-    res = (img - bp) / (1.0 - bp + 1e-6)
-    return np.clip(res, 0.0, 1.0).astype(np.float32)  # type: ignore
+    return apply_black_point(img, bp)
 
 
 class ToningProcessor:
+    READS: ClassVar[Tuple[str, ...]] = ("process_mode", "toning")
+
     def __init__(self, config: ToningConfig):
         self.config = config
 
+    def chain(self, context: PipelineContext) -> PointwiseChain:
+        """
+        Paper substrate (+ chemical toning in B&W) as one pointwise pass.
+        """
+        chain = PointwiseChain().paper(self.config.paper_profile)
+        if context.process_mode == ProcessMode.BW:
+            chain.toning(self.config.selenium_strength, self.config.sepia_strength)
+        return chain
+
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
-        img = image
-        img = simulate_paper_substrate(img, self.config.paper_profile)
+        img = self.chain(context).apply(image)
+        return self.finish(img, context)
 
+    def finish(self, img: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+        """
+        Frame-global step following the pointwise pass.
+        """
         if context.process_mode == ProcessMode.BW:
-            img = apply_chemical_toning(
-                img,
-                selenium_strength=self.config.selenium_strength,
-                sepia_strength=self.config.sepia_strength,
-            )
-
-            img = apply_chromaticity_preserving_black_point(img, 0.05)
+            # Tiled runs measure the black point over the whole frame afterwards
+            if not context.metrics.get("defer_black_point"):
+                black_point = float(
+                    np.percentile(get_luminance(img), BW_BLACK_POINT_PERCENTILE)
+                )
+                # Viewport renders reuse the frame's black point
+                context.metrics["bw_black_point"] = black_point
+                img = apply_black_point(img, black_point)
 
         return img
@@ -1,5 +1,6 @@
 import os
 from typing import Any, ContextManager, Tuple
+from src.domain.interfaces import IImageLoader
 from src.infrastructure.loaders.pakon_loader import PakonLoader
 from src.infrastructure.loaders.tiff_loader import TiffLoader
 from src.infrastructure.loaders.rawpy_loader import RawpyLoader
@@ -16,16 +17,29 @@ class LoaderFactory:
         self._tiff = TiffLoader()
         self._rawpy = RawpyLoader()
 
-    def get_loader(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
-        ext = os.path.splitext(file_path)[1].lower()
-
+    def _select(self, file_path: str) -> IImageLoader:
         if PakonLoader.can_handle(file_path):
-            return self._pakon.load(file_path)
+            return self._pakon
 
-        if ext in SUPPORTED_TIFF_EXTENSIONS:
-            return self._tiff.load(file_path)
+        if os.path.splitext(file_path)[1].lower() in SUPPORTED_TIFF_EXTENSIONS:
+            return self._tiff
 
-        return self._rawpy.load(file_path)
+        return self._rawpy
+
+    def get_loader(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
+        return self._select(file_path).load(file_path)
+
+    def probe(self, file_path: str) -> dict:
+        """
+        Header facts without decoding pixels: width, height, sensor, has_thumbnail.
+        """
+        return self._select(file_path).probe(file_path)
+
+    def is_camera_raw(self, file_path: str) -> bool:
+        """
+        True when get_loader dispatches to libraw (demosaiced on decode).
+        """
+        return self._select(file_path) is self._rawpy
 
 
 # Global instance for shared use
@@ -3,7 +3,6 @@ import numpy as np
 from typing import Any, List, Dict, ContextManager, Tuple
 from src.domain.interfaces import IImageLoader
 from src.infrastructure.loaders.tiff_loader import NonStandardFileWrapper
-from src.kernel.image.logic import uint16_to_float32
 
 
 class PakonLoader(IImageLoader):
@@ -24,14 +23,22 @@ class PakonLoader(IImageLoader):
         file_size = os.path.getsize(file_path)
         return any(abs(file_size - s["size"]) < 1024 for s in cls.PAKON_SPECS)
 
+    def probe(self, file_path: str) -> dict:
+        file_size = os.path.getsize(file_path)
+        spec = next(s for s in self.PAKON_SPECS if abs(file_size - s["size"]) < 1024)
+        h, w = spec["res"]
+        return {"width": w, "height": h, "sensor": "Pakon", "has_thumbnail": False}
+
     def load(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
         file_size = os.path.getsize(file_path)
         spec = next(s for s in self.PAKON_SPECS if abs(file_size - s["size"]) < 1024)
         h, w = spec["res"]
         expected_pixels = h * w * 3
 
-        with open(file_path, "rb") as f:
-            data = np.fromfile(f, dtype="<u2", count=expected_pixels)
+        # Mapped, not read: frames are only materialized by postprocess()
+        data: np.ndarray = np.memmap(
+            file_path, dtype="<u2", mode="r", shape=(expected_pixels,)
+        )
 
         # Heuristic: Detect Planar vs Interleaved layout
         # In planar, adjacent pixels are from the same channel (similar values).
@@ -52,6 +59,4 @@ class PakonLoader(IImageLoader):
             data = data.reshape((3, h, w)).transpose((1, 2, 0))
 
         metadata = {"orientation": 0}
-        return NonStandardFileWrapper(
-            uint16_to_float32(np.ascontiguousarray(data))
-        ), metadata
+        return NonStandardFileWrapper(data), metadata
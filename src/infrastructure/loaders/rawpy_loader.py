@@ -18,3 +18,29 @@ class RawpyLoader(IImageLoader):
         }
 
         return raw, metadata
+
+    def probe(self, file_path: str) -> dict:
+        raw = rawpy.RawPy()
+        try:
+            # Header only: no unpack of the sensor data
+            raw.open_file(file_path)
+            pattern = raw.raw_pattern
+            if pattern is None:
+                sensor = "Linear"
+            elif pattern.shape == (6, 6):
+                sensor = "X-Trans"
+            else:
+                sensor = "Bayer"
+            try:
+                raw.extract_thumb()
+                has_thumbnail = True
+            except Exception:
+                has_thumbnail = False
+            return {
+                "width": int(raw.sizes.width),
+                "height": int(raw.sizes.height),
+                "sensor": sensor,
+                "has_thumbnail": has_thumbnail,
+            }
+        finally:
+            raw.close()
@@ -1,13 +1,75 @@
 import numpy as np
-import imageio.v3 as iio
-from typing import Any, ContextManager, Tuple
+import tifffile
+from typing import Any, ContextManager, Dict, Optional, Tuple
 from src.domain.interfaces import IImageLoader
+from src.kernel.system.config import APP_CONFIG
 from src.kernel.image.logic import uint8_to_float32, uint16_to_float32
 
+Region = Tuple[int, int, int, int]
+
+
+def _native(data: np.ndarray) -> np.ndarray:
+    """
+    Big-endian (Motorola) TIFFs are memory-mapped as '>u2'; swap just the
+    requested region so dtype checks and the numba kernels see native data.
+    """
+    if data.dtype.isnative:
+        return data
+    return data.astype(data.dtype.newbyteorder("="))
+
+
+def _quantize(data: np.ndarray, bps: int) -> np.ndarray:
+    """
+    uint8 / uint16 / float [0, 1] -> contiguous uint16 (bps 16) or uint8.
+    Already matching contiguous data (e.g. a memmap) is returned as is.
+    """
+    data = _native(data)
+    if data.dtype == np.uint16:
+        if bps == 16:
+            return np.ascontiguousarray(data)
+        return (data // 257).astype(np.uint8)
+    if data.dtype == np.uint8:
+        if bps == 16:
+            return data.astype(np.uint16) * np.uint16(257)
+        return np.ascontiguousarray(data)
+    data = np.clip(data, 0.0, 1.0)
+    if bps == 16:
+        return (data * 65535.0).astype(np.uint16)
+    return (data * 255.0).astype(np.uint8)
+
+
+def _to_float32(data: np.ndarray) -> np.ndarray:
+    data = _native(data)
+    if data.dtype == np.uint16:
+        return uint16_to_float32(np.ascontiguousarray(data))
+    if data.dtype == np.uint8:
+        return uint8_to_float32(np.ascontiguousarray(data))
+    res: np.ndarray = np.clip(data, 0.0, 1.0, dtype=np.float32)
+    return res
+
+
+def _rgb_view(data: np.ndarray) -> np.ndarray:
+    """
+    HxW / HxWx1 / HxWx4+ -> HxWx3 view.
+    """
+    if data.ndim == 2:
+        data = data[..., None]
+    if data.shape[2] == 1:
+        return np.broadcast_to(data, (*data.shape[:2], 3))
+    return data[..., :3]
+
+
+def _crop(data: np.ndarray, step: int, region: Optional[Region]) -> np.ndarray:
+    if region is not None:
+        y1, y2, x1, x2 = region
+        data = data[y1:y2, x1:x2]
+    return data[::step, ::step] if step > 1 else data
+
 
 class NonStandardFileWrapper:
     """
     numpy -> rawpy-like interface.
+    Holds float32 [0, 1] or uint16 data; uint16 may be a read-only memmap view.
     """
 
     def __init__(self, data: np.ndarray):
@@ -19,16 +81,116 @@ class NonStandardFileWrapper:
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         pass
 
+    def read(self, step: int = 1, region: Optional[Region] = None) -> np.ndarray:
+        """
+        Strided view of (y1, y2, x1, x2) or the whole frame. No copy.
+        """
+        return _crop(self.data, step, region)
+
     def postprocess(self, **kwargs: Any) -> np.ndarray:
         bps = kwargs.get("output_bps", 8)
-        half_size = kwargs.get("half_size", False)
-        data = self.data
-        if half_size:
-            data = data[::2, ::2]
+        data = self.read(step=2 if kwargs.get("half_size", False) else 1)
+        return _quantize(data, bps)
 
-        if bps == 16:
-            return (data * 65535.0).astype(np.uint16)
-        return (data * 255.0).astype(np.uint8)
+
+class TiffFileWrapper:
+    """
+    Lazy tifffile -> rawpy-like interface.
+    Uncompressed levels are memory-mapped, compressed ones decoded (threaded)
+    on first use. Reduced resolution levels (SubIFDs) serve half_size reads.
+    """
+
+    def __init__(self, tif: tifffile.TiffFile):
+        self._tif = tif
+        self._series = tif.series[0]
+        self._levels: Dict[int, np.ndarray] = {}
+
+    def __enter__(self) -> "TiffFileWrapper":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        # Memmaps hold their own handle; returned views stay valid
+        self._tif.close()
+
+    @property
+    def level_shapes(self) -> Tuple[Tuple[int, int], ...]:
+        return tuple(self._yx(lvl) for lvl in self._series.levels)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.level_shapes[0]
+
+    @staticmethod
+    def _yx(series: Any) -> Tuple[int, int]:
+        axes = series.axes
+        return int(series.shape[axes.index("Y")]), int(series.shape[axes.index("X")])
+
+    def best_level(self, min_size: int) -> int:
+        """
+        Smallest level whose long edge still covers min_size.
+        """
+        best = 0
+        for i, (h, w) in enumerate(self.level_shapes):
+            if max(h, w) >= min_size:
+                best = i
+        return best
+
+    def _level(self, level: int) -> np.ndarray:
+        """
+        HxWxS array of a level, memmap-backed when the layout allows.
+        """
+        arr = self._levels.get(level)
+        if arr is not None:
+            return arr
+
+        series = self._series.levels[level]
+        if series.dataoffset is not None:
+            arr = np.memmap(
+                self._tif.filehandle.path,
+                dtype=np.dtype(series.dtype).newbyteorder(self._tif.byteorder),
+                mode="r",
+                offset=series.dataoffset,
+                shape=series.shape,
+            )
+        else:
+            arr = series.asarray(maxworkers=APP_CONFIG.max_workers)
+
+        # Leading page/sample axes -> first image; planar -> interleaved view
+        axes = series.axes
+        while len(axes) > 2 and axes[0] not in "YXS":
+            arr, axes = arr[0], axes[1:]
+        if "S" not in axes:
+            arr, axes = arr[..., None], axes + "S"
+        arr = arr.transpose([axes.index(a) for a in "YXS"])
+
+        self._levels[level] = arr
+        return arr
+
+    def read(
+        self, step: int = 1, region: Optional[Region] = None, level: int = 0
+    ) -> np.ndarray:
+        """
+        HxWx3 view of (y1, y2, x1, x2) in level coordinates. Source dtype.
+        """
+        return _rgb_view(_crop(self._level(level), step, region))
+
+    def read_linear(
+        self, region: Optional[Region] = None, level: int = 0
+    ) -> np.ndarray:
+        """
+        float32 [0, 1] HxWx3 of just the requested region.
+        """
+        return _to_float32(self.read(region=region, level=level))
+
+    def postprocess(self, **kwargs: Any) -> np.ndarray:
+        bps = kwargs.get("output_bps", 8)
+        if kwargs.get("half_size", False):
+            h, w = self.shape
+            level = self.best_level((max(h, w) + 1) // 2)
+            data = self.read(step=2 if level == 0 else 1, level=level)
+        else:
+            data = self.read()
+        return _quantize(data, bps)
 
 
 class TiffLoader(IImageLoader):
@@ -36,19 +198,18 @@ class TiffLoader(IImageLoader):
     Loader for TIFF scans.
     """
 
-    def load(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
-        img = iio.imread(file_path)
-        if img.ndim == 2:
-            img = np.stack([img] * 3, axis=-1)
-        elif img.ndim == 3 and img.shape[2] == 4:
-            img = img[:, :, :3]
-
-        if img.dtype == np.uint8:
-            f32 = uint8_to_float32(np.ascontiguousarray(img))
-        elif img.dtype == np.uint16:
-            f32 = uint16_to_float32(np.ascontiguousarray(img))
-        else:
-            f32 = np.clip(img.astype(np.float32), 0, 1)
+    def probe(self, file_path: str) -> dict:
+        with TiffFileWrapper(tifffile.TiffFile(file_path)) as tif:
+            h, w = tif.shape
+            # A stored reduced level serves thumbnails without a full decode
+            has_thumbnail = len(tif.level_shapes) > 1
+        return {
+            "width": w,
+            "height": h,
+            "sensor": "Scan",
+            "has_thumbnail": has_thumbnail,
+        }
 
+    def load(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
         metadata = {"orientation": 0, "color_space": "Adobe RGB"}
-        return NonStandardFileWrapper(f32), metadata
+        return TiffFileWrapper(tifffile.TiffFile(file_path)), metadata
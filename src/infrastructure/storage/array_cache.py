@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import uuid
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArrayDiskCache:
+    """
+    Size-capped directory of .npy arrays (+ JSON metadata) with LRU pruning.
+    Entries are memory-mapped on read; recency is tracked via file mtime.
+    """
+
+    def __init__(self, root: str, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.root, key)
+        return f"{base}.npy", f"{base}.json"
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+        """
+        Read-only memory map of the stored array and its metadata.
+        """
+        npy_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            arr = np.load(npy_path, mmap_mode="r")
+            os.utime(npy_path)
+            return arr, meta
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self.remove(key)
+            return None
+
+    def put(self, key: str, arr: np.ndarray, meta: Dict[str, Any]) -> None:
+        """
+        Atomic write (temp file + rename), then prunes to the size cap.
+        """
+        if arr.nbytes > self.max_bytes:
+            return
+        npy_path, meta_path = self._paths(key)
+        tmp = os.path.join(self.root, f".{uuid.uuid4().hex}")
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            np.save(f"{tmp}.npy", np.ascontiguousarray(arr))
+            with open(f"{tmp}.json", "w") as f:
+                json.dump(meta, f, default=str)
+            # Metadata last: get() treats it as the commit marker
+            os.replace(f"{tmp}.npy", npy_path)
+            os.replace(f"{tmp}.json", meta_path)
+        except Exception as e:
+            logger.error(f"Cache write failed for {key}: {e}")
+            for p in (f"{tmp}.npy", f"{tmp}.json"):
+                if os.path.exists(p):
+                    os.remove(p)
+            return
+        self.prune()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        for p in self._paths(key):
+            try:
+                os.remove(p)
+            except OSError:
+                # Missing, or still mapped by a reader (Windows)
+                pass
+
+    def prune(self) -> None:
+        """
+        Evicts least recently used entries until the cap holds.
+        """
+        with self._lock:
+            try:
+                names = os.listdir(self.root)
+            except FileNotFoundError:
+                return
+            entries = []
+            total = 0
+            for name in names:
+                if not name.endswith(".npy") or name.startswith("."):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.root, name))
+                except FileNotFoundError:
+                    # Removed since listdir (reader or another process)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name[:-4]))
+                total += stat.st_size
+
+            for _, size, key in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._remove(key)
+                total -= size
+
+    @property
+    def total_bytes(self) -> int:
+        try:
+            return sum(
+                os.path.getsize(os.path.join(self.root, n))
+                for n in os.listdir(self.root)
+                if n.endswith(".npy")
+            )
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite's default bound-parameter limit is 999
+_LOOKUP_CHUNK = 900
+
+
+@dataclass(frozen=True)
+class FileRecord:
+    """
+    Indexed facts about one library file. size/mtime decide staleness.
+    """
+
+    path: str
+    file_hash: str
+    size: int
+    mtime: float
+    width: int = 0
+    height: int = 0
+    sensor: str = ""
+    has_thumbnail: bool = False
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    def to_file_info(self) -> dict:
+        """Session file list entry."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "hash": self.file_hash,
+            "size": self.size,
+            "mtime": self.mtime,
+            "width": self.width,
+            "height": self.height,
+            "sensor": self.sensor,
+            "has_thumbnail": self.has_thumbnail,
+        }
+
+
+class FileCatalog:
+    """
+    SQLite index of library files (path -> hash, size, mtime, header facts).
+    """
+
+    _COLUMNS = "path, file_hash, size, mtime, width, height, sensor, has_thumbnail"
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+
+    def initialize(self) -> None:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_index (
+                    path TEXT PRIMARY KEY,
+                    folder TEXT,
+                    name TEXT,
+                    file_hash TEXT,
+                    size INTEGER,
+                    mtime REAL,
+                    width INTEGER,
+                    height INTEGER,
+                    sensor TEXT,
+                    has_thumbnail INTEGER
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_file_index_folder ON file_index (folder)"
+            )
+
+    @staticmethod
+    def _record(row: tuple) -> FileRecord:
+        return FileRecord(
+            path=row[0],
+            file_hash=row[1],
+            size=int(row[2]),
+            mtime=float(row[3]),
+            width=int(row[4] or 0),
+            height=int(row[5] or 0),
+            sensor=row[6] or "",
+            has_thumbnail=bool(row[7]),
+        )
+
+    def upsert(self, records: Iterable[FileRecord]) -> None:
+        rows = [
+            (
+                r.path,
+                os.path.dirname(r.path),
+                r.name,
+                r.file_hash,
+                r.size,
+                r.mtime,
+                r.width,
+                r.height,
+                r.sensor,
+                int(r.has_thumbnail),
+            )
+            for r in records
+        ]
+        if not rows:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_index "
+                "(path, folder, name, file_hash, size, mtime, width, height, "
+                "sensor, has_thumbnail) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def lookup(self, paths: List[str]) -> Dict[str, FileRecord]:
+        """
+        Stored records for paths (possibly stale; compare size/mtime).
+        """
+        res: Dict[str, FileRecord] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(paths), _LOOKUP_CHUNK):
+                chunk = paths[i : i + _LOOKUP_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT {self._COLUMNS} FROM file_index WHERE path IN ({marks})",
+                    chunk,
+                )
+                for row in cursor:
+                    res[row[0]] = self._record(row)
+        return res
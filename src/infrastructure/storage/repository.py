@@ -5,6 +5,9 @@ from typing import Any, Optional
 from src.domain.models import WorkspaceConfig
 from src.domain.interfaces import IRepository
 
+# Stored analysis variants (geometry, decode, draft/full scale) per file and kind
+ANALYSIS_ROWS_PER_KIND = 4
+
 
 class StorageRepository(IRepository):
     """
@@ -28,6 +31,15 @@ class StorageRepository(IRepository):
                     settings_json TEXT
                 )
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_analysis (
+                    file_hash TEXT,
+                    kind TEXT,
+                    params_key TEXT,
+                    data BLOB,
+                    PRIMARY KEY (file_hash, kind, params_key)
+                )
+            """)
 
         with sqlite3.connect(self.settings_db_path) as conn:
             conn.execute("""
@@ -57,6 +69,41 @@ class StorageRepository(IRepository):
                 return WorkspaceConfig.from_flat_dict(data)
         return None
 
+    def save_analysis(
+        self, file_hash: str, kind: str, params_key: str, data: bytes
+    ) -> None:
+        """
+        Stores an analysis artifact blob (bounds, ROI, ...) for a file, keeping
+        the newest ANALYSIS_ROWS_PER_KIND parameter keys per (file, kind).
+        """
+        with sqlite3.connect(self.edits_db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO file_analysis (file_hash, kind, params_key, data) "
+                "VALUES (?, ?, ?, ?)",
+                (file_hash, kind, params_key, sqlite3.Binary(data)),
+            )
+            # REPLACE re-inserts, so rowid order is save order
+            conn.execute(
+                "DELETE FROM file_analysis WHERE file_hash = ? AND kind = ? "
+                "AND rowid NOT IN (SELECT rowid FROM file_analysis "
+                "WHERE file_hash = ? AND kind = ? ORDER BY rowid DESC LIMIT ?)",
+                (file_hash, kind, file_hash, kind, ANALYSIS_ROWS_PER_KIND),
+            )
+
+    def load_analysis(
+        self, file_hash: str, kind: str, params_key: str
+    ) -> Optional[bytes]:
+        with sqlite3.connect(self.edits_db_path) as conn:
+            cursor = conn.execute(
+                "SELECT data FROM file_analysis "
+                "WHERE file_hash = ? AND kind = ? AND params_key = ?",
+                (file_hash, kind, params_key),
+            )
+            row = cursor.fetchone()
+            if row:
+                return bytes(row[0])
+        return None
+
     def save_global_setting(self, key: str, value: Any) -> None:
         with sqlite3.connect(self.settings_db_path) as conn:
             conn.execute(
@@ -30,3 +30,11 @@ def calculate_config_hash(config: Any) -> str:
 
     serialized = json.dumps(data, sort_keys=True, default=str)
     return hashlib.md5(serialized.encode("utf-8")).hexdigest()
+
+
+def chain_config_hash(parent_hash: str, config: Any) -> str:
+    """
+    Stage hash that also captures every upstream stage.
+    """
+    combined = f"{parent_hash}:{calculate_config_hash(config)}"
+    return hashlib.md5(combined.encode("utf-8")).hexdigest()
@@ -1,24 +1,217 @@
-from typing import Optional
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, Tuple, Dict, Any, TypeVar
+import numpy as np
 from src.kernel.caching.logic import CacheEntry
 
+# (source_hash, stage, config_hash)
+CacheKey = Tuple[str, str, str]
+
+DEFAULT_CACHE_BUDGET_BYTES = 1024 * 1024 * 1024
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """
+    Cache effectiveness counters.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _owner(arr: np.ndarray) -> np.ndarray:
+    # Views keep their whole base buffer alive
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def entry_buffers(entry: CacheEntry, include_data: bool = True) -> Dict[int, int]:
+    """
+    Distinct buffers an entry keeps alive: {id(owner array): nbytes}.
+    """
+    arrays = [entry.data] if include_data else []
+    arrays += [v for v in entry.metrics.values() if isinstance(v, np.ndarray)]
+    buffers: Dict[int, int] = {}
+    skip = id(_owner(entry.data))
+    for arr in arrays:
+        owner = _owner(arr)
+        if not include_data and id(owner) == skip:
+            continue
+        buffers[id(owner)] = int(owner.nbytes)
+    return buffers
+
+
+def estimate_entry_bytes(entry: CacheEntry, include_data: bool = True) -> int:
+    """
+    Approximate resident size of an entry (image + array metrics).
+    """
+    return sum(entry_buffers(entry, include_data).values())
+
 
 class PipelineCache:
     """
-    Stores intermediate stage results for the active image.
+    Byte-budgeted LRU of intermediate stage results across multiple images.
     """
 
-    source_hash: str = ""
-    process_mode: str = ""
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BUDGET_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # Buffers shared between entries (e.g. the retouch_source capture in
+        # every downstream stage) are counted once, by reference count
+        self._buffers: Dict[CacheKey, List[Tuple[int, int]]] = {}
+        self._refs: Dict[int, int] = {}
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(
+        self, source_hash: str, stage: str, config_hash: str
+    ) -> Optional[CacheEntry]:
+        key = (source_hash, stage, config_hash)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def put(
+        self,
+        source_hash: str,
+        stage: str,
+        config_hash: str,
+        entry: CacheEntry,
+        shares_data: bool = False,
+    ) -> None:
+        """
+        Stores an entry. `shares_data` marks buffers owned elsewhere
+        (e.g. pass-through stages) so they do not count against the budget.
+        """
+        key = (source_hash, stage, config_hash)
+        buffers = entry_buffers(entry, include_data=not shares_data)
+        if sum(buffers.values()) > self.max_bytes:
+            # Never let a single oversized frame flush the whole cache
+            return
+
+        if key in self._entries:
+            self._release(key)
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._buffers[key] = list(buffers.items())
+        for buf_id, nbytes in self._buffers[key]:
+            if self._refs.get(buf_id, 0) == 0:
+                self._total_bytes += nbytes
+            self._refs[buf_id] = self._refs.get(buf_id, 0) + 1
+        self._evict()
+
+    def _release(self, key: CacheKey) -> None:
+        for buf_id, nbytes in self._buffers.pop(key):
+            self._refs[buf_id] -= 1
+            if self._refs[buf_id] == 0:
+                del self._refs[buf_id]
+                self._total_bytes -= nbytes
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, _ = self._entries.popitem(last=False)
+            self._release(key)
+            self.stats.evictions += 1
+
+    def invalidate_source(self, source_hash: str) -> None:
+        """
+        Drops every stage cached for a given image.
+        """
+        for key in [k for k in self._entries if k[0] == source_hash]:
+            del self._entries[key]
+            self._release(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "hit_rate": self.stats.hit_rate,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buffers.clear()
+        self._refs.clear()
+        self._total_bytes = 0
+
+
+class KeyedLRU(Generic[V]):
+    """
+    Small thread-safe LRU for derived artifacts (LUTs) keyed by config hash.
+    max_bytes: optional cap on the summed nbytes of array values; a value
+    larger than the cap on its own is returned but not kept.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _nbytes(value: Any) -> int:
+        return int(getattr(value, "nbytes", 0))
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self._nbytes(v) for v in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, key: str, factory: Callable[[], V]) -> V:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
 
-    # Checkpoints
-    base: Optional[CacheEntry] = None
-    exposure: Optional[CacheEntry] = None
-    retouch: Optional[CacheEntry] = None
-    lab: Optional[CacheEntry] = None
+        # Built outside the lock; a concurrent duplicate build is harmless
+        value = factory()
+        if self.max_bytes is not None and self._nbytes(value) > self.max_bytes:
+            return value
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None
+                and sum(self._nbytes(v) for v in self._entries.values())
+                > self.max_bytes
+            ):
+                self._entries.popitem(last=False)
+        return value
 
     def clear(self) -> None:
-        self.base = None
-        self.exposure = None
-        self.retouch = None
-        self.lab = None
-        self.source_hash = ""
+        with self._lock:
+            self._entries.clear()
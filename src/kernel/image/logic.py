@@ -230,9 +230,14 @@ def get_luminance(img: np.ndarray) -> np.ndarray:
     return LUMA_R * img[..., 0] + LUMA_G * img[..., 1] + LUMA_B * img[..., 2]
 
 
+# Prefix of the one-off hash returned for unreadable files
+HASH_ERROR_PREFIX = "err_"
+
+
 def calculate_file_hash(file_path: str) -> str:
     """
     Fingerprint using file size + head/tail samples.
+    Unreadable files get a unique HASH_ERROR_PREFIX placeholder.
     """
     try:
         file_size = os.path.getsize(file_path)
@@ -250,7 +255,7 @@ def calculate_file_hash(file_path: str) -> str:
         import uuid
 
         logger.error(f"Hash error for {file_path}: {e}")
-        return f"err_{uuid.uuid4()}"
+        return f"{HASH_ERROR_PREFIX}{uuid.uuid4()}"
 
 
 def prepare_thumbnail(img: Any, size: int) -> Any:
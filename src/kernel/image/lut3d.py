@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+import numpy as np
+from numba import njit, prange  # type: ignore
+from src.domain.types import ImageBuffer
+from src.kernel.image.validation import ensure_image
+
+
+@dataclass(frozen=True)
+class Lut3D:
+    """
+    RGB -> RGB lattice over [0, 1]^3, indexed table[r, g, b].
+    shaper_gamma: lattice is spaced in x^(1 / gamma), denser in the shadows.
+    """
+
+    table: np.ndarray
+    title: str = "NegPy"
+    shaper_gamma: float = 1.0
+
+    @property
+    def size(self) -> int:
+        return int(self.table.shape[0])
+
+
+@njit(inline="always")
+def _lattice_coord(val: float, last: int, inv_gamma: float) -> Tuple[int, float]:
+    if val < 0.0:
+        val = 0.0
+    elif val > 1.0:
+        val = 1.0
+    if inv_gamma == 0.5:
+        val = np.sqrt(val)
+    elif inv_gamma != 1.0:
+        val = val**inv_gamma
+    pos = val * last
+    idx = int(pos)
+    if idx >= last:
+        idx = last - 1
+    return idx, pos - idx
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_lut3d_tetrahedral_jit(
+    img: np.ndarray, table: np.ndarray, inv_gamma: float
+) -> np.ndarray:
+    """
+    Tetrahedral interpolation: picks 1 of 6 tetrahedra per cube, 4 lattice reads.
+    """
+    h, w, _ = img.shape
+    last = table.shape[0] - 1
+    res = np.empty_like(img)
+
+    for y in prange(h):
+        for x in range(w):
+            ir, dr = _lattice_coord(img[y, x, 0], last, inv_gamma)
+            ig, dg = _lattice_coord(img[y, x, 1], last, inv_gamma)
+            ib, db = _lattice_coord(img[y, x, 2], last, inv_gamma)
+
+            # Corner offsets of the second/third vertex plus barycentric weights
+            if dr >= dg:
+                if dg >= db:
+                    r1, g1, b1, r2, g2, b2 = 1, 0, 0, 1, 1, 0
+                    w0, w1, w2, w3 = 1.0 - dr, dr - dg, dg - db, db
+                elif dr >= db:
+                    r1, g1, b1, r2, g2, b2 = 1, 0, 0, 1, 0, 1
+                    w0, w1, w2, w3 = 1.0 - dr, dr - db, db - dg, dg
+                else:
+                    r1, g1, b1, r2, g2, b2 = 0, 0, 1, 1, 0, 1
+                    w0, w1, w2, w3 = 1.0 - db, db - dr, dr - dg, dg
+            else:
+                if db >= dg:
+                    r1, g1, b1, r2, g2, b2 = 0, 0, 1, 0, 1, 1
+                    w0, w1, w2, w3 = 1.0 - db, db - dg, dg - dr, dr
+                elif db >= dr:
+                    r1, g1, b1, r2, g2, b2 = 0, 1, 0, 0, 1, 1
+                    w0, w1, w2, w3 = 1.0 - dg, dg - db, db - dr, dr
+                else:
+                    r1, g1, b1, r2, g2, b2 = 0, 1, 0, 1, 1, 0
+                    w0, w1, w2, w3 = 1.0 - dg, dg - dr, dr - db, db
+
+            for ch in range(3):
+                res[y, x, ch] = (
+                    w0 * table[ir, ig, ib, ch]
+                    + w1 * table[ir + r1, ig + g1, ib + b1, ch]
+                    + w2 * table[ir + r2, ig + g2, ib + b2, ch]
+                    + w3 * table[ir + 1, ig + 1, ib + 1, ch]
+                )
+    return res
+
+
+def identity_lattice(size: int) -> ImageBuffer:
+    """
+    Lattice points as an image (size, size * size, 3), row r, column g * size + b.
+    Pointwise stages can be run on it directly to bake a LUT.
+    """
+    axis = np.linspace(0.0, 1.0, size, dtype=np.float32)
+    r, g, b = np.meshgrid(axis, axis, axis, indexing="ij")
+    grid = np.stack([r, g, b], axis=-1).reshape(size, size * size, 3)
+    return ensure_image(np.ascontiguousarray(grid))
+
+
+def bake_lut3d(
+    transform: Callable[[ImageBuffer], ImageBuffer],
+    size: int,
+    title: str = "NegPy",
+    shaper_gamma: float = 1.0,
+) -> Lut3D:
+    """
+    Samples a pointwise RGB transform on a size^3 lattice.
+    """
+    lattice = identity_lattice(size)
+    if shaper_gamma != 1.0:
+        lattice = ensure_image(lattice**shaper_gamma)
+    res = transform(lattice)
+    table = np.ascontiguousarray(res.reshape(size, size, size, 3), dtype=np.float32)
+    return Lut3D(table=table, title=title, shaper_gamma=shaper_gamma)
+
+
+def apply_lut3d(img: ImageBuffer, lut: Lut3D) -> ImageBuffer:
+    return ensure_image(
+        _apply_lut3d_tetrahedral_jit(
+            np.ascontiguousarray(img, dtype=np.float32),
+            lut.table,
+            1.0 / lut.shaper_gamma,
+        )
+    )
+
+
+def format_cube(lut: Lut3D) -> str:
+    """
+    Adobe/Resolve .cube text (red varies fastest).
+    """
+    if lut.shaper_gamma != 1.0:
+        raise ValueError(".cube lattices must be linearly spaced (shaper_gamma=1)")
+    lines: List[str] = [
+        f'TITLE "{lut.title}"',
+        f"LUT_3D_SIZE {lut.size}",
+        "DOMAIN_MIN 0.0 0.0 0.0",
+        "DOMAIN_MAX 1.0 1.0 1.0",
+    ]
+    # table[r, g, b] -> iterate b, g, r
+    rows = np.transpose(lut.table, (2, 1, 0, 3)).reshape(-1, 3)
+    lines.extend(f"{r:.6f} {g:.6f} {b:.6f}" for r, g, b in rows)
+    return "\n".join(lines) + "\n"
+
+
+def write_cube(path: str, lut: Lut3D) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(format_cube(lut))
+
+
+def read_cube(path: str) -> Lut3D:
+    """
+    Parses a 3D .cube file (default 0-1 domain).
+    """
+    size = 0
+    title = ""
+    values: List[List[float]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            key = line.split()[0]
+            if key == "TITLE":
+                title = line[len("TITLE") :].strip().strip('"')
+            elif key == "LUT_3D_SIZE":
+                size = int(line.split()[1])
+            elif key == "LUT_1D_SIZE":
+                raise ValueError("1D .cube files are not supported")
+            elif key not in ("DOMAIN_MIN", "DOMAIN_MAX"):
+                values.append([float(v) for v in line.split()[:3]])
+
+    if size < 2 or len(values) != size**3:
+        raise ValueError(f"Malformed .cube: size {size}, {len(values)} entries")
+
+    data = np.array(values, dtype=np.float32).reshape(size, size, size, 3)
+    table = np.ascontiguousarray(np.transpose(data, (2, 1, 0, 3)))
+    return Lut3D(table=table, title=title)
@@ -0,0 +1,56 @@
+import math
+import zlib
+from typing import Optional
+from numba import njit  # type: ignore
+
+# Counter-based grain: a pure function of (seed, x, y, channel), so preview,
+# export, tiles and the WGSL shaders (retouch.wgsl) draw the same values
+# without noise buffers. Keep both implementations in sync.
+
+_MASK32 = 0xFFFFFFFF
+_INV_2_24 = 1.0 / 16777216.0
+
+
+def noise_seed(file_hash: Optional[str]) -> int:
+    """
+    32-bit grain seed for a file.
+    """
+    if not file_hash:
+        return 0
+    return zlib.crc32(file_hash.encode()) & _MASK32
+
+
+@njit(inline="always")
+def _mix32(x: int) -> int:
+    # lowbias32 (C. Wellons)
+    x &= _MASK32
+    x ^= x >> 16
+    x = (x * 0x7FEB352D) & _MASK32
+    x ^= x >> 15
+    x = (x * 0x846CA68B) & _MASK32
+    x ^= x >> 16
+    return x
+
+
+@njit(inline="always")
+def hash_u32(seed: int, x: int, y: int, ch: int) -> int:
+    # Golden-ratio offset keeps the all-zero counter away from hash 0
+    return _mix32(seed + _mix32(x + _mix32(y + _mix32(ch + 0x9E3779B9))))
+
+
+@njit(inline="always")
+def hash_uniform(seed: int, x: int, y: int, ch: int) -> float:
+    """
+    Uniform in [0, 1) with 24-bit resolution.
+    """
+    return (hash_u32(seed, x, y, ch) >> 8) * _INV_2_24
+
+
+@njit(inline="always")
+def hash_gaussian(seed: int, x: int, y: int, ch: int) -> float:
+    """
+    Standard normal via Box-Muller over streams 2 * ch and 2 * ch + 1.
+    """
+    u1 = ((hash_u32(seed, x, y, 2 * ch) >> 8) + 1) * _INV_2_24
+    u2 = (hash_u32(seed, x, y, 2 * ch + 1) >> 8) * _INV_2_24
+    return math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from src.infrastructure.loaders.factory import loader_factory
+from src.infrastructure.storage.catalog import FileCatalog, FileRecord
+from src.kernel.image.logic import HASH_ERROR_PREFIX, calculate_file_hash
+from src.kernel.system.config import APP_CONFIG
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _stat(path: str) -> Optional[Tuple[int, float]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime
+
+
+def extract_record(path: str, size: int, mtime: float) -> FileRecord:
+    """
+    Hash plus loader header facts. Unreadable headers index with zero size;
+    unreadable files carry a HASH_ERROR_PREFIX hash and are not catalogued.
+    """
+    file_hash = calculate_file_hash(path)
+    try:
+        facts = loader_factory.probe(path)
+    except Exception as e:
+        logger.warning(f"Probe failed for {path}: {e}")
+        facts = {}
+    return FileRecord(
+        path=path,
+        file_hash=file_hash,
+        size=size,
+        mtime=mtime,
+        width=int(facts.get("width", 0)),
+        height=int(facts.get("height", 0)),
+        sensor=str(facts.get("sensor", "")),
+        has_thumbnail=bool(facts.get("has_thumbnail", False)),
+    )
+
+
+class LibraryIndexer:
+    """
+    Keeps the catalog current for a set of files.
+    Unchanged files (same size and mtime) are served from the catalog;
+    new or modified ones are hashed and probed on a thread pool.
+    """
+
+    def __init__(self, catalog: FileCatalog, max_workers: int = 0) -> None:
+        self.catalog = catalog
+        self.max_workers = max_workers or APP_CONFIG.max_workers
+
+    def index(
+        self, paths: List[str], progress: Optional[ProgressCallback] = None
+    ) -> List[FileRecord]:
+        """
+        Records in input order; missing files are skipped.
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        stats = {p: _stat(p) for p in paths}
+        known = self.catalog.lookup([p for p, st in stats.items() if st is not None])
+
+        stale = []
+        for path, st in stats.items():
+            rec = known.get(path)
+            if st is None:
+                continue
+            if rec is None or (rec.size, rec.mtime) != st:
+                stale.append((path, st))
+
+        fresh: List[FileRecord] = []
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [
+                    pool.submit(extract_record, path, size, mtime)
+                    for path, (size, mtime) in stale
+                ]
+                for i, fut in enumerate(futures):
+                    fresh.append(fut.result())
+                    if progress:
+                        progress(i + 1, len(stale))
+            # Placeholder hashes are not persisted, so the file is re-probed
+            self.catalog.upsert(
+                r for r in fresh if not r.file_hash.startswith(HASH_ERROR_PREFIX)
+            )
+            known.update({r.path: r for r in fresh})
+
+        return [known[p] for p in paths if p in known and stats[p] is not None]
@@ -0,0 +1,74 @@
+import os
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig
+from src.domain.types import ImageBuffer
+from src.features.lab.processor import SaturationProcessor, SpectralCrosstalkProcessor
+from src.features.toning.processor import ToningProcessor
+from src.kernel.caching.logic import calculate_config_hash
+from src.kernel.caching.manager import KeyedLRU
+from src.kernel.image.lut3d import Lut3D, bake_lut3d, write_cube
+
+CUBE_LUT_SIZE = 33
+LOOK_LUT_CACHE_SIZE = 16
+
+_LOOK_CACHE: KeyedLRU[Lut3D] = KeyedLRU(LOOK_LUT_CACHE_SIZE)
+
+
+def _look_transform(settings: WorkspaceConfig, img: ImageBuffer) -> ImageBuffer:
+    """
+    Colour stages applied to a positive: crosstalk -> saturation -> paper/toning.
+    CLAHE, sharpening and the B&W black point depend on neighbourhood or frame
+    statistics and cannot be expressed as a LUT.
+    """
+    h, w = img.shape[:2]
+    ctx = PipelineContext(
+        original_size=(h, w), scale_factor=1.0, process_mode=settings.process_mode
+    )
+    res = SpectralCrosstalkProcessor(settings.lab).process(img, ctx)
+    res = SaturationProcessor(settings.lab).process(res, ctx)
+    return ToningProcessor(settings.toning).chain(ctx).apply(res)
+
+
+def look_lut_key(
+    settings: WorkspaceConfig, size: int, shaper_gamma: float = 1.0
+) -> str:
+    return calculate_config_hash(
+        (
+            settings.process_mode,
+            settings.lab.color_separation,
+            settings.lab.crosstalk_matrix,
+            settings.lab.saturation,
+            settings.toning,
+            size,
+            shaper_gamma,
+        )
+    )
+
+
+def get_look_lut(
+    settings: WorkspaceConfig, size: int = CUBE_LUT_SIZE, shaper_gamma: float = 1.0
+) -> Lut3D:
+    """
+    Baked colour look for the settings, cached by the config fields it reads.
+    """
+    return _LOOK_CACHE.get_or_create(
+        look_lut_key(settings, size, shaper_gamma),
+        lambda: bake_lut3d(
+            lambda img: _look_transform(settings, img),
+            size,
+            title="NegPy look",
+            shaper_gamma=shaper_gamma,
+        ),
+    )
+
+
+def export_look_cube(
+    settings: WorkspaceConfig, path: str, size: int = CUBE_LUT_SIZE
+) -> str:
+    """
+    Writes the colour look as a standard (linearly sampled) 3D .cube.
+    """
+    if not path.lower().endswith(".cube"):
+        path = f"{os.path.splitext(path)[0]}.cube"
+    write_cube(path, get_look_lut(settings, size))
+    return path
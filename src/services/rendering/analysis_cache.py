@@ -0,0 +1,148 @@
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from src.domain.interfaces import IRepository
+from src.domain.models import WorkspaceConfig
+from src.domain.types import ROI
+from src.features.exposure.normalization import LogNegativeBounds
+from src.features.exposure.processor import cached_log_bounds, seed_log_bounds
+from src.kernel.caching.logic import calculate_config_hash, chain_config_hash
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump to invalidate stored artifacts when an analysis algorithm changes
+ANALYSIS_VERSION = 1
+
+
+def encode_bounds(bounds: LogNegativeBounds) -> bytes:
+    return np.array(bounds.floors + bounds.ceils, dtype="<f8").tobytes()
+
+
+def decode_bounds(data: bytes) -> LogNegativeBounds:
+    v = np.frombuffer(data, dtype="<f8")
+    return LogNegativeBounds(
+        floors=(float(v[0]), float(v[1]), float(v[2])),
+        ceils=(float(v[3]), float(v[4]), float(v[5])),
+    )
+
+
+def encode_roi(roi: ROI) -> bytes:
+    return np.array(roi, dtype="<i4").tobytes()
+
+
+def decode_roi(data: bytes) -> ROI:
+    v = np.frombuffer(data, dtype="<i4")
+    return int(v[0]), int(v[1]), int(v[2]), int(v[3])
+
+
+class AnalysisCache:
+    """
+    Persists per-file analysis (autocrop ROI, log bounds) in the repository.
+    Artifacts are keyed by file hash plus everything they depend on, and reach
+    the engines as seeded metrics, so a reopened frame skips measurement.
+    """
+
+    def __init__(self, repo: IRepository) -> None:
+        self.repo = repo
+
+    @staticmethod
+    def params_keys(
+        settings: WorkspaceConfig,
+        shape: Tuple[int, ...],
+        scale_factor: float,
+        variant: str,
+    ) -> Dict[str, str]:
+        """
+        kind -> parameter key. variant: decode + backend (colour space, engine).
+        Only the fields the measurements read are hashed, so edits elsewhere in
+        geometry (or anywhere else) reuse the stored rows.
+        """
+        geo = settings.geometry
+        root = calculate_config_hash(
+            (
+                ANALYSIS_VERSION,
+                tuple(shape),
+                round(scale_factor, 6),
+                variant,
+                settings.exposure.use_camera_wb,
+                geo.rotation,
+                geo.fine_rotation,
+                geo.flip_horizontal,
+                geo.flip_vertical,
+            )
+        )
+        keys: Dict[str, str] = {}
+        if geo.manual_crop_rect:
+            crop = chain_config_hash(root, geo.manual_crop_rect)
+        else:
+            crop = chain_config_hash(root, (geo.autocrop_offset, geo.autocrop_ratio))
+            keys["autocrop_roi"] = crop
+        keys["log_bounds"] = chain_config_hash(crop, settings.exposure.analysis_buffer)
+        return keys
+
+    def seed(
+        self, file_hash: str, keys: Dict[str, str], settings: WorkspaceConfig
+    ) -> Dict[str, Any]:
+        """
+        Stored artifacts as pipeline metrics.
+        """
+        metrics: Dict[str, Any] = {}
+        try:
+            if "autocrop_roi" in keys:
+                data = self.repo.load_analysis(
+                    file_hash, "autocrop_roi", keys["autocrop_roi"]
+                )
+                if data is not None:
+                    metrics["autocrop_roi"] = decode_roi(data)
+            data = self.repo.load_analysis(file_hash, "log_bounds", keys["log_bounds"])
+            if data is not None:
+                seed_log_bounds(
+                    metrics,
+                    decode_bounds(data),
+                    settings.exposure.analysis_buffer,
+                    override=False,
+                )
+        except Exception as e:
+            logger.error(f"Analysis cache read failed: {e}")
+        return metrics
+
+    def store(
+        self,
+        file_hash: str,
+        keys: Dict[str, str],
+        settings: WorkspaceConfig,
+        metrics: Dict[str, Any],
+        seeded: Dict[str, Any],
+    ) -> None:
+        """
+        Persists artifacts resolved by a render that were not seeded.
+        """
+        blobs: List[Tuple[str, bytes]] = []
+        roi = metrics.get("autocrop_roi")
+        if "autocrop_roi" in keys and roi is not None and "autocrop_roi" not in seeded:
+            blobs.append(("autocrop_roi", encode_roi(roi)))
+        bounds = cached_log_bounds(metrics, settings.exposure.analysis_buffer)
+        if (
+            bounds is not None
+            and "log_bounds" not in seeded
+            and not metrics.get("log_bounds_override")
+        ):
+            blobs.append(("log_bounds", encode_bounds(bounds)))
+
+        try:
+            for kind, data in blobs:
+                self.repo.save_analysis(file_hash, kind, keys[kind], data)
+        except Exception as e:
+            logger.error(f"Analysis cache write failed: {e}")
+
+    @staticmethod
+    def merge(
+        seeded: Dict[str, Any], metrics: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Caller metrics take precedence over stored ones (e.g. roll bounds).
+        """
+        res = dict(seeded)
+        if metrics:
+            res.update(metrics)
+        return res
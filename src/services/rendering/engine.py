@@ -1,4 +1,4 @@
-from typing import Optional, Any, Callable, Tuple
+from typing import Optional, Dict
 from src.domain.types import ImageBuffer
 from src.domain.interfaces import PipelineContext
 from src.domain.models import WorkspaceConfig
@@ -7,53 +7,113 @@ from src.kernel.caching.logic import calculate_config_hash, CacheEntry
 from src.kernel.image.validation import ensure_image
 from src.kernel.system.logging import get_logger
 from src.features.geometry.processor import GeometryProcessor, CropProcessor
-from src.features.exposure.processor import NormalizationProcessor, PhotometricProcessor
+from src.features.exposure.processor import (
+    LogBoundsProcessor,
+    FusedPhotometricProcessor,
+)
 from src.features.toning.processor import ToningProcessor
-from src.features.lab.processor import PhotoLabProcessor
+from src.features.lab.processor import (
+    SpectralCrosstalkProcessor,
+    SaturationProcessor,
+    LightnessProcessor,
+)
 from src.features.retouch.processor import RetouchProcessor
 from src.kernel.system.config import APP_CONFIG
+from src.services.rendering.scheduler import CancellationToken
+from src.services.rendering.stage_graph import StageGraph, StageNode
 from src.services.view.coordinate_mapping import CoordinateMapping
 
 logger = get_logger(__name__)
 
 
+def build_stage_graph() -> StageGraph:
+    """
+    Cacheable stages in execution order. Toning and crop run after the graph.
+    """
+    return StageGraph(
+        [
+            StageNode("geometry", GeometryProcessor, "geometry"),
+            # Bounds only; normalization is fused into the exposure pass
+            StageNode("normalization", LogBoundsProcessor, "exposure", "geometry"),
+            StageNode(
+                "exposure",
+                FusedPhotometricProcessor,
+                "exposure",
+                "normalization",
+                capture_as="retouch_source",
+            ),
+            StageNode("retouch", RetouchProcessor, "retouch", "exposure"),
+            StageNode("lab_crosstalk", SpectralCrosstalkProcessor, "lab", "retouch"),
+            StageNode("lab_saturation", SaturationProcessor, "lab", "lab_crosstalk"),
+            # CLAHE + sharpening share one LAB round trip
+            StageNode("lab_lightness", LightnessProcessor, "lab", "lab_saturation"),
+        ]
+    )
+
+
 class DarkroomEngine:
     """
-    Runs the pipeline. Handles stage caching.
+    Runs the pipeline. Handles stage caching across multiple images.
     """
 
     def __init__(self) -> None:
         self.config = APP_CONFIG
-        self.cache = PipelineCache()
+        self.cache = PipelineCache(max_bytes=self.config.pipeline_cache_bytes)
+        self.graph = build_stage_graph()
 
-    def _run_stage(
+    def _run_graph(
         self,
         img: ImageBuffer,
-        config: Any,
-        cache_field: str,
-        processor_fn: Callable[[ImageBuffer, PipelineContext], ImageBuffer],
+        settings: WorkspaceConfig,
+        source_hash: str,
+        root_hash: str,
         context: PipelineContext,
-        pipeline_changed: bool,
-    ) -> Tuple[ImageBuffer, bool]:
-        conf_hash = calculate_config_hash(config)
-        cached_entry = getattr(self.cache, cache_field)
-
-        if (
-            not pipeline_changed
-            and cached_entry
-            and cached_entry.config_hash == conf_hash
-        ):
-            context.metrics.update(cached_entry.metrics)
-            context.active_roi = cached_entry.active_roi
-            return cached_entry.data, False
-
-        new_img = processor_fn(img, context)
-        new_entry = CacheEntry(
-            conf_hash, new_img, context.metrics.copy(), context.active_roi
-        )
-        setattr(self.cache, cache_field, new_entry)
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ImageBuffer:
+        """
+        Walks the stage graph, restoring each stage from cache when its own
+        fields and every upstream stage are unchanged.
+        """
+        hashes = self.graph.stage_hashes(settings, root_hash)
+        outputs: Dict[str, ImageBuffer] = {}
+        current_img = img
 
-        return new_img, True
+        for node in self.graph.nodes:
+            # Completed stages stay cached for the superseding render
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            stage_in = outputs[node.after] if node.after else img
+            conf_hash = hashes[node.name]
+            cached_entry = self.cache.get(source_hash, node.name, conf_hash)
+
+            if cached_entry:
+                context.metrics.update(cached_entry.metrics)
+                context.active_roi = cached_entry.active_roi
+                current_img = cached_entry.data
+            else:
+                context.upstream_hash = (
+                    f"{source_hash}:{hashes[node.after] if node.after else root_hash}"
+                )
+                current_img = node.build(settings)(stage_in, context)
+                self.cache.put(
+                    source_hash,
+                    node.name,
+                    conf_hash,
+                    CacheEntry(
+                        conf_hash,
+                        current_img,
+                        context.metrics.copy(),
+                        context.active_roi,
+                    ),
+                    # Disabled stages pass their input through
+                    shares_data=current_img is stage_in,
+                )
+
+            if node.capture_as:
+                context.metrics[node.capture_as] = current_img.copy()
+            outputs[node.name] = current_img
+
+        return current_img
 
     def process(
         self,
@@ -61,7 +121,11 @@ class DarkroomEngine:
         settings: WorkspaceConfig,
         source_hash: str,
         context: Optional[PipelineContext] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ImageBuffer:
+        """
+        Raises RenderCancelled between stages once cancel_token is cancelled.
+        """
         img = ensure_image(img)
         h_orig, w_cols = img.shape[:2]
 
@@ -73,69 +137,31 @@ class DarkroomEngine:
                 process_mode=settings.process_mode,
             )
 
-        pipeline_changed = False
-        if self.cache.source_hash != source_hash:
-            self.cache.clear()
-            self.cache.source_hash = source_hash
-            pipeline_changed = True
-
-        if self.cache.process_mode != settings.process_mode:
-            self.cache.process_mode = settings.process_mode
-            self.cache.exposure = None
-            self.cache.retouch = None
-            self.cache.lab = None
-            pipeline_changed = True
-
-        current_img = img
-
         if settings.geometry.manual_crop_rect:
             logger.debug(
                 f"Engine process with manual_crop_rect: {settings.geometry.manual_crop_rect}"
             )
 
-        def run_base(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
-            img_in = GeometryProcessor(settings.geometry).process(img_in, ctx)
-            return NormalizationProcessor(settings.exposure).process(img_in, ctx)
-
-        base_key = (settings.geometry, settings.exposure.analysis_buffer)
-        current_img, pipeline_changed = self._run_stage(
-            current_img, base_key, "base", run_base, context, pipeline_changed
-        )
-
-        def run_exposure(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
-            img_out = PhotometricProcessor(settings.exposure).process(img_in, ctx)
-            return img_out
-
-        current_img, pipeline_changed = self._run_stage(
-            current_img,
-            settings.exposure,
-            "exposure",
-            run_exposure,
-            context,
-            pipeline_changed,
+        # Same file may be rendered at preview and export resolution, and with
+        # overridden (roll-wide) bounds
+        seeded = (
+            context.metrics.get("log_bounds")
+            if context.metrics.get("log_bounds_override")
+            else None
         )
-
-        context.metrics["retouch_source"] = current_img.copy()
-
-        def run_retouch(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
-            return RetouchProcessor(settings.retouch).process(img_in, ctx)
-
-        current_img, pipeline_changed = self._run_stage(
-            current_img,
-            settings.retouch,
-            "retouch",
-            run_retouch,
-            context,
-            pipeline_changed,
+        root_hash = calculate_config_hash(
+            (
+                img.shape,
+                context.scale_factor,
+                (seeded.floors, seeded.ceils) if seeded is not None else None,
+            )
         )
-
-        def run_lab(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
-            return PhotoLabProcessor(settings.lab).process(img_in, ctx)
-
-        current_img, pipeline_changed = self._run_stage(
-            current_img, settings.lab, "lab", run_lab, context, pipeline_changed
+        current_img = self._run_graph(
+            img, settings, source_hash, root_hash, context, cancel_token
         )
 
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         current_img = ToningProcessor(settings.toning).process(current_img, context)
         current_img = CropProcessor(settings.geometry).process(current_img, context)
 
@@ -10,6 +10,7 @@ from src.infrastructure.gpu.device import GPUDevice
 from src.infrastructure.gpu.resources import GPUTexture, GPUBuffer
 from src.infrastructure.gpu.shader_loader import ShaderLoader
 from src.domain.models import WorkspaceConfig, ProcessMode, AspectRatio
+from src.domain.types import ROI
 from src.kernel.system.logging import get_logger
 from src.kernel.system.config import APP_CONFIG
 from src.kernel.system.paths import get_resource_path
@@ -19,7 +20,8 @@ from src.features.geometry.logic import (
     map_coords_to_geometry,
 )
 from src.features.exposure.normalization import (
-    measure_log_negative_bounds,
+    LogNegativeBounds,
+    measure_linear_bounds,
     get_analysis_crop,
 )
 from src.services.view.coordinate_mapping import CoordinateMapping
@@ -226,6 +228,7 @@ class GPUEngine:
         scale_factor: float = 1.0,
         tiling_mode: bool = False,
         bounds_override: Optional[Any] = None,
+        roi_override: Optional[ROI] = None,
         global_offset: Tuple[int, int] = (0, 0),
         full_dims: Optional[Tuple[int, int]] = None,
         clahe_cdf_override: Optional[np.ndarray] = None,
@@ -233,9 +236,12 @@ class GPUEngine:
         render_size_ref: Optional[float] = None,
         source_hash: Optional[str] = None,
         readback_metrics: bool = True,
+        noise_seed: int = 0,
     ) -> Tuple[Any, Dict[str, Any]]:
         """
         Executes the full pipeline, returning a GPU texture and associated metrics.
+        bounds_override / roi_override: stored analysis, skips measurement.
+        noise_seed: per-file grain seed shared with the CPU path.
         """
         if not self.gpu.is_available:
             raise RuntimeError("GPU not available")
@@ -284,6 +290,8 @@ class GPUEngine:
                     offset_px=settings.geometry.autocrop_offset,
                     scale_factor=scale_factor,
                 )
+            elif roi_override is not None:
+                roi = roi_override
             else:
                 det_s = APP_CONFIG.preview_render_size / max(h, w)
                 tmp = cv2.resize(img, (int(w * det_s), int(h * det_s)))
@@ -314,7 +322,7 @@ class GPUEngine:
             bounds = bounds_override
         else:
             # Match CPU: use ROI for analysis if not in tiling mode
-            analysis_source = np.log10(np.clip(img, 1e-6, 1.0))
+            analysis_source = img
             if not tiling_mode:
                 # Apply ROI (crop) to analysis source
                 ry1, ry2, rx1, rx2 = roi
@@ -324,7 +332,7 @@ class GPUEngine:
                 analysis_source = get_analysis_crop(
                     analysis_source, settings.exposure.analysis_buffer
                 )
-            bounds = measure_log_negative_bounds(analysis_source)
+            bounds = measure_linear_bounds(analysis_source)
 
         self._upload_unified_uniforms(
             settings,
@@ -337,6 +345,7 @@ class GPUEngine:
             tiling_mode,
             render_size_ref,
             scale_factor,
+            noise_seed,
         )
         self._update_retouch_storage(
             settings.retouch,
@@ -556,7 +565,11 @@ class GPUEngine:
             "active_roi": roi,
             "base_positive": tex_final,
             "content_rect": content_rect,
+            "log_bounds": bounds,
+            "log_bounds_buffer_val": settings.exposure.analysis_buffer,
         }
+        if not tiling_mode and not settings.geometry.manual_crop_rect:
+            metrics["autocrop_roi"] = roi
 
         if not tiling_mode and readback_metrics:
             metrics["histogram_raw"] = self._readback_metrics()
@@ -590,6 +603,7 @@ class GPUEngine:
         tiling_mode: bool,
         render_size_ref: Optional[float],
         scale_factor: float,
+        noise_seed: int = 0,
     ) -> None:
         """Packs and uploads all pipeline parameters to the unified UBO."""
         g_data = (
@@ -657,7 +671,7 @@ class GPUEngine:
 
         ret = settings.retouch
         r_u_data = struct.pack(
-            "ffIIiiIIf",
+            "ffIIiiIIfI",
             float(ret.dust_threshold),
             float(ret.dust_size),
             len(ret.manual_dust_spots),
@@ -667,6 +681,7 @@ class GPUEngine:
             full_dims[0],
             full_dims[1],
             float(scale_factor),
+            noise_seed,
         )
 
         lab = settings.lab
@@ -938,37 +953,57 @@ class GPUEngine:
         pass_enc.end()
 
     def process(
-        self, img: np.ndarray, settings: WorkspaceConfig, scale_factor: float = 1.0
+        self,
+        img: np.ndarray,
+        settings: WorkspaceConfig,
+        scale_factor: float = 1.0,
+        bounds_override: Optional[LogNegativeBounds] = None,
+        roi_override: Optional[ROI] = None,
+        noise_seed: int = 0,
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """High-level processing entry point with automatic tiling."""
+        """
+        High-level processing entry point with automatic tiling.
+        bounds_override / roi_override: precomputed analysis, skips measurement.
+        """
         self._init_resources()
         h, w = img.shape[:2]
         max_tex = self.gpu.limits.get("max_texture_dimension_2d", 8192)
         rot = settings.geometry.rotation % 4
         w_rot, h_rot = (h, w) if rot in (1, 3) else (w, h)
         if w_rot > max_tex or h_rot > max_tex or (w * h > TILING_THRESHOLD_PX):
-            return self._process_tiled(img, settings, scale_factor)
+            return self._process_tiled(
+                img, settings, scale_factor, bounds_override, noise_seed
+            )
         tex_final, metrics = self.process_to_texture(
-            img, settings, scale_factor=scale_factor
+            img,
+            settings,
+            scale_factor=scale_factor,
+            bounds_override=bounds_override,
+            roi_override=roi_override,
+            noise_seed=noise_seed,
         )
         return self._readback_downsampled(tex_final), metrics
 
     def _process_tiled(
-        self, img: np.ndarray, settings: WorkspaceConfig, scale_factor: float
+        self,
+        img: np.ndarray,
+        settings: WorkspaceConfig,
+        scale_factor: float,
+        bounds_override: Optional[LogNegativeBounds] = None,
+        noise_seed: int = 0,
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Processes ultra-high resolution images using memory-efficient tiling."""
         h, w = img.shape[:2]
-        global_bounds = measure_log_negative_bounds(
-            get_analysis_crop(
-                np.log10(np.clip(img, 1e-6, 1.0)), settings.exposure.analysis_buffer
-            )
-            if settings.exposure.analysis_buffer > 0
-            else np.log10(np.clip(img, 1e-6, 1.0))
+        global_bounds = bounds_override or measure_linear_bounds(
+            get_analysis_crop(img, settings.exposure.analysis_buffer)
         )
         preview_scale = APP_CONFIG.preview_render_size / max(h, w)
         img_small = cv2.resize(img, (int(w * preview_scale), int(h * preview_scale)))
         _, metrics_ref = self.process_to_texture(
-            img_small, settings, scale_factor=scale_factor
+            img_small,
+            settings,
+            scale_factor=scale_factor,
+            bounds_override=bounds_override,
         )
 
         device = self.gpu.device
@@ -1034,6 +1069,7 @@ class GPUEngine:
                     full_dims=(w_rot, h_rot),
                     clahe_cdf_override=global_cdfs,
                     apply_layout=False,
+                    noise_seed=noise_seed,
                 )
                 ox, oy = x1 + tx - ix1, y1 + ty - iy1
                 full_source_res[ty : ty + th, tx : tx + tw] = (
@@ -1051,6 +1087,8 @@ class GPUEngine:
         color_hex = settings.export.export_border_color.lstrip("#")
         result[:] = tuple(int(color_hex[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
         result[off_y : off_y + content_h, off_x : off_x + content_w] = scaled_content
+        # Crop was detected on the downsampled reference
+        metrics_ref.pop("autocrop_roi", None)
         return result, metrics_ref
 
     def cleanup(self) -> None:
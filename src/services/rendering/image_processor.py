@@ -1,5 +1,6 @@
 import os
 import io
+import hashlib
 import tifffile
 import numpy as np
 from PIL import Image, ImageCms
@@ -14,8 +15,14 @@ from src.domain.models import (
     ExportFormat,
 )
 from src.domain.interfaces import PipelineContext
+from src.features.exposure.processor import cached_log_bounds
+from src.services.rendering.analysis_cache import AnalysisCache
 from src.services.rendering.engine import DarkroomEngine
 from src.services.rendering.gpu_engine import GPUEngine
+from src.services.rendering.tiled_engine import TiledExportEngine
+from src.services.rendering.scheduler import CancellationToken
+from src.services.rendering.preview_manager import PreviewManager
+from src.services.rendering.viewport import Viewport, ViewportRenderer
 from src.infrastructure.gpu.device import GPUDevice
 from src.kernel.image.logic import (
     float_to_uint8,
@@ -24,13 +31,18 @@ from src.kernel.image.logic import (
     uint16_to_float32,
     float_to_uint_luma,
 )
+from src.kernel.image.noise import noise_seed
 from src.infrastructure.loaders.factory import loader_factory
 from src.infrastructure.loaders.helpers import get_best_demosaic_algorithm
 from src.services.export.print import PrintService
 from src.infrastructure.display.color_spaces import ColorSpaceRegistry
+from src.infrastructure.storage.array_cache import ArrayDiskCache
 
 logger = get_logger(__name__)
 
+# Exports above this size stream through the tiled CPU engine
+TILED_EXPORT_THRESHOLD_PX = 12_000_000
+
 
 class ImageProcessor:
     """
@@ -38,9 +50,20 @@ class ImageProcessor:
     Seamlessly switches between CPU (DarkroomEngine) and GPU (GPUEngine).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        analysis_cache: Optional[AnalysisCache] = None,
+        decode_cache: Optional[ArrayDiskCache] = None,
+    ) -> None:
+        self.analysis_cache = analysis_cache
+        # Demosaiced 16-bit full resolution RAWs, memory-mapped on reuse
+        self.decode_cache = decode_cache
         self.engine_cpu = DarkroomEngine()
+        self.engine_tiled = TiledExportEngine()
+        self.engine_viewport = ViewportRenderer()
         self.engine_gpu: Optional[GPUEngine] = None
+        # (source key, full resolution linear buffer) backing the viewport
+        self._viewport_source: Optional[Tuple[str, ImageBuffer]] = None
 
         if APP_CONFIG.use_gpu:
             gpu = GPUDevice.get()
@@ -56,6 +79,85 @@ class ImageProcessor:
             return self.engine_gpu.gpu.backend_name or "WEBGPU"
         return "CPU"
 
+    def _analysis_keys(
+        self,
+        settings: WorkspaceConfig,
+        shape: Tuple[int, ...],
+        scale_factor: float,
+        color_space: Optional[str],
+        use_gpu: bool,
+    ) -> Optional[Dict[str, str]]:
+        if self.analysis_cache is None or color_space is None:
+            return None
+        variant = f"{color_space}:{'gpu' if use_gpu else 'cpu'}"
+        return AnalysisCache.params_keys(settings, shape, scale_factor, variant)
+
+    def _seed_analysis(
+        self,
+        source_hash: str,
+        settings: WorkspaceConfig,
+        keys: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        if self.analysis_cache is None or keys is None:
+            return {}
+        return self.analysis_cache.seed(source_hash, keys, settings)
+
+    def _store_analysis(
+        self,
+        source_hash: str,
+        settings: WorkspaceConfig,
+        keys: Optional[Dict[str, str]],
+        metrics: Dict[str, Any],
+        seeded: Dict[str, Any],
+    ) -> None:
+        if self.analysis_cache is not None and keys is not None:
+            self.analysis_cache.store(source_hash, keys, settings, metrics, seeded)
+
+    @staticmethod
+    def decode_cache_key(
+        file_hash: str, color_space: str, use_camera_wb: bool, algorithm: Any
+    ) -> str:
+        algo = getattr(algorithm, "name", str(algorithm))
+        variant = f"{color_space}:{int(use_camera_wb)}:{algo}"
+        return f"{file_hash}_{hashlib.md5(variant.encode('utf-8')).hexdigest()[:12]}"
+
+    def _decode_export_source(
+        self, file_path: str, source_hash: str, use_camera_wb: bool
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        Full resolution 16-bit decode; camera RAWs go through decode_cache.
+        """
+        ctx_mgr, metadata = loader_factory.get_loader(file_path)
+        source_cs = metadata.get("color_space", "Adobe RGB")
+        cache = self.decode_cache
+        if cache is not None and (
+            not source_hash or not loader_factory.is_camera_raw(file_path)
+        ):
+            cache = None
+
+        with ctx_mgr as raw:
+            algo = get_best_demosaic_algorithm(raw)
+            key = self.decode_cache_key(source_hash, source_cs, use_camera_wb, algo)
+            if cache is not None:
+                hit = cache.get(key)
+                if hit is not None:
+                    return hit[0], metadata
+
+            rgb = raw.postprocess(
+                gamma=(1, 1),
+                no_auto_bright=True,
+                use_camera_wb=use_camera_wb,
+                user_wb=None if use_camera_wb else [1, 1, 1, 1],
+                output_bps=16,
+                output_color=ColorSpaceRegistry.get_rawpy_space(source_cs),
+                demosaic_algorithm=algo,
+            )
+            rgb = ensure_rgb(rgb)
+
+        if cache is not None:
+            cache.put(key, rgb, {"file": os.path.basename(file_path)})
+        return rgb, metadata
+
     def run_pipeline(
         self,
         img: ImageBuffer,
@@ -65,36 +167,70 @@ class ImageProcessor:
         metrics: Optional[Dict[str, Any]] = None,
         prefer_gpu: bool = True,
         readback_metrics: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        color_space: Optional[str] = None,
+        file_hash: Optional[str] = None,
     ) -> Tuple[Any, Dict[str, Any]]:
         """
         Executes rendering pipeline. Returns result (ndarray/GPUTexture) and metrics.
+        GPU frames are submitted whole, so cancellation is only checked up front.
+        color_space: decode space of img; enables the persistent analysis cache.
+        file_hash: file identity for the grain seed when source_hash is a cache
+        variant (draft previews); defaults to source_hash.
         """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
         h_orig, w_cols = img.shape[:2]
         scale_factor = max(h_orig, w_cols) / float(render_size_ref)
+        use_gpu = prefer_gpu and self.engine_gpu is not None
+
+        keys = self._analysis_keys(
+            settings, img.shape, scale_factor, color_space, use_gpu
+        )
+        # Draft variants share the file's rows; the shape keeps them apart
+        analysis_hash = file_hash or source_hash
+        seeded = self._seed_analysis(analysis_hash, settings, keys)
 
         context = PipelineContext(
             scale_factor=scale_factor,
             original_size=(h_orig, w_cols),
             process_mode=settings.process_mode,
+            noise_seed=noise_seed(file_hash or source_hash),
         )
-        if metrics:
-            context.metrics.update(metrics)
+        context.metrics.update(AnalysisCache.merge(seeded, metrics))
 
-        if prefer_gpu and self.engine_gpu:
+        if use_gpu and self.engine_gpu:
             try:
                 processed, gpu_metrics = self.engine_gpu.process_to_texture(
                     img,
                     settings,
                     scale_factor=scale_factor,
+                    bounds_override=cached_log_bounds(
+                        context.metrics, settings.exposure.analysis_buffer
+                    ),
+                    roi_override=context.metrics.get("autocrop_roi"),
                     render_size_ref=render_size_ref,
                     readback_metrics=readback_metrics,
+                    noise_seed=context.noise_seed,
                 )
                 context.metrics.update(gpu_metrics)
+                self._store_analysis(
+                    analysis_hash, settings, keys, context.metrics, seeded
+                )
                 return processed, context.metrics
             except Exception as e:
                 logger.error(f"Hardware acceleration failed: {e}")
+                # CPU analysis may differ slightly; keep it out of the GPU keys
+                keys = self._analysis_keys(
+                    settings, img.shape, scale_factor, color_space, False
+                )
+                seeded = {}
 
-        processed = self.engine_cpu.process(img, settings, source_hash, context)
+        processed = self.engine_cpu.process(
+            img, settings, source_hash, context, cancel_token=cancel_token
+        )
+        self._store_analysis(analysis_hash, settings, keys, context.metrics, seeded)
         return processed, context.metrics
 
     def buffer_to_pil(
@@ -138,36 +274,60 @@ class ImageProcessor:
     ) -> Tuple[Optional[bytes], str]:
         """Performs high-resolution export with color management."""
         try:
-            ctx_mgr, metadata = loader_factory.get_loader(file_path)
+            rgb, metadata = self._decode_export_source(
+                file_path, source_hash, params.exposure.use_camera_wb
+            )
             source_cs = metadata.get("color_space", "Adobe RGB")
-            raw_color_space = ColorSpaceRegistry.get_rawpy_space(source_cs)
             target_cs = export_settings.export_color_space
             if target_cs == "Same as Source":
                 target_cs = source_cs
             color_space = str(target_cs)
 
-            with ctx_mgr as raw:
-                algo = get_best_demosaic_algorithm(raw)
-                use_camera_wb = params.exposure.use_camera_wb
-                user_wb = None if use_camera_wb else [1, 1, 1, 1]
-                rgb = raw.postprocess(
-                    gamma=(1, 1),
-                    no_auto_bright=True,
-                    use_camera_wb=use_camera_wb,
-                    user_wb=user_wb,
-                    output_bps=16,
-                    output_color=raw_color_space,
-                    demosaic_algorithm=algo,
-                )
-                rgb = ensure_rgb(rgb)
-
-            f32_buffer = uint16_to_float32(np.ascontiguousarray(rgb))
-            h_raw, w_raw = f32_buffer.shape[:2]
+            h_raw, w_raw = rgb.shape[:2]
             export_scale = max(h_raw, w_raw) / float(APP_CONFIG.preview_render_size)
+            use_gpu = bool(prefer_gpu and self.engine_gpu)
 
-            if prefer_gpu and self.engine_gpu:
+            if use_gpu or h_raw * w_raw <= TILED_EXPORT_THRESHOLD_PX:
+                f32_buffer = uint16_to_float32(np.ascontiguousarray(rgb))
+                del rgb
+
+            if use_gpu and self.engine_gpu:
+                keys = self._analysis_keys(
+                    params, f32_buffer.shape, export_scale, str(source_cs), True
+                )
+                seeded = self._seed_analysis(source_hash, params, keys)
+                seeds = AnalysisCache.merge(seeded, metrics)
                 buffer, gpu_metrics = self.engine_gpu.process(
-                    f32_buffer, params, scale_factor=export_scale
+                    f32_buffer,
+                    params,
+                    scale_factor=export_scale,
+                    bounds_override=cached_log_bounds(
+                        seeds, params.exposure.analysis_buffer
+                    ),
+                    roi_override=seeds.get("autocrop_roi"),
+                    noise_seed=noise_seed(source_hash),
+                )
+                self._store_analysis(
+                    source_hash, params, keys, {**seeds, **gpu_metrics}, seeded
+                )
+            elif h_raw * w_raw > TILED_EXPORT_THRESHOLD_PX:
+                # Tiles sample the uint16 decode; no full float32 frame
+                keys = self._analysis_keys(
+                    params, rgb.shape, export_scale, str(source_cs), False
+                )
+                seeded = self._seed_analysis(source_hash, params, keys)
+                seeds = AnalysisCache.merge(seeded, metrics)
+                buffer = self.engine_tiled.process(
+                    rgb,
+                    params,
+                    scale_factor=export_scale,
+                    metrics=seeds,
+                    noise_seed=noise_seed(source_hash),
+                )
+                self._store_analysis(source_hash, params, keys, seeds, seeded)
+                del rgb
+                buffer = self._apply_scaling_and_border_f32(
+                    buffer, params, export_settings
                 )
             else:
                 buffer, _ = self.run_pipeline(
@@ -177,6 +337,7 @@ class ImageProcessor:
                     render_size_ref=float(APP_CONFIG.preview_render_size),
                     metrics=metrics,
                     prefer_gpu=False,
+                    color_space=str(source_cs),
                 )
                 buffer = self._apply_scaling_and_border_f32(
                     buffer, params, export_settings
@@ -342,8 +503,46 @@ class ImageProcessor:
             compression="tiff_lzw" if fmt == "TIFF" else None,
         )
 
+    def render_viewport(
+        self,
+        file_path: str,
+        settings: WorkspaceConfig,
+        source_hash: str,
+        viewport: Viewport,
+        color_space: Optional[str] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        out_size: Optional[Tuple[int, int]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ImageBuffer:
+        """
+        Native resolution render of a normalized viewport (CPU).
+        The full resolution source is decoded once and kept until cleanup().
+        """
+        use_camera_wb = settings.exposure.use_camera_wb
+        key = f"{source_hash}:{color_space}:{use_camera_wb}"
+        if self._viewport_source is None or self._viewport_source[0] != key:
+            # Release the previous frame before decoding the next one
+            self._viewport_source = None
+            self.engine_viewport.clear()
+            full, _ = PreviewManager.load_linear_full(
+                file_path, color_space, use_camera_wb
+            )
+            self._viewport_source = (key, full)
+
+        return self.engine_viewport.render(
+            self._viewport_source[1],
+            settings,
+            source_hash,
+            viewport,
+            metrics=metrics,
+            out_size=out_size,
+            cancel_token=cancel_token,
+        )
+
     def cleanup(self) -> None:
-        """Evacuates transient GPU resources."""
+        """Evacuates transient GPU resources and the viewport source."""
+        self._viewport_source = None
+        self.engine_viewport.clear()
         if self.engine_gpu:
             self.engine_gpu.cleanup()
 
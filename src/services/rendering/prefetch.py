@@ -0,0 +1,171 @@
+import threading
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+from src.kernel.system.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PrefetchRequest:
+    """Preview decode of a neighbouring file."""
+
+    key: str
+    file_path: str
+    file_hash: Optional[str]
+    color_space: str
+    use_camera_wb: bool = False
+
+
+@dataclass
+class PrefetchStats:
+    """
+    hits: served from memory, waited: joined an in-flight decode,
+    misses: not prefetched, cancelled: dropped before starting,
+    failed: decode raised.
+    """
+
+    hits: int = 0
+    waited: int = 0
+    misses: int = 0
+    cancelled: int = 0
+    failed: int = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        lookups = self.hits + self.waited + self.misses
+        return {
+            "hits": float(self.hits),
+            "waited": float(self.waited),
+            "misses": float(self.misses),
+            "cancelled": float(self.cancelled),
+            "failed": float(self.failed),
+            "hit_rate": (self.hits + self.waited) / lookups if lookups else 0.0,
+        }
+
+
+class PreviewPrefetcher(Generic[T]):
+    """
+    Decodes neighbouring previews on a background pool into a byte-capped LRU.
+    schedule() replaces the wanted set: queued decodes outside it are cancelled.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[PrefetchRequest], T],
+        size_of: Callable[[T], int],
+        max_bytes: int,
+        max_workers: int = 1,
+    ) -> None:
+        self._load = load
+        self._size_of = size_of
+        self.max_bytes = max_bytes
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="prefetch"
+        )
+        # Reentrant: done callbacks may run inline in submit()
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._bytes = 0
+        self._futures: Dict[str, Future[T]] = {}
+        self.stats = PrefetchStats()
+
+    def schedule(self, requests: List[PrefetchRequest]) -> None:
+        """
+        Prefetches requests in order, skipping cached or in-flight keys.
+        """
+        wanted = {r.key for r in requests}
+        with self._lock:
+            for key, fut in list(self._futures.items()):
+                if key not in wanted and fut.cancel():
+                    del self._futures[key]
+                    self.stats.cancelled += 1
+            for req in requests:
+                if req.key in self._entries or req.key in self._futures:
+                    continue
+                fut = self._pool.submit(self._load, req)
+                self._futures[req.key] = fut
+                fut.add_done_callback(partial(self._on_done, req.key))
+
+    def take(self, key: str) -> Optional[T]:
+        """
+        Cached preview for key; joins its decode if one is already running.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+            fut = self._futures.get(key)
+            if fut is not None and not (fut.running() or fut.done()):
+                # Not started yet: the caller decodes it sooner itself
+                if fut.cancel():
+                    del self._futures[key]
+                    self.stats.cancelled += 1
+                fut = None
+            if fut is None:
+                self.stats.misses += 1
+                return None
+
+        try:
+            value = fut.result()
+        except Exception:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        with self._lock:
+            self.stats.waited += 1
+        return value
+
+    def cancel_all(self) -> None:
+        self.schedule([])
+
+    def clear(self) -> None:
+        self.cancel_all()
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        if cancel_pending:
+            self.cancel_all()
+        self._pool.shutdown(wait=True)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def _on_done(self, key: str, fut: Future[T]) -> None:
+        if fut.cancelled():
+            return
+        try:
+            value = fut.result()
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {key}: {e}")
+            with self._lock:
+                self._futures.pop(key, None)
+                self.stats.failed += 1
+            return
+
+        size = self._size_of(value)
+        with self._lock:
+            self._futures.pop(key, None)
+            if size > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._size_of(old)
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._size_of(evicted)
@@ -1,6 +1,7 @@
+import hashlib
 import numpy as np
 import cv2
-from typing import Tuple
+from typing import Optional, Tuple
 from src.kernel.system.config import APP_CONFIG
 from src.kernel.image.logic import ensure_rgb, uint16_to_float32
 from src.infrastructure.loaders.factory import loader_factory
@@ -8,6 +9,7 @@ from src.infrastructure.loaders.helpers import get_best_demosaic_algorithm
 from src.domain.types import ImageBuffer, Dimensions
 from src.kernel.image.validation import ensure_image
 from src.infrastructure.display.color_spaces import ColorSpaceRegistry
+from src.infrastructure.storage.array_cache import ArrayDiskCache
 
 
 class PreviewManager:
@@ -15,15 +17,73 @@ class PreviewManager:
     Loads RAW files for UI preview.
     """
 
+    def __init__(self, disk_cache: Optional[ArrayDiskCache] = None) -> None:
+        self.disk_cache = disk_cache
+
     @staticmethod
-    def load_linear_preview(
+    def preview_cache_key(
+        file_hash: str, color_space: str | None, use_camera_wb: bool
+    ) -> str:
+        variant = f"{color_space or 'source'}:{int(use_camera_wb)}:{APP_CONFIG.preview_render_size}"
+        return f"{file_hash}_{hashlib.md5(variant.encode('utf-8')).hexdigest()[:12]}"
+
+    def load_preview(
+        self,
         file_path: str,
+        file_hash: str | None,
         color_space: str | None = None,
         use_camera_wb: bool = False,
     ) -> Tuple[ImageBuffer, Dimensions, dict]:
         """
-        Loads linear RGB, downsamples for display.
-        If color_space is None, uses the source's declared space (metadata).
+        load_linear_preview backed by the on-disk cache (float16 .npy).
+        """
+        hit = self.cached_preview(file_hash, color_space, use_camera_wb)
+        if hit is not None:
+            return hit
+
+        preview, dims, metadata = self.load_linear_preview(
+            file_path, color_space, use_camera_wb
+        )
+        if self.disk_cache is None or not file_hash:
+            return preview, dims, metadata
+
+        stored = preview.astype(np.float16)
+        self.disk_cache.put(
+            self.preview_cache_key(file_hash, color_space, use_camera_wb),
+            stored,
+            {"original_size": list(dims), "metadata": metadata},
+        )
+        # Same values as a later cache hit
+        return ensure_image(stored.astype(np.float32)), dims, metadata
+
+    def cached_preview(
+        self,
+        file_hash: str | None,
+        color_space: str | None = None,
+        use_camera_wb: bool = False,
+    ) -> Optional[Tuple[ImageBuffer, Dimensions, dict]]:
+        """
+        Disk cache lookup only; None on miss.
+        """
+        if self.disk_cache is None or not file_hash:
+            return None
+        hit = self.disk_cache.get(
+            self.preview_cache_key(file_hash, color_space, use_camera_wb)
+        )
+        if hit is None:
+            return None
+        arr, meta = hit
+        h, w = meta["original_size"]
+        return ensure_image(arr.astype(np.float32)), (h, w), meta["metadata"]
+
+    @staticmethod
+    def load_linear_full(
+        file_path: str,
+        color_space: str | None = None,
+        use_camera_wb: bool = False,
+    ) -> Tuple[ImageBuffer, dict]:
+        """
+        Full resolution linear RGB, decoded exactly like the preview.
         """
         ctx_mgr, metadata = loader_factory.get_loader(file_path)
 
@@ -49,23 +109,145 @@ class PreviewManager:
             )
             rgb = ensure_rgb(rgb)
 
-            full_linear = uint16_to_float32(np.ascontiguousarray(rgb))
+        return uint16_to_float32(np.ascontiguousarray(rgb)), metadata
+
+    @staticmethod
+    def _decode_half_size(
+        file_path: str,
+        color_space: str | None,
+        use_camera_wb: bool,
+    ) -> Tuple[ImageBuffer, Optional[Dimensions], dict]:
+        """
+        Half-size decode (2x2 superpixels, no demosaic).
+        Also returns the full decode size when the source reports it.
+        """
+        ctx_mgr, metadata = loader_factory.get_loader(file_path)
+        if color_space is None:
+            color_space = metadata.get("color_space", "Adobe RGB")
+        raw_color_space = ColorSpaceRegistry.get_rawpy_space(color_space)
+
+        full_dims: Optional[Dimensions] = None
+        with ctx_mgr as raw:
+            sizes = getattr(raw, "sizes", None)
+            if sizes is not None:
+                full_dims = (int(sizes.height), int(sizes.width))
+            rgb = raw.postprocess(
+                gamma=(1, 1),
+                no_auto_bright=True,
+                use_camera_wb=use_camera_wb,
+                user_wb=None if use_camera_wb else [1, 1, 1, 1],
+                output_bps=16,
+                output_color=raw_color_space,
+                half_size=True,
+                user_flip=0,
+            )
+            rgb = ensure_rgb(rgb)
+
+        return uint16_to_float32(np.ascontiguousarray(rgb)), full_dims, metadata
+
+    @staticmethod
+    def _fit(img: ImageBuffer, max_size: int) -> ImageBuffer:
+        h, w = img.shape[:2]
+        if max(h, w) <= max_size:
+            return img
+        scale = max_size / max(h, w)
+        return ensure_image(
+            cv2.resize(
+                img,
+                (int(w * scale), int(h * scale)),
+                interpolation=cv2.INTER_AREA,
+            )
+        )
+
+    @staticmethod
+    def load_linear_analysis(
+        file_path: str,
+        max_size: int,
+        color_space: str | None = None,
+        use_camera_wb: bool = False,
+    ) -> ImageBuffer:
+        """
+        Half-size linear decode, downsampled to max_size for measurements.
+        """
+        img, _, _ = PreviewManager._decode_half_size(
+            file_path, color_space, use_camera_wb
+        )
+        return PreviewManager._fit(img, max_size)
+
+    @staticmethod
+    def load_linear_draft(
+        file_path: str,
+        color_space: str | None = None,
+        use_camera_wb: bool = False,
+    ) -> Optional[Tuple[ImageBuffer, Dimensions, dict]]:
+        """
+        Fast stand-in for load_linear_preview on camera RAWs: half-size decode,
+        no demosaic. None for sources where it would not be cheaper.
+        """
+        if not loader_factory.is_camera_raw(file_path):
+            return None
+        img, full_dims, metadata = PreviewManager._decode_half_size(
+            file_path, color_space, use_camera_wb
+        )
+        if full_dims is None:
+            h, w = img.shape[:2]
+            full_dims = (h * 2, w * 2)
+        return (
+            PreviewManager._fit(img, APP_CONFIG.preview_render_size),
+            full_dims,
+            metadata,
+        )
+
+    @staticmethod
+    def _load_reduced_level(
+        file_path: str, min_size: int
+    ) -> Optional[Tuple[ImageBuffer, Dimensions, dict]]:
+        """
+        Smallest stored pyramid level covering min_size (pyramidal TIFFs),
+        with the full resolution size. None when only full resolution exists.
+        """
+        ctx_mgr, metadata = loader_factory.get_loader(file_path)
+        with ctx_mgr as src:
+            if not hasattr(src, "best_level"):
+                return None
+            level = src.best_level(min_size)
+            if level == 0:
+                return None
+            return ensure_image(src.read_linear(level=level)), src.shape, metadata
+
+    @staticmethod
+    def load_linear_preview(
+        file_path: str,
+        color_space: str | None = None,
+        use_camera_wb: bool = False,
+    ) -> Tuple[ImageBuffer, Dimensions, dict]:
+        """
+        Loads linear RGB, downsamples for display.
+        If color_space is None, uses the source's declared space (metadata).
+        """
+        max_res = APP_CONFIG.preview_render_size
+        reduced = PreviewManager._load_reduced_level(file_path, max_res)
+        if reduced is not None:
+            full_linear, (h_orig, w_orig), metadata = reduced
+        else:
+            full_linear, metadata = PreviewManager.load_linear_full(
+                file_path, color_space, use_camera_wb
+            )
             h_orig, w_orig = full_linear.shape[:2]
 
-            max_res = APP_CONFIG.preview_render_size
-            if max(h_orig, w_orig) > max_res:
-                scale = max_res / max(h_orig, w_orig)
-                target_w = int(w_orig * scale)
-                target_h = int(h_orig * scale)
-
-                preview_raw = ensure_image(
-                    cv2.resize(
-                        full_linear,
-                        (target_w, target_h),
-                        interpolation=cv2.INTER_AREA,
-                    )
+        if max(h_orig, w_orig) > max_res:
+            scale = max_res / max(h_orig, w_orig)
+            target_w = int(w_orig * scale)
+            target_h = int(h_orig * scale)
+
+            preview_raw = ensure_image(
+                cv2.resize(
+                    full_linear,
+                    (target_w, target_h),
+                    interpolation=cv2.INTER_AREA,
                 )
-            else:
-                preview_raw = full_linear.copy()
+            )
+        else:
+            preview_raw = full_linear.copy()
 
-            return ensure_image(preview_raw), (h_orig, w_orig), metadata
+        return ensure_image(preview_raw), (h_orig, w_orig), metadata
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+import cv2
+from src.domain.types import ImageBuffer
+from src.kernel.image.validation import ensure_image
+
+# Long-edge sizes of the coarse levels; the full preview is always the top level
+PYRAMID_LEVEL_SIZES = (500, 1000)
+
+# Largest coarse level whose last frame fit this budget is used while dragging
+INTERACTIVE_FRAME_BUDGET_S = 0.030
+
+# EMA weight of the newest frame time
+FRAME_TIME_SMOOTHING = 0.5
+
+
+@dataclass
+class PreviewPyramid:
+    """
+    Linear preview at decreasing resolutions, built once per file.
+    levels[0] is the smallest, levels[-1] the full preview buffer.
+    """
+
+    levels: List[ImageBuffer]
+    frame_times: Dict[int, float] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, full: ImageBuffer, sizes: Sequence[int] = PYRAMID_LEVEL_SIZES
+    ) -> "PreviewPyramid":
+        long_edge = max(full.shape[:2])
+        levels = [full]
+        # Each level is reduced from the next larger one (INTER_AREA, cheap)
+        for size in sorted((s for s in sizes if s < long_edge), reverse=True):
+            src = levels[0]
+            h, w = src.shape[:2]
+            scale = size / max(h, w)
+            dims = (max(1, round(w * scale)), max(1, round(h * scale)))
+            levels.insert(
+                0, ensure_image(cv2.resize(src, dims, interpolation=cv2.INTER_AREA))
+            )
+        return cls(levels=levels)
+
+    @property
+    def full(self) -> ImageBuffer:
+        return self.levels[-1]
+
+    @property
+    def top(self) -> int:
+        return len(self.levels) - 1
+
+    def record_frame(self, level: int, seconds: float) -> None:
+        prev = self.frame_times.get(level)
+        self.frame_times[level] = (
+            seconds if prev is None else prev + (seconds - prev) * FRAME_TIME_SMOOTHING
+        )
+
+    def interactive_level(self, budget_s: float = INTERACTIVE_FRAME_BUDGET_S) -> int:
+        """
+        Coarse level to render while input is moving: the largest one whose
+        measured (or pixel-count extrapolated) frame time fits the budget.
+        """
+        best = 0
+        estimate = None
+        for level in range(self.top):
+            t = self.frame_times.get(level, estimate)
+            if t is None or t > budget_s:
+                break
+            best = level
+            estimate = t * self.levels[level + 1].size / self.levels[level].size
+        return best
@@ -0,0 +1,102 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+import numpy as np
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig
+from src.features.exposure.normalization import LogNegativeBounds
+from src.features.exposure.processor import resolve_log_bounds
+from src.features.geometry.processor import GeometryProcessor
+from src.kernel.system.config import APP_CONFIG
+from src.kernel.system.logging import get_logger
+from src.services.rendering.preview_manager import PreviewManager
+
+logger = get_logger(__name__)
+
+# Long edge (px) frames are measured at
+ROLL_ANALYSIS_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class FrameAnalysisTask:
+    """Picklable per-frame job for the analysis pool."""
+
+    file_path: str
+    settings: WorkspaceConfig
+
+
+@dataclass(frozen=True)
+class RollAnalysis:
+    """
+    Roll-wide bounds and the per-frame measurements (None where a frame failed).
+    """
+
+    bounds: LogNegativeBounds
+    frames: List[Optional[LogNegativeBounds]]
+
+
+def measure_frame_bounds(
+    task: FrameAnalysisTask, max_size: int = ROLL_ANALYSIS_SIZE
+) -> LogNegativeBounds:
+    """
+    Same geometry + analysis crop as the pipeline, at low resolution.
+    """
+    settings = task.settings
+    img = PreviewManager.load_linear_analysis(
+        task.file_path, max_size, use_camera_wb=settings.exposure.use_camera_wb
+    )
+    h, w = img.shape[:2]
+    context = PipelineContext(
+        scale_factor=max(h, w) / float(APP_CONFIG.preview_render_size),
+        original_size=(h, w),
+        process_mode=settings.process_mode,
+    )
+    img = GeometryProcessor(settings.geometry).process(img, context)
+    return resolve_log_bounds(img, settings.exposure, context)
+
+
+def _measure_or_none(task: FrameAnalysisTask) -> Optional[LogNegativeBounds]:
+    try:
+        return measure_frame_bounds(task)
+    except Exception as e:
+        logger.error(f"Roll analysis failed for {task.file_path}: {e}")
+        return None
+
+
+def aggregate_roll_bounds(frames: Sequence[LogNegativeBounds]) -> LogNegativeBounds:
+    """
+    Per-channel median of frame floors/ceilings; robust to the odd
+    under/over-exposed or blank frame.
+    """
+    if not frames:
+        raise ValueError("No frame bounds to aggregate")
+    floors = np.median(np.array([b.floors for b in frames], dtype=np.float64), axis=0)
+    ceils = np.median(np.array([b.ceils for b in frames], dtype=np.float64), axis=0)
+    return LogNegativeBounds(
+        floors=(float(floors[0]), float(floors[1]), float(floors[2])),
+        ceils=(float(ceils[0]), float(ceils[1]), float(ceils[2])),
+    )
+
+
+def analyze_roll(
+    tasks: Sequence[FrameAnalysisTask], max_workers: Optional[int] = None
+) -> Optional[RollAnalysis]:
+    """
+    Measures every frame in a process pool and aggregates roll-wide bounds.
+    Returns None when no frame could be measured.
+    """
+    workers = min(max_workers or APP_CONFIG.max_workers, len(tasks))
+    frames: List[Optional[LogNegativeBounds]]
+    if workers <= 1:
+        frames = [_measure_or_none(t) for t in tasks]
+    else:
+        # Spawned workers: the UI process holds Qt and numba threads
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            frames = list(pool.map(_measure_or_none, tasks))
+
+    measured = [b for b in frames if b is not None]
+    if not measured:
+        return None
+    return RollAnalysis(bounds=aggregate_roll_bounds(measured), frames=frames)
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Samples kept for the latency / frame-time statistics
+STATS_WINDOW = 64
+
+
+class RenderCancelled(Exception):
+    """
+    Raised inside a render when its token was cancelled.
+    """
+
+
+class CancellationToken:
+    """
+    Thread-safe flag polled by the engine between stages.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RenderCancelled()
+
+
+@dataclass
+class RenderTicket(Generic[T]):
+    task: T
+    token: CancellationToken
+    preemptible: bool
+    submitted_at: float
+    started_at: Optional[float] = None
+
+
+@dataclass
+class RenderStats:
+    """
+    Rolling scheduler statistics (seconds).
+    queue_latency: submit -> start, frame_time: start -> finish.
+    """
+
+    queue_latency: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=STATS_WINDOW)
+    )
+    frame_time: Deque[float] = field(default_factory=lambda: deque(maxlen=STATS_WINDOW))
+    completed: int = 0
+    cancelled: int = 0
+    superseded: int = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        def _summary(name: str, values: Deque[float]) -> Dict[str, float]:
+            if not values:
+                return {f"{name}_mean": 0.0, f"{name}_max": 0.0}
+            return {
+                f"{name}_mean": sum(values) / len(values),
+                f"{name}_max": max(values),
+            }
+
+        res: Dict[str, float] = {
+            "completed": float(self.completed),
+            "cancelled": float(self.cancelled),
+            "superseded": float(self.superseded),
+        }
+        res.update(_summary("queue_latency", self.queue_latency))
+        res.update(_summary("frame_time", self.frame_time))
+        return res
+
+
+class RenderScheduler(Generic[T]):
+    """
+    Latest-wins render queue: at most one frame in flight and one pending.
+    A newer request replaces the pending one and cancels a preemptible
+    in-flight frame. Not thread-safe; owned by the UI thread.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Optional[RenderTicket[T]] = None
+        self._pending: Optional[RenderTicket[T]] = None
+        self.stats = RenderStats()
+
+    @property
+    def in_flight(self) -> Optional[RenderTicket[T]]:
+        return self._in_flight
+
+    @property
+    def pending(self) -> Optional[RenderTicket[T]]:
+        return self._pending
+
+    @property
+    def busy(self) -> bool:
+        return self._in_flight is not None
+
+    def submit(
+        self, task: T, token: CancellationToken, preemptible: bool = True
+    ) -> Optional[RenderTicket[T]]:
+        """
+        Queues a request. Returns the ticket to dispatch now, if the worker is idle.
+        """
+        if self._pending is not None:
+            self.stats.superseded += 1
+        self._pending = RenderTicket(task, token, preemptible, time.perf_counter())
+
+        if self._in_flight is None:
+            return self._start_next()
+        if self._in_flight.preemptible:
+            self._in_flight.token.cancel()
+        return None
+
+    def complete(self, cancelled: bool = False) -> Optional[RenderTicket[T]]:
+        """
+        Marks the in-flight frame done. Returns the next ticket to dispatch.
+        """
+        ticket = self._in_flight
+        if ticket is not None and ticket.started_at is not None:
+            if cancelled:
+                self.stats.cancelled += 1
+            else:
+                self.stats.completed += 1
+                self.stats.frame_time.append(time.perf_counter() - ticket.started_at)
+        self._in_flight = None
+        return self._start_next()
+
+    def cancel_all(self) -> None:
+        """
+        Cancels the in-flight frame and drops the pending one. The worker
+        still reports the cancelled frame, which is then completed as usual.
+        """
+        if self._in_flight is not None:
+            self._in_flight.token.cancel()
+        if self._pending is not None:
+            self.stats.superseded += 1
+        self._pending = None
+
+    def _start_next(self) -> Optional[RenderTicket[T]]:
+        ticket = self._pending
+        if ticket is None:
+            return None
+        self._pending = None
+        ticket.started_at = time.perf_counter()
+        self.stats.queue_latency.append(ticket.started_at - ticket.submitted_at)
+        self._in_flight = ticket
+        return ticket
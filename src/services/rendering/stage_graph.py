@@ -0,0 +1,90 @@
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig
+from src.domain.types import ImageBuffer
+from src.kernel.caching.logic import chain_config_hash
+
+StageFn = Callable[[ImageBuffer, PipelineContext], ImageBuffer]
+
+
+def resolve_config_path(settings: WorkspaceConfig, path: str) -> Any:
+    """
+    Reads a dotted config path (e.g. 'lab.sharpen') from the workspace.
+    """
+    value: Any = settings
+    for part in path.split("."):
+        if not is_dataclass(value) or part not in {f.name for f in fields(value)}:
+            raise ValueError(f"Unknown config path: {path}")
+        value = getattr(value, part)
+    return value
+
+
+@dataclass(frozen=True)
+class StageNode:
+    """
+    Cacheable pipeline step and the config fields it depends on.
+    """
+
+    name: str
+    processor: Any
+    section: str
+    after: Optional[str] = None
+    capture_as: Optional[str] = None
+
+    @property
+    def reads(self) -> Tuple[str, ...]:
+        return tuple(self.processor.READS)
+
+    def build(self, settings: WorkspaceConfig) -> StageFn:
+        processor = self.processor(getattr(settings, self.section))
+        fn: StageFn = processor.process
+        return fn
+
+
+class StageGraph:
+    """
+    Dependency graph of pipeline stages built from declared field reads.
+    A stage is dirty if any field it reads changed or any upstream stage is dirty.
+    """
+
+    def __init__(self, nodes: List[StageNode]) -> None:
+        self.nodes = nodes
+        self._by_name: Dict[str, StageNode] = {}
+        defaults = WorkspaceConfig()
+
+        for node in nodes:
+            if node.name in self._by_name:
+                raise ValueError(f"Duplicate stage: {node.name}")
+            if node.after is not None and node.after not in self._by_name:
+                raise ValueError(
+                    f"Stage '{node.name}' depends on unknown stage '{node.after}'"
+                )
+            for path in node.reads:
+                resolve_config_path(defaults, path)
+            self._by_name[node.name] = node
+
+    def stage_inputs(self, settings: WorkspaceConfig, node: StageNode) -> Tuple:
+        return tuple((p, resolve_config_path(settings, p)) for p in node.reads)
+
+    def stage_hashes(self, settings: WorkspaceConfig, root_hash: str) -> Dict[str, str]:
+        """
+        Per-stage hash of own inputs chained with the upstream stage hash.
+        """
+        hashes: Dict[str, str] = {}
+        for node in self.nodes:
+            parent = hashes[node.after] if node.after else root_hash
+            hashes[node.name] = chain_config_hash(
+                parent, self.stage_inputs(settings, node)
+            )
+        return hashes
+
+    def dirty_stages(
+        self, previous: WorkspaceConfig, current: WorkspaceConfig
+    ) -> List[str]:
+        """
+        Minimal set of stages to recompute for a settings change.
+        """
+        old = self.stage_hashes(previous, "")
+        new = self.stage_hashes(current, "")
+        return [node.name for node in self.nodes if old[node.name] != new[node.name]]
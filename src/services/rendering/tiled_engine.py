@@ -0,0 +1,617 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import cv2
+import numba
+import numpy as np
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig, ProcessMode
+from src.domain.types import ImageBuffer, ROI, Dimensions
+from src.features.exposure.normalization import (
+    LogNegativeBounds,
+    bounds_stride,
+    get_analysis_rect,
+    measure_linear_bounds,
+)
+from src.features.geometry.logic import (
+    apply_fine_rotation,
+    detect_autocrop_roi,
+    get_autocrop_detect_dims,
+    get_manual_rect_coords,
+)
+from src.features.exposure.processor import (
+    FusedPhotometricProcessor,
+    cached_log_bounds,
+)
+from src.features.geometry.models import GeometryConfig
+from src.features.lab.clahe import CLAHE_ANALYSIS_SIZE, ClaheLUTs, build_clahe_luts
+from src.features.toning.processor import (
+    BW_BLACK_POINT_PERCENTILE,
+    ToningProcessor,
+    apply_black_point,
+)
+from src.kernel.image.logic import get_luminance, uint16_to_float32
+from src.kernel.image.validation import ensure_image
+from src.kernel.system.config import APP_CONFIG
+from src.kernel.system.logging import get_logger
+from src.services.rendering.engine import build_stage_graph
+from src.services.rendering.stage_graph import StageFn
+
+logger = get_logger(__name__)
+
+TILE_SIZE = 1024
+MIN_TILE_SIZE = 64
+# Safety border on top of the computed stage footprints
+TILE_MARGIN = 4
+# Peak working set per window pixel: ~10 float32 RGB intermediates
+# (log, normalized, positive, retouch copies, LAB/HSV conversions)
+# plus the float32 retouch statistics planes.
+BYTES_PER_TILE_PIXEL = 160
+# Rows per strip when sampling the frame for bounds/black point
+STRIP_ROWS = 256
+# Concurrent tiles; the tile budget is split between them
+MAX_TILE_WORKERS = 4
+
+
+def tile_halo(settings: WorkspaceConfig, scale_factor: float) -> int:
+    """
+    Pixels of context a window needs around its core for the
+    neighbourhood stages (dust removal, healing, sharpening).
+    """
+    halo = TILE_MARGIN
+    retouch = settings.retouch
+
+    if retouch.dust_remove:
+        base_size, scale = max(1.0, float(retouch.dust_size)), max(1.0, scale_factor)
+        w_win = int(max(7, base_size * 4.0 * scale)) * 2 + 1
+        exp_rad = min(16, int(max(1.0, retouch.dust_size * 0.4 * scale_factor)))
+        p_rad = exp_rad + int(3 * scale_factor)
+        # Statistics window, 3x3 peak test, hit dilation, perimeter samples
+        halo += w_win // 2 + 1 + exp_rad + p_rad
+
+    if retouch.manual_dust_spots:
+        radius = max(
+            int(max(1, size * scale_factor)) for _, _, size in retouch.manual_dust_spots
+        )
+        inpaint_rad = int(3 * scale_factor) | 1
+        # Whole spot plus Telea neighbourhood and the feathered mask
+        halo += 2 * radius + inpaint_rad + inpaint_rad // 2 + 1
+
+    if settings.lab.sharpen > 0:
+        halo += max(3, int(5 * scale_factor) | 1) // 2
+
+    return halo
+
+
+def is_pointwise_only(settings: WorkspaceConfig) -> bool:
+    """
+    True when retouch and lab stages are pass-through for these settings.
+    """
+    retouch, lab = settings.retouch, settings.lab
+    return (
+        not retouch.dust_remove
+        and not retouch.manual_dust_spots
+        and lab.color_separation <= 1.0
+        and lab.saturation == 1.0
+        and lab.clahe_strength <= 0
+        and lab.sharpen <= 0
+    )
+
+
+def plan_tiles(rect: ROI, tile_size: int) -> List[ROI]:
+    """
+    Splits (y1, y2, x1, x2) into row-major core tiles.
+    """
+    y1, y2, x1, x2 = rect
+    return [
+        (ty, min(ty + tile_size, y2), tx, min(tx + tile_size, x2))
+        for ty in range(y1, y2, tile_size)
+        for tx in range(x1, x2, tile_size)
+    ]
+
+
+def parallel_tiles_supported() -> bool:
+    """
+    The workqueue numba layer aborts on concurrent parallel kernels, so
+    tiles then run one at a time; tbb and omp are thread-safe.
+    """
+    # The layer is only resolved by the first parallel launch
+    uint16_to_float32(np.zeros((1, 1, 3), dtype=np.uint16))
+    return str(numba.threading_layer()) != "workqueue"
+
+
+def to_float_image(arr: np.ndarray) -> ImageBuffer:
+    """
+    float32 [0, 1] view of a uint16 decode or float buffer.
+    """
+    if arr.dtype == np.uint16:
+        return ensure_image(uint16_to_float32(np.ascontiguousarray(arr)))
+    return ensure_image(np.ascontiguousarray(arr))
+
+
+def expand_tile(tile: ROI, halo: int, frame: Dimensions) -> ROI:
+    y1, y2, x1, x2 = tile
+    h, w = frame
+    return max(0, y1 - halo), min(h, y2 + halo), max(0, x1 - halo), min(w, x2 + halo)
+
+
+class GeometrySampler:
+    """
+    Reads windows of the rotated/flipped frame without materialising it.
+    A uint16 source is converted per window, never as a whole frame.
+    """
+
+    def __init__(self, img: ImageBuffer, config: GeometryConfig):
+        self.source = img
+        self.config = config
+
+        view = img
+        if config.rotation != 0:
+            view = np.rot90(view, k=config.rotation)
+        if config.flip_horizontal:
+            view = np.fliplr(view)
+        if config.flip_vertical:
+            view = np.flipud(view)
+        self._view = view
+
+        h, w = view.shape[:2]
+        self.shape: Dimensions = (h, w)
+
+        self._inv_mat: Optional[np.ndarray] = None
+        if config.fine_rotation != 0.0:
+            m_mat = cv2.getRotationMatrix2D(
+                (w / 2.0, h / 2.0), config.fine_rotation, 1.0
+            )
+            self._inv_mat = cv2.invertAffineTransform(m_mat)
+
+    def read(self, window: ROI) -> ImageBuffer:
+        y1, y2, x1, x2 = window
+        if self._inv_mat is None:
+            return to_float_image(self._view[y1:y2, x1:x2])
+        return self._read_rotated(window, self._inv_mat)
+
+    def _read_rotated(self, window: ROI, inv_mat: np.ndarray) -> ImageBuffer:
+        y1, y2, x1, x2 = window
+        h, w = self.shape
+        out_w, out_h = x2 - x1, y2 - y1
+
+        # Window-local destination -> frame source coordinates
+        mat = inv_mat.copy()
+        mat[:, 2] += inv_mat[:, :2] @ np.array([x1, y1], dtype=np.float64)
+
+        corners = np.array(
+            [
+                [0, 0, 1],
+                [out_w - 1, 0, 1],
+                [0, out_h - 1, 1],
+                [out_w - 1, out_h - 1, 1],
+            ],
+            dtype=np.float64,
+        )
+        src = corners @ mat.T
+        sx1 = max(0, int(np.floor(src[:, 0].min())) - 2)
+        sx2 = min(w, int(np.ceil(src[:, 0].max())) + 3)
+        sy1 = max(0, int(np.floor(src[:, 1].min())) - 2)
+        sy2 = min(h, int(np.ceil(src[:, 1].max())) + 3)
+
+        if sx1 >= sx2 or sy1 >= sy2:
+            return np.zeros((out_h, out_w, 3), dtype=np.float32)
+
+        region = to_float_image(self._view[sy1:sy2, sx1:sx2])
+        mat[:, 2] -= np.array([sx1, sy1], dtype=np.float64)
+
+        res = cv2.warpAffine(
+            region,
+            mat,
+            (out_w, out_h),
+            flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+            borderMode=cv2.BORDER_CONSTANT,
+            borderValue=(0, 0, 0),
+        )
+        return ensure_image(res)
+
+    def thumbnail(self, dims: Dimensions) -> ImageBuffer:
+        """
+        Downsampled frame for border detection. Resizes before orienting;
+        fine rotation is applied to the thumbnail.
+        """
+        d_h, d_w = dims
+        if self.config.rotation % 2:
+            d_h, d_w = d_w, d_h
+        small = cv2.resize(
+            np.ascontiguousarray(self.source), (d_w, d_h), interpolation=cv2.INTER_AREA
+        )
+
+        if self.config.rotation != 0:
+            small = np.rot90(small, k=self.config.rotation)
+        if self.config.flip_horizontal:
+            small = np.fliplr(small)
+        if self.config.flip_vertical:
+            small = np.flipud(small)
+        small = to_float_image(small)
+
+        return apply_fine_rotation(small, self.config.fine_rotation)
+
+
+@dataclass
+class TilePlan:
+    """
+    Frame-level state shared by every tile of one render.
+    """
+
+    sampler: GeometrySampler
+    context: PipelineContext
+    roi: ROI
+    halo: int
+    tile_size: int
+    workers: int
+    stages: List[StageFn]
+    base_metrics: Dict[str, Any]
+    clahe_luts: Optional[ClaheLUTs]
+    is_bw: bool
+
+
+class TiledExportEngine:
+    """
+    Bounded-memory CPU renderer for full resolution exports.
+    Streams geometry-space windows (core + halo) through the pipeline stages,
+    global statistics are gathered in separate passes.
+    """
+
+    def __init__(
+        self,
+        memory_budget: Optional[int] = None,
+        tile_size: int = TILE_SIZE,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.memory_budget = (
+            memory_budget
+            if memory_budget is not None
+            else APP_CONFIG.export_memory_bytes
+        )
+        self.tile_size = tile_size
+        self.workers = workers if workers is not None else APP_CONFIG.max_workers
+        self.graph = build_stage_graph()
+
+    def prepare(
+        self,
+        img: ImageBuffer,
+        settings: WorkspaceConfig,
+        scale_factor: float,
+        metrics: Optional[Dict[str, Any]] = None,
+        noise_seed: int = 0,
+    ) -> TilePlan:
+        """
+        Resolves crop, bounds and frame-global prepasses; tiles are then
+        rendered independently with render_core.
+        img: float32 or the uint16 decode (sampled per window).
+        """
+        if img.dtype != np.uint16:
+            img = ensure_image(img)
+        sampler = GeometrySampler(img, settings.geometry)
+        h, w = sampler.shape
+
+        context = PipelineContext(
+            scale_factor=scale_factor,
+            original_size=(img.shape[0], img.shape[1]),
+            process_mode=settings.process_mode,
+            noise_seed=noise_seed,
+        )
+        if metrics:
+            context.metrics.update(metrics)
+
+        roi = self._resolve_roi(sampler, settings, context)
+        context.active_roi = roi
+        y1, y2, x1, x2 = roi
+
+        is_bw = settings.process_mode == ProcessMode.BW
+        use_clahe = settings.lab.clahe_strength > 0
+
+        # Output frame; the source (ideally the uint16 decode) is not counted
+        fixed = (y2 - y1) * (x2 - x1) * 3 * 4
+        if is_bw:
+            # Luminance plane + percentile scratch
+            fixed += h * w * 8
+
+        halo = tile_halo(settings, scale_factor)
+        tile_size, workers = self._fit_tiles(self.memory_budget - fixed, halo)
+
+        bounds = self._resolve_bounds(sampler, settings, context, roi)
+        base_metrics: Dict[str, Any] = {
+            "log_bounds": bounds,
+            "log_bounds_buffer_val": settings.exposure.analysis_buffer,
+            "geometry_params": {
+                "rotation": settings.geometry.rotation,
+                "fine_rotation": settings.geometry.fine_rotation,
+                "flip_horizontal": settings.geometry.flip_horizontal,
+                "flip_vertical": settings.geometry.flip_vertical,
+            },
+        }
+
+        nodes = [n for n in self.graph.nodes if n.name != "geometry"]
+        stages: List[StageFn] = [n.build(settings) for n in nodes]
+        stages.append(ToningProcessor(settings.toning).process)
+        if is_pointwise_only(settings):
+            stages = [self._fused_stage(settings)]
+
+        clahe_luts: Optional[ClaheLUTs] = None
+        if use_clahe:
+            clahe_idx = [n.name for n in nodes].index("lab_lightness")
+            clahe_luts = self._clahe_prepass(
+                sampler,
+                stages[:clahe_idx],
+                base_metrics,
+                context,
+                settings.lab.clahe_strength,
+            )
+            base_metrics["clahe_luts"] = clahe_luts
+
+        if is_bw:
+            base_metrics["defer_black_point"] = True
+
+        return TilePlan(
+            sampler=sampler,
+            context=context,
+            roi=roi,
+            halo=halo,
+            tile_size=tile_size,
+            workers=workers,
+            stages=stages,
+            base_metrics=base_metrics,
+            clahe_luts=clahe_luts,
+            is_bw=is_bw,
+        )
+
+    def render_core(self, plan: TilePlan, core: ROI) -> ImageBuffer:
+        """
+        Renders one geometry-space rect (halo added and trimmed internally).
+        B&W output is before the frame-global black point.
+        """
+        window = expand_tile(core, plan.halo, plan.sampler.shape)
+        res = self._run_window(
+            plan.sampler, window, plan.stages, dict(plan.base_metrics), plan.context
+        )
+        return res[
+            core[0] - window[0] : core[1] - window[0],
+            core[2] - window[2] : core[3] - window[2],
+        ]
+
+    def process(
+        self,
+        img: ImageBuffer,
+        settings: WorkspaceConfig,
+        scale_factor: float,
+        metrics: Optional[Dict[str, Any]] = None,
+        noise_seed: int = 0,
+    ) -> ImageBuffer:
+        """
+        metrics: seeds (bounds, autocrop ROI); updated with the resolved analysis.
+        """
+        plan = self.prepare(img, settings, scale_factor, metrics, noise_seed)
+        if metrics is not None:
+            metrics["log_bounds"] = plan.base_metrics["log_bounds"]
+            metrics["log_bounds_buffer_val"] = plan.base_metrics[
+                "log_bounds_buffer_val"
+            ]
+            if not settings.geometry.manual_crop_rect:
+                metrics["autocrop_roi"] = plan.roi
+        h, w = plan.sampler.shape
+        y1, y2, x1, x2 = plan.roi
+
+        out = np.empty((y2 - y1, x2 - x1, 3), dtype=np.float32)
+        lum: Optional[np.ndarray] = (
+            np.empty((h, w), dtype=np.float32) if plan.is_bw else None
+        )
+        # B&W black point is measured over the whole (uncropped) frame
+        rect = (0, h, 0, w) if plan.is_bw else plan.roi
+
+        tiles = plan_tiles(rect, plan.tile_size)
+        logger.debug(
+            f"Tiled export: {len(tiles)} tiles of {plan.tile_size}px "
+            f"(+{plan.halo}px halo), {plan.workers} workers"
+        )
+
+        def render(core: ROI) -> None:
+            # Tiles write disjoint regions of out/lum
+            core_res = self.render_core(plan, core)
+
+            if lum is not None:
+                lum[core[0] : core[1], core[2] : core[3]] = get_luminance(core_res)
+
+            oy1, oy2 = max(core[0], y1), min(core[1], y2)
+            ox1, ox2 = max(core[2], x1), min(core[3], x2)
+            if oy1 < oy2 and ox1 < ox2:
+                out[oy1 - y1 : oy2 - y1, ox1 - x1 : ox2 - x1] = core_res[
+                    oy1 - core[0] : oy2 - core[0], ox1 - core[2] : ox2 - core[2]
+                ]
+
+        if plan.workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=plan.workers, thread_name_prefix="tile"
+            ) as pool:
+                list(pool.map(render, tiles))
+        else:
+            for core in tiles:
+                render(core)
+
+        if lum is not None:
+            black_point = float(np.percentile(lum, BW_BLACK_POINT_PERCENTILE))
+            del lum
+            for sy in range(0, out.shape[0], STRIP_ROWS):
+                strip = out[sy : sy + STRIP_ROWS]
+                strip[:] = apply_black_point(strip, black_point)
+
+        return out
+
+    def _fused_stage(self, settings: WorkspaceConfig) -> StageFn:
+        """
+        Whole chain as one pointwise pass (linear -> toned positive).
+        """
+        photometric = FusedPhotometricProcessor(settings.exposure)
+        toning = ToningProcessor(settings.toning)
+
+        def run(image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
+            chain = photometric.chain(image, context).then(toning.chain(context))
+            return toning.finish(chain.apply(image), context)
+
+        return run
+
+    def _fit_tiles(self, available: int, halo: int) -> Tuple[int, int]:
+        """
+        (core size, workers): each concurrent tile gets an equal share of
+        the remaining budget, dropping to one worker before MIN_TILE_SIZE.
+        """
+        workers = 1
+        if parallel_tiles_supported():
+            workers = max(1, min(self.workers, MAX_TILE_WORKERS))
+        for n in range(workers, 1, -1):
+            try:
+                return self._fit_tile_size(available // n, halo), n
+            except MemoryError:
+                continue
+        return self._fit_tile_size(available, halo), 1
+
+    def _fit_tile_size(self, available: int, halo: int) -> int:
+        """
+        Largest core size whose working set fits the given budget.
+        """
+        tile_size = self.tile_size
+        while True:
+            side = tile_size + 2 * halo
+            if side * side * BYTES_PER_TILE_PIXEL <= available:
+                return tile_size
+            if tile_size <= MIN_TILE_SIZE:
+                raise MemoryError(
+                    f"Export needs more than the {self.memory_budget} byte budget "
+                    f"(halo {halo}px, {max(0, available)} bytes left for tiles)"
+                )
+            tile_size = max(MIN_TILE_SIZE, tile_size // 2)
+
+    def _run_window(
+        self,
+        sampler: GeometrySampler,
+        window: ROI,
+        stages: List[StageFn],
+        metrics: Dict[str, Any],
+        context: PipelineContext,
+    ) -> ImageBuffer:
+        tile_ctx = PipelineContext(
+            original_size=context.original_size,
+            scale_factor=context.scale_factor,
+            process_mode=context.process_mode,
+            metrics=metrics,
+            tile_rect=window,
+            frame_size=sampler.shape,
+            noise_seed=context.noise_seed,
+        )
+        res = sampler.read(window)
+        for stage in stages:
+            res = stage(res, tile_ctx)
+        return res
+
+    def _clahe_prepass(
+        self,
+        sampler: GeometrySampler,
+        stages: List[StageFn],
+        metrics: Dict[str, Any],
+        context: PipelineContext,
+        strength: float,
+    ) -> ClaheLUTs:
+        """
+        CLAHE tile curves measured on a preview-sized render of the chain
+        feeding CLAHE; tiles then apply them without a full-frame L plane.
+        """
+        h, w = sampler.shape
+        ratio = min(1.0, CLAHE_ANALYSIS_SIZE / max(h, w))
+        small = sampler.thumbnail((max(1, round(h * ratio)), max(1, round(w * ratio))))
+        small_ctx = PipelineContext(
+            original_size=context.original_size,
+            scale_factor=context.scale_factor * ratio,
+            process_mode=context.process_mode,
+            metrics=dict(metrics),
+            noise_seed=context.noise_seed,
+        )
+        res = small
+        for stage in stages:
+            res = stage(res, small_ctx)
+        lab = cv2.cvtColor(np.asarray(res, dtype=np.float32), cv2.COLOR_RGB2LAB)
+        return build_clahe_luts(lab[:, :, 0], strength * 2.5)
+
+    def _resolve_roi(
+        self,
+        sampler: GeometrySampler,
+        settings: WorkspaceConfig,
+        context: PipelineContext,
+    ) -> ROI:
+        geo = settings.geometry
+        if geo.manual_crop_rect:
+            return get_manual_rect_coords(
+                sampler.shape,
+                geo.manual_crop_rect,
+                orig_shape=context.original_size,
+                rotation_k=geo.rotation,
+                fine_rotation=geo.fine_rotation,
+                flip_horizontal=geo.flip_horizontal,
+                flip_vertical=geo.flip_vertical,
+                offset_px=0,
+                scale_factor=context.scale_factor,
+            )
+
+        seeded: Optional[ROI] = context.metrics.get("autocrop_roi")
+        if seeded is not None:
+            return seeded
+        small = sampler.thumbnail(get_autocrop_detect_dims(sampler.shape))
+        return detect_autocrop_roi(
+            small,
+            sampler.shape,
+            offset_px=geo.autocrop_offset,
+            scale_factor=context.scale_factor,
+            target_ratio_str=geo.autocrop_ratio,
+        )
+
+    def _resolve_bounds(
+        self,
+        sampler: GeometrySampler,
+        settings: WorkspaceConfig,
+        context: PipelineContext,
+        roi: ROI,
+    ) -> LogNegativeBounds:
+        cached = cached_log_bounds(context.metrics, settings.exposure.analysis_buffer)
+        if cached is not None:
+            return cached
+        return self._measure_bounds(sampler, roi, settings.exposure.analysis_buffer)
+
+    def _measure_bounds(
+        self, sampler: GeometrySampler, roi: ROI, buffer_ratio: float
+    ) -> LogNegativeBounds:
+        """
+        Same percentiles as NormalizationProcessor, gathered in strips.
+        Strided like measure_linear_bounds, and further when the sample
+        exceeds half the budget.
+        """
+        y1, y2, x1, x2 = roi
+        ay1, ay2, ax1, ax2 = get_analysis_rect(y2 - y1, x2 - x1, buffer_ratio)
+        ay1, ay2, ax1, ax2 = ay1 + y1, ay2 + y1, ax1 + x1, ax2 + x1
+
+        # 3 channel samples + quantile scratch
+        stride = bounds_stride(ay2 - ay1, ax2 - ax1)
+        while ((ay2 - ay1 + stride - 1) // stride) * (
+            (ax2 - ax1 + stride - 1) // stride
+        ) * 16 > self.memory_budget // 2:
+            stride += 1
+        if stride > 1:
+            logger.debug(f"Tiled export: sampling bounds with stride {stride}")
+
+        n_rows = (ay2 - ay1 + stride - 1) // stride
+        n_cols = (ax2 - ax1 + stride - 1) // stride
+        samples = np.empty((n_rows, n_cols, 3), dtype=np.float32)
+
+        strip_h = max(1, STRIP_ROWS // stride) * stride
+        row = 0
+        for sy in range(ay1, ay2, strip_h):
+            strip = sampler.read((sy, min(sy + strip_h, ay2), ax1, ax2))
+            strip = strip[::stride, ::stride]
+            samples[row : row + strip.shape[0]] = strip
+            row += strip.shape[0]
+
+        return measure_linear_bounds(samples, stride=1)
@@ -0,0 +1,181 @@
+import math
+from typing import Any, Dict, Optional, Tuple
+import cv2
+import numpy as np
+from src.domain.models import WorkspaceConfig
+from src.domain.types import ImageBuffer, ROI, Dimensions
+from src.features.toning.processor import apply_black_point
+from src.kernel.caching.logic import CacheEntry, calculate_config_hash
+from src.kernel.caching.manager import PipelineCache
+from src.kernel.image.noise import noise_seed
+from src.kernel.image.validation import ensure_image
+from src.kernel.system.config import APP_CONFIG
+from src.services.rendering.scheduler import CancellationToken
+from src.services.rendering.tiled_engine import TiledExportEngine, TilePlan
+
+# Grid (geometry space, full resolution) that viewport tiles are cached on
+VIEWPORT_TILE_SIZE = 512
+
+# Normalized (x1, y1, x2, y2) within the cropped output frame
+Viewport = Tuple[float, float, float, float]
+
+
+def viewport_to_frame_rect(viewport: Viewport, roi: ROI) -> ROI:
+    """
+    Maps a normalized viewport of the cropped output to a geometry-space rect.
+    """
+    nx1, ny1, nx2, ny2 = (float(np.clip(v, 0.0, 1.0)) for v in viewport)
+    nx1, nx2 = min(nx1, nx2), max(nx1, nx2)
+    ny1, ny2 = min(ny1, ny2), max(ny1, ny2)
+
+    y1, y2, x1, x2 = roi
+    h, w = y2 - y1, x2 - x1
+    ry1 = y1 + min(h - 1, int(math.floor(ny1 * h)))
+    rx1 = x1 + min(w - 1, int(math.floor(nx1 * w)))
+    ry2 = max(ry1 + 1, y1 + int(math.ceil(ny2 * h)))
+    rx2 = max(rx1 + 1, x1 + int(math.ceil(nx2 * w)))
+    return ry1, ry2, rx1, rx2
+
+
+def grid_tiles(rect: ROI, tile_size: int, frame: Dimensions) -> list[ROI]:
+    """
+    Fixed-grid tiles intersecting rect, so panning hits the same cache keys.
+    """
+    y1, y2, x1, x2 = rect
+    h, w = frame
+    return [
+        (ty, min(ty + tile_size, h), tx, min(tx + tile_size, w))
+        for ty in range(y1 // tile_size * tile_size, y2, tile_size)
+        for tx in range(x1 // tile_size * tile_size, x2, tile_size)
+    ]
+
+
+class ViewportRenderer:
+    """
+    Renders the visible part of the frame at native resolution for zoomed
+    inspection. Frame-global state (crop, bounds, CLAHE, black point) is
+    resolved once per settings; rendered tiles are cached for panning.
+    """
+
+    def __init__(
+        self,
+        cache_bytes: Optional[int] = None,
+        tile_size: int = VIEWPORT_TILE_SIZE,
+        memory_budget: Optional[int] = None,
+    ) -> None:
+        self.tile_size = tile_size
+        self.engine = TiledExportEngine(memory_budget=memory_budget)
+        self.cache = PipelineCache(
+            max_bytes=cache_bytes
+            if cache_bytes is not None
+            else APP_CONFIG.viewport_cache_bytes
+        )
+        self._plan: Optional[Tuple[str, TilePlan]] = None
+
+    @staticmethod
+    def plan_key(
+        img: ImageBuffer,
+        settings: WorkspaceConfig,
+        source_hash: str,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Settings plus the preview metrics the plan is seeded from, so a
+        re-measured preview (bounds, autocrop, black point) drops stale tiles.
+        """
+        metrics = metrics or {}
+        bounds = metrics.get("log_bounds")
+        return calculate_config_hash(
+            (
+                source_hash,
+                img.shape,
+                settings.process_mode,
+                settings.exposure,
+                settings.geometry,
+                settings.lab,
+                settings.retouch,
+                settings.toning,
+                (bounds.floors, bounds.ceils) if bounds is not None else None,
+                metrics.get("log_bounds_buffer_val"),
+                metrics.get("autocrop_roi"),
+                metrics.get("bw_black_point"),
+            )
+        )
+
+    def render(
+        self,
+        img: ImageBuffer,
+        settings: WorkspaceConfig,
+        source_hash: str,
+        viewport: Viewport,
+        metrics: Optional[Dict[str, Any]] = None,
+        out_size: Optional[Dimensions] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ImageBuffer:
+        """
+        img: full resolution linear source. metrics: from the preview render,
+        supplies the log bounds and B&W black point so the loupe matches it.
+        out_size: (h, w) cap; larger viewports are downsampled.
+        """
+        metrics = metrics or {}
+        key = self.plan_key(img, settings, source_hash, metrics)
+        plan = self._get_plan(key, img, settings, source_hash, metrics)
+
+        rect = viewport_to_frame_rect(viewport, plan.roi)
+        y1, y2, x1, x2 = rect
+        out = np.empty((y2 - y1, x2 - x1, 3), dtype=np.float32)
+
+        for core in grid_tiles(rect, self.tile_size, plan.sampler.shape):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            stage = f"viewport_{core[0]}_{core[2]}"
+            entry = self.cache.get(source_hash, stage, key)
+            if entry is None:
+                tile = np.ascontiguousarray(self.engine.render_core(plan, core))
+                entry = CacheEntry(key, tile, {})
+                self.cache.put(source_hash, stage, key, entry)
+
+            oy1, oy2 = max(core[0], y1), min(core[1], y2)
+            ox1, ox2 = max(core[2], x1), min(core[3], x2)
+            out[oy1 - y1 : oy2 - y1, ox1 - x1 : ox2 - x1] = entry.data[
+                oy1 - core[0] : oy2 - core[0], ox1 - core[2] : ox2 - core[2]
+            ]
+
+        if plan.is_bw:
+            # GPU previews skip the black point, so default to none
+            out = apply_black_point(out, float(metrics.get("bw_black_point", 0.0)))
+
+        if out_size is not None:
+            o_h, o_w = out_size
+            if out.shape[0] > o_h or out.shape[1] > o_w:
+                scale = min(o_h / out.shape[0], o_w / out.shape[1])
+                dims = (
+                    max(1, round(out.shape[1] * scale)),
+                    max(1, round(out.shape[0] * scale)),
+                )
+                out = ensure_image(cv2.resize(out, dims, interpolation=cv2.INTER_AREA))
+
+        return ensure_image(np.clip(out, 0.0, 1.0))
+
+    def _get_plan(
+        self,
+        key: str,
+        img: ImageBuffer,
+        settings: WorkspaceConfig,
+        source_hash: str,
+        metrics: Dict[str, Any],
+    ) -> TilePlan:
+        if self._plan is not None and self._plan[0] == key:
+            return self._plan[1]
+
+        scale_factor = max(img.shape[:2]) / float(APP_CONFIG.preview_render_size)
+        plan = self.engine.prepare(
+            img, settings, scale_factor, metrics, noise_seed(source_hash)
+        )
+        self._plan = (key, plan)
+        return plan
+
+    def clear(self) -> None:
+        self._plan = None
+        self.cache.clear()
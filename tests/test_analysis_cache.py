@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from src.domain.models import WorkspaceConfig
+from src.features.exposure.normalization import LogNegativeBounds
+from src.infrastructure.storage.repository import (
+    ANALYSIS_ROWS_PER_KIND,
+    StorageRepository,
+)
+from src.services.rendering.analysis_cache import (
+    AnalysisCache,
+    decode_bounds,
+    decode_roi,
+    encode_bounds,
+    encode_roi,
+)
+from src.services.rendering.image_processor import ImageProcessor
+
+
+@pytest.fixture
+def repo(tmp_path) -> StorageRepository:
+    repo = StorageRepository(str(tmp_path / "edits.db"), str(tmp_path / "settings.db"))
+    repo.initialize()
+    return repo
+
+
+def _frame() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.05, 0.6, (120, 180, 3)).astype(np.float32)
+
+
+def test_codecs_roundtrip() -> None:
+    bounds = LogNegativeBounds((-1.5, -1.4, -1.3), (-0.2, -0.1, 0.0))
+    res = decode_bounds(encode_bounds(bounds))
+    assert res.floors == bounds.floors and res.ceils == bounds.ceils
+    assert len(encode_bounds(bounds)) == 48
+    assert decode_roi(encode_roi((1, 2, 3, 4))) == (1, 2, 3, 4)
+
+
+def test_repository_analysis_table(repo: StorageRepository) -> None:
+    assert repo.load_analysis("f", "log_bounds", "k") is None
+    repo.save_analysis("f", "log_bounds", "k", b"\x01\x02")
+    assert repo.load_analysis("f", "log_bounds", "k") == b"\x01\x02"
+    assert repo.load_analysis("f", "log_bounds", "other") is None
+
+
+def test_repository_prunes_old_analysis_rows(repo: StorageRepository) -> None:
+    for i in range(ANALYSIS_ROWS_PER_KIND + 2):
+        repo.save_analysis("f", "log_bounds", f"k{i}", b"x")
+    repo.save_analysis("f", "autocrop_roi", "k0", b"r")
+
+    assert repo.load_analysis("f", "log_bounds", "k0") is None
+    assert repo.load_analysis("f", "log_bounds", "k1") is None
+    assert repo.load_analysis("f", "log_bounds", f"k{ANALYSIS_ROWS_PER_KIND + 1}")
+    # Pruning is per kind
+    assert repo.load_analysis("f", "autocrop_roi", "k0") == b"r"
+
+
+def test_keys_follow_dependencies() -> None:
+    base = WorkspaceConfig()
+    keys = AnalysisCache.params_keys(base, (10, 10, 3), 1.0, "sRGB:cpu")
+
+    buffered = WorkspaceConfig.from_flat_dict({"analysis_buffer": 0.1})
+    other = AnalysisCache.params_keys(buffered, (10, 10, 3), 1.0, "sRGB:cpu")
+    assert other["autocrop_roi"] == keys["autocrop_roi"]
+    assert other["log_bounds"] != keys["log_bounds"]
+
+    # Exposure edits do not invalidate analysis
+    dense = WorkspaceConfig.from_flat_dict({"density": 1.4})
+    assert AnalysisCache.params_keys(dense, (10, 10, 3), 1.0, "sRGB:cpu") == keys
+
+    manual = WorkspaceConfig.from_flat_dict({"manual_crop_rect": (0.1, 0.1, 0.9, 0.9)})
+    assert "autocrop_roi" not in AnalysisCache.params_keys(
+        manual, (10, 10, 3), 1.0, "sRGB:cpu"
+    )
+
+
+def test_draft_variant_keeps_file_grain_seed(repo: StorageRepository) -> None:
+    img = _frame()
+    settings = WorkspaceConfig.from_flat_dict({"manual_dust_spots": [(0.5, 0.5, 6.0)]})
+    processor = ImageProcessor(AnalysisCache(repo))
+
+    refined, _ = processor.run_pipeline(img, settings, "file", 180.0, prefer_gpu=False)
+    draft, _ = processor.run_pipeline(
+        img, settings, "file:draft", 180.0, prefer_gpu=False, file_hash="file"
+    )
+    assert np.array_equal(refined, draft)
+
+
+def test_reopened_frame_skips_measurement(repo: StorageRepository, monkeypatch) -> None:
+    img = _frame()
+    settings = WorkspaceConfig()
+
+    first, metrics = ImageProcessor(AnalysisCache(repo)).run_pipeline(
+        img, settings, "file", 180.0, prefer_gpu=False, color_space="sRGB"
+    )
+    assert "autocrop_roi" in metrics
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("measured again")
+
+    monkeypatch.setattr("src.features.exposure.processor.measure_linear_bounds", _fail)
+    monkeypatch.setattr("src.features.geometry.processor.get_autocrop_coords", _fail)
+
+    # Fresh processor: empty in-memory stage cache, as after a restart
+    second, metrics2 = ImageProcessor(AnalysisCache(repo)).run_pipeline(
+        img, settings, "file", 180.0, prefer_gpu=False, color_space="sRGB"
+    )
+    assert np.array_equal(first, second)
+    assert metrics2["active_roi"] == metrics["active_roi"]
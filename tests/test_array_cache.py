@@ -0,0 +1,68 @@
+import os
+import time
+import numpy as np
+import tifffile
+from src.infrastructure.storage.array_cache import ArrayDiskCache
+from src.services.rendering.preview_manager import PreviewManager
+
+
+def test_roundtrip_is_memory_mapped(tmp_path) -> None:
+    cache = ArrayDiskCache(str(tmp_path), 1 << 20)
+    arr = np.arange(60, dtype=np.float16).reshape(4, 5, 3)
+    cache.put("a", arr, {"original_size": [40, 50]})
+
+    hit = cache.get("a")
+    assert hit is not None
+    res, meta = hit
+    assert isinstance(res, np.memmap)
+    assert np.array_equal(res, arr)
+    assert meta == {"original_size": [40, 50]}
+    assert cache.get("missing") is None
+
+
+def test_lru_pruning_keeps_recent_entries(tmp_path) -> None:
+    arr = np.zeros((100, 100), dtype=np.uint16)
+    entry = arr.nbytes + 128
+    cache = ArrayDiskCache(str(tmp_path), 2 * entry + 64)
+
+    cache.put("a", arr, {})
+    cache.put("b", arr, {})
+    # Touch "a" so "b" is the least recently used
+    past = time.time() - 10
+    os.utime(tmp_path / "b.npy", (past, past))
+    cache.get("a")
+    cache.put("c", arr, {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_preview_cache_hit_skips_decode(tmp_path, monkeypatch) -> None:
+    src = str(tmp_path / "frame.tif")
+    rng = np.random.default_rng(0)
+    tifffile.imwrite(src, rng.integers(0, 65535, (300, 400, 3), dtype=np.uint16))
+
+    manager = PreviewManager(ArrayDiskCache(str(tmp_path / "previews"), 1 << 26))
+    first, dims, _ = manager.load_preview(src, "hash", "Adobe RGB")
+    assert dims == (300, 400)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("decoded again")
+
+    monkeypatch.setattr(PreviewManager, "load_linear_preview", _fail)
+    second, dims2, _ = manager.load_preview(src, "hash", "Adobe RGB")
+    assert dims2 == dims
+    assert second.dtype == np.float32
+    assert np.array_equal(first, second)
+
+
+def test_prune_skips_entries_removed_concurrently(tmp_path, monkeypatch) -> None:
+    arr = np.zeros((10, 10), dtype=np.uint16)
+    cache = ArrayDiskCache(str(tmp_path), 1024 * 1024)
+    real_listdir = os.listdir
+    # An entry deleted between listdir and stat
+    monkeypatch.setattr(os, "listdir", lambda p: real_listdir(p) + ["ghost.npy"])
+
+    cache.put("a", arr, {})
+    assert cache.get("a") is not None
@@ -1,5 +1,5 @@
 from src.kernel.caching.logic import calculate_config_hash, CacheEntry
-from src.kernel.caching.manager import PipelineCache
+from src.kernel.caching.manager import KeyedLRU, PipelineCache
 from src.features.exposure.models import ExposureConfig
 import numpy as np
 
@@ -23,16 +23,87 @@ def test_calculate_config_hash_difference() -> None:
     assert calculate_config_hash(config1) != calculate_config_hash(config2)
 
 
+def _entry(shape: tuple = (10, 10)) -> CacheEntry:
+    return CacheEntry(
+        config_hash="abc", data=np.zeros(shape, dtype=np.float32), metrics={}
+    )
+
+
 def test_pipeline_cache_clear() -> None:
     cache = PipelineCache()
-    dummy_data = np.zeros((10, 10), dtype=np.float32)
-    entry = CacheEntry(config_hash="abc", data=dummy_data, metrics={})
-
-    cache.source_hash = "source1"
-    cache.base = entry
+    cache.put("source1", "base", "abc", _entry())
 
     cache.clear()
 
-    assert cache.source_hash == ""
-    assert cache.base is None
-    assert cache.exposure is None
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+    assert cache.get("source1", "base", "abc") is None
+
+
+def test_pipeline_cache_keeps_multiple_sources() -> None:
+    cache = PipelineCache()
+    cache.put("frame1", "base", "abc", _entry())
+    cache.put("frame2", "base", "abc", _entry())
+
+    assert cache.get("frame1", "base", "abc") is not None
+    assert cache.get("frame2", "base", "abc") is not None
+    assert cache.get("frame1", "lab", "abc") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_pipeline_cache_lru_eviction() -> None:
+    entry_bytes = 10 * 10 * 4
+    cache = PipelineCache(max_bytes=entry_bytes * 2)
+    cache.put("a", "base", "h", _entry())
+    cache.put("b", "base", "h", _entry())
+
+    # Touch 'a' so 'b' becomes least recently used
+    assert cache.get("a", "base", "h") is not None
+    cache.put("c", "base", "h", _entry())
+
+    assert ("b", "base", "h") not in cache
+    assert ("a", "base", "h") in cache
+    assert ("c", "base", "h") in cache
+    assert cache.stats.evictions == 1
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_pipeline_cache_skips_oversized_entries() -> None:
+    cache = PipelineCache(max_bytes=100)
+    cache.put("a", "base", "h", _entry())
+
+    assert len(cache) == 0
+
+
+def test_pipeline_cache_counts_shared_buffers_once() -> None:
+    capture = np.zeros((10, 10), dtype=np.float32)
+    cache = PipelineCache()
+    for stage in ("retouch", "lab", "toning"):
+        entry = _entry()
+        entry.metrics["retouch_source"] = capture
+        cache.put("a", stage, "h", entry)
+
+    frame_bytes = 10 * 10 * 4
+    assert cache.total_bytes == 4 * frame_bytes
+
+    cache.invalidate_source("a")
+    assert cache.total_bytes == 0
+
+
+def test_keyed_lru_byte_cap() -> None:
+    lru: KeyedLRU[np.ndarray] = KeyedLRU(4, max_bytes=1000)
+    lru.get_or_create("a", lambda: np.zeros(100, dtype=np.float32))
+    lru.get_or_create("b", lambda: np.zeros(100, dtype=np.float32))
+    assert len(lru) == 2
+
+    # Over the cap: the oldest entry goes
+    lru.get_or_create("c", lambda: np.zeros(100, dtype=np.float32))
+    assert len(lru) == 2 and lru.total_bytes == 800
+
+    # Larger than the cap on its own: served, not kept
+    big = lru.get_or_create("d", lambda: np.zeros(1000, dtype=np.float32))
+    assert big.shape == (1000,)
+    assert len(lru) == 2 and lru.total_bytes == 800
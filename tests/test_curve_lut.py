@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from src.features.exposure.logic import apply_characteristic_curve, get_curve_params
+from src.features.exposure.lut import (
+    apply_curve_lut,
+    bake_curve_lut,
+    get_curve_lut,
+)
+from src.features.exposure.models import ExposureConfig
+
+CONFIGS = [
+    ExposureConfig(),
+    ExposureConfig(density=0.2, grade=4.5, wb_cyan=0.8, wb_yellow=-0.6),
+    ExposureConfig(toe=1.0, toe_hardness=3.0, shoulder=1.0, shoulder_width=6.0),
+]
+
+
+def _analytic(img: np.ndarray, config: ExposureConfig) -> np.ndarray:
+    pivot, slope, cmy = get_curve_params(config)
+    return apply_characteristic_curve(
+        img,
+        (pivot, slope),
+        (pivot, slope),
+        (pivot, slope),
+        toe=config.toe,
+        toe_width=config.toe_width,
+        toe_hardness=config.toe_hardness,
+        shoulder=config.shoulder,
+        shoulder_width=config.shoulder_width,
+        shoulder_hardness=config.shoulder_hardness,
+        cmy_offsets=cmy,
+    )
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_lut_within_documented_bound(config: ExposureConfig) -> None:
+    img = np.random.default_rng(1).random((128, 96, 3), dtype=np.float32)
+    lut = bake_curve_lut(config)
+
+    err = np.max(np.abs(apply_curve_lut(img, lut) - _analytic(img, config)))
+    # float32 rounding of table and reference on top of interpolation error
+    assert err <= lut.max_error + 1e-6
+    assert lut.max_error < 1e-5
+
+
+def test_lut_endpoints_are_exact() -> None:
+    config = CONFIGS[1]
+    img = np.array([[[0.0, 1.0, 0.0]]], dtype=np.float32)
+    res = apply_curve_lut(img, bake_curve_lut(config))
+    assert np.allclose(res, _analytic(img, config), atol=1e-7)
+
+
+def test_lut_cached_by_config() -> None:
+    a = get_curve_lut(ExposureConfig(density=0.7))
+    b = get_curve_lut(ExposureConfig(density=0.7, analysis_buffer=0.2))
+    c = get_curve_lut(ExposureConfig(density=0.8))
+    assert a is b
+    assert a is not c
@@ -49,3 +49,53 @@ def test_image_service_jit_conversions() -> None:
     f32_res_u8 = uint8_to_float32(np.ascontiguousarray(u8_arr))
     assert f32_res_u8.dtype == np.float32
     assert np.allclose(f32_res_u8, [[[0.0, 127 / 255, 1.0]]])
+
+
+def test_repeat_export_reuses_decoded_source(tmp_path, monkeypatch) -> None:
+    from src.domain.models import ExportConfig, ExportFormat
+    from src.infrastructure.loaders.factory import loader_factory
+    from src.infrastructure.loaders.tiff_loader import NonStandardFileWrapper
+    from src.infrastructure.storage.array_cache import ArrayDiskCache
+
+    src = tmp_path / "frame.dng"
+    src.write_bytes(b"\x00" * 16)
+    rng = np.random.default_rng(0)
+    data = rng.uniform(0.05, 0.6, (120, 180, 3)).astype(np.float32)
+    decodes = []
+
+    def _get_loader(path: str):
+        raw = NonStandardFileWrapper(data)
+        original = raw.postprocess
+
+        def _postprocess(**kwargs):
+            decodes.append(path)
+            return original(**kwargs)
+
+        raw.postprocess = _postprocess  # type: ignore[method-assign]
+        return raw, {"color_space": "Adobe RGB"}
+
+    monkeypatch.setattr(loader_factory, "get_loader", _get_loader)
+    cache = ArrayDiskCache(str(tmp_path / "decoded"), 1 << 24)
+    service = ImageProcessor(decode_cache=cache)
+    params = WorkspaceConfig()
+
+    outputs = []
+    for size in (5.0, 10.0):
+        settings = ExportConfig(export_fmt=ExportFormat.TIFF, export_print_size=size)
+        out, fmt = service.process_export(
+            str(src), params, settings, "hash", prefer_gpu=False
+        )
+        assert out is not None and fmt == "tiff"
+        outputs.append(out)
+
+    assert len(decodes) == 1
+    assert cache.total_bytes > 0
+
+    uncached, _ = ImageProcessor().process_export(
+        str(src),
+        params,
+        ExportConfig(export_fmt=ExportFormat.TIFF, export_print_size=10.0),
+        "hash",
+        prefer_gpu=False,
+    )
+    assert uncached == outputs[1]
@@ -0,0 +1,113 @@
+import os
+import numpy as np
+import pytest
+import tifffile
+from src.infrastructure.loaders.factory import loader_factory
+from src.infrastructure.storage.catalog import FileCatalog, FileRecord
+from src.services.assets import indexer as indexer_module
+from src.services.assets.indexer import LibraryIndexer
+
+
+@pytest.fixture
+def catalog(tmp_path) -> FileCatalog:
+    cat = FileCatalog(str(tmp_path / "cache" / "catalog.db"))
+    cat.initialize()
+    return cat
+
+
+def _write_tiff(path: str, h: int, w: int) -> None:
+    tifffile.imwrite(path, np.zeros((h, w, 3), dtype=np.uint16), photometric="rgb")
+
+
+def test_probe_reads_headers(tmp_path) -> None:
+    tif = str(tmp_path / "scan.tif")
+    _write_tiff(tif, 40, 60)
+    assert loader_factory.probe(tif) == {
+        "width": 60,
+        "height": 40,
+        "sensor": "Scan",
+        "has_thumbnail": False,
+    }
+
+    pakon = str(tmp_path / "frame.raw")
+    np.zeros(3 * 1000 * 1500, dtype="<u2").tofile(pakon)
+    facts = loader_factory.probe(pakon)
+    assert (facts["width"], facts["height"], facts["sensor"]) == (1500, 1000, "Pakon")
+
+
+def test_index_skips_unchanged_files(
+    catalog: FileCatalog, tmp_path, monkeypatch
+) -> None:
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / f"scan_{i}.tif")
+        _write_tiff(path, 20 + i, 30)
+        paths.append(path)
+
+    probed = []
+    real_extract = indexer_module.extract_record
+
+    def _counting(path, size, mtime):
+        probed.append(path)
+        return real_extract(path, size, mtime)
+
+    monkeypatch.setattr(indexer_module, "extract_record", _counting)
+    indexer = LibraryIndexer(catalog, max_workers=2)
+
+    first = indexer.index(paths + [str(tmp_path / "missing.tif")])
+    assert [r.path for r in first] == paths
+    assert [r.height for r in first] == [20, 21, 22]
+    assert len(probed) == 3
+
+    # Second pass is served from the catalog
+    probed.clear()
+    second = indexer.index(paths)
+    assert second == first and probed == []
+
+    # A modified file is re-indexed
+    _write_tiff(paths[1], 50, 30)
+    os.utime(paths[1], (1e9, 1e9))
+    third = indexer.index(paths)
+    assert probed == [paths[1]]
+    assert third[1].height == 50 and third[1].file_hash != first[1].file_hash
+
+
+def test_unreadable_hash_is_not_persisted(
+    catalog: FileCatalog, tmp_path, monkeypatch
+) -> None:
+    path = str(tmp_path / "scan.tif")
+    _write_tiff(path, 10, 10)
+    indexer = LibraryIndexer(catalog, max_workers=1)
+
+    monkeypatch.setattr(indexer_module, "calculate_file_hash", lambda p: "err_x")
+    (failed,) = indexer.index([path])
+    assert failed.file_hash == "err_x"
+    assert catalog.lookup([path]) == {}
+
+    # Next pass re-probes once the file is readable
+    monkeypatch.undo()
+    (ok,) = indexer.index([path])
+    assert not ok.file_hash.startswith("err_")
+    assert catalog.lookup([path])[path] == ok
+
+
+def test_session_sort_applies_to_later_records(tmp_path) -> None:
+    from src.desktop.session import DesktopSessionManager
+    from src.infrastructure.storage.repository import StorageRepository
+
+    repo = StorageRepository(str(tmp_path / "e.db"), str(tmp_path / "s.db"))
+    repo.initialize()
+    session = DesktopSessionManager(repo)
+    session.add_records(
+        [
+            FileRecord("/r/b.tif", "hb", 300, 2.0, 600, 400, "Scan"),
+            FileRecord("/r/a.dng", "ha", 100, 3.0, 6000, 4000, "Bayer"),
+        ]
+    )
+    session.sort_files("size", descending=True)
+    session.add_records([FileRecord("/r/c.raf", "hc", 200, 1.0, 10, 10, "X-Trans")])
+
+    files = session.state.uploaded_files
+    assert [f["name"] for f in files] == ["b.tif", "c.raf", "a.dng"]
+    assert [f["name"] for f in files if session.matches_filter(f, "bay")] == ["a.dng"]
+    assert all(session.matches_filter(f, " ") for f in files)
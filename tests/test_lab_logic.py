@@ -66,6 +66,117 @@ class TestLabLogic(unittest.TestCase):
         self.assertAlmostEqual(sat[0, 0, 1], 0.0, delta=1e-5)
         self.assertAlmostEqual(sat[0, 0, 2], 0.0, delta=1e-5)
 
+    def test_lightness_single_lab_round_trip(self) -> None:
+        """
+        PhotoLabProcessor converts the frame to LAB once for CLAHE plus
+        sharpening, keeping the intermediate RGB clip.
+        """
+        from unittest.mock import patch
+        import cv2
+        from src.domain.interfaces import PipelineContext
+        from src.features.lab.models import LabConfig
+        from src.features.lab.processor import PhotoLabProcessor
+
+        rng = np.random.default_rng(0)
+        img = cv2.GaussianBlur(
+            rng.uniform(0.2, 0.8, (120, 160, 3)).astype(np.float32), (0, 0), 2
+        )
+        context = PipelineContext(original_size=(120, 160), scale_factor=1.0)
+
+        img = np.clip((img - 0.5) * 3.0 + 0.5, 0.0, 1.0)
+        config = LabConfig(clahe_strength=1.0, sharpen=0.6)
+
+        with patch("cv2.cvtColor", wraps=cv2.cvtColor) as cvt:
+            res = PhotoLabProcessor(config).process(img, context)
+        to_lab = [
+            c
+            for c in cvt.call_args_list
+            if c.args[1] == cv2.COLOR_RGB2LAB and c.args[0].shape == img.shape
+        ]
+        self.assertEqual(len(to_lab), 1)
+
+        sequential = apply_output_sharpening(apply_clahe(img, 1.0), 0.6)
+        diff = np.abs(res - sequential)
+        self.assertLess(float(diff.mean()), 2e-3)
+        # Residual is float LAB round-trip noise, not clipped highlights
+        self.assertLess(float(np.percentile(diff, 99)), 5e-3)
+
+    def test_clahe_luts_tile_and_scale_invariant(self) -> None:
+        """Frame LUTs give the same result per window and across sizes."""
+        import cv2
+        from src.features.lab.clahe import (
+            CLAHE_ANALYSIS_SIZE,
+            apply_clahe_luts,
+            build_clahe_luts,
+        )
+
+        rng = np.random.default_rng(1)
+        small = cv2.GaussianBlur(
+            rng.uniform(0.0, 100.0, (384, 512)).astype(np.float32), (0, 0), 6
+        )
+        small = (small - small.mean()) * 4.0 + 50.0
+        luts = build_clahe_luts(small, 1.0)
+        full = apply_clahe_luts(small, luts)
+
+        window = apply_clahe_luts(
+            small[70:250, 130:410], luts, origin=(70, 130), frame=small.shape
+        )
+        np.testing.assert_allclose(window, full[70:250, 130:410], atol=1e-4)
+
+        # Frames above the analysis size equalize like their preview
+        size = (CLAHE_ANALYSIS_SIZE, CLAHE_ANALYSIS_SIZE * 3 // 4)
+        big = cv2.resize(small, (size[0] * 2, size[1] * 2))
+        preview = cv2.resize(big, size, interpolation=cv2.INTER_AREA)
+        preview_res = apply_clahe_luts(preview, build_clahe_luts(preview, 1.0))
+        big_res = apply_clahe_luts(big, build_clahe_luts(big, 1.0))
+        back = cv2.resize(big_res, size, interpolation=cv2.INTER_AREA)
+        self.assertLess(float(np.abs(back - preview_res).mean()), 0.05)
+
+    def test_clahe_matches_opencv_16bit(self) -> None:
+        """LUT CLAHE keeps the look of cv2.createCLAHE on 16-bit L."""
+        import cv2
+        from src.features.lab.logic import clahe_lightness
+
+        rng = np.random.default_rng(4)
+        h, w = 480, 640
+        yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+        texture = cv2.GaussianBlur(
+            rng.normal(0.0, 1.0, (h, w)).astype(np.float32), (0, 0), 3
+        )
+        l_chan = np.clip(
+            15.0 + 60.0 * (xx / w) * (0.5 + 0.5 * np.sin(yy / 60.0)) + 6.0 * texture,
+            0.0,
+            100.0,
+        ).astype(np.float32)
+
+        for strength in (0.25, 0.5, 1.0):
+            clahe = cv2.createCLAHE(clipLimit=strength * 2.5, tileGridSize=(8, 8))
+            ref_u16 = clahe.apply((l_chan * (65535.0 / 100.0)).astype(np.uint16))
+            ref = l_chan * (1.0 - strength) + ref_u16 * (100.0 / 65535.0) * strength
+            res = clahe_lightness(l_chan, strength)
+            diff = np.abs(res - ref)
+            self.assertLess(float(diff.mean()), 0.05)
+            self.assertLess(float(np.percentile(diff, 99.9)), 0.2)
+
+    def test_clahe_luts_cached_by_key(self) -> None:
+        """Untiled renders of the same input reuse the measured curves."""
+        from unittest.mock import patch
+        from src.features.lab import logic
+        from src.features.lab.clahe import CLAHE_BINS
+
+        l_chan = np.linspace(0, 100, 64 * 48, dtype=np.float32).reshape(48, 64)
+        with patch.object(
+            logic, "build_clahe_luts", wraps=logic.build_clahe_luts
+        ) as build:
+            a = logic.clahe_lightness(l_chan, 0.5, cache_key="lut-test")
+            b = logic.clahe_lightness(l_chan, 0.5, cache_key="lut-test")
+            logic.clahe_lightness(l_chan, 0.7, cache_key="lut-test")
+        self.assertEqual(build.call_count, 2)
+        np.testing.assert_array_equal(a, b)
+        self.assertEqual(
+            logic.build_clahe_luts(l_chan, 1.0).tables.shape, (8, 8, CLAHE_BINS)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
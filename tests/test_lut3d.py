@@ -0,0 +1,97 @@
+import os
+import tempfile
+import numpy as np
+from src.domain.models import WorkspaceConfig
+from src.kernel.image.lut3d import (
+    apply_lut3d,
+    bake_lut3d,
+    identity_lattice,
+    read_cube,
+    write_cube,
+)
+from src.services.export.look import (
+    _look_transform,
+    export_look_cube,
+    get_look_lut,
+)
+
+
+def _rgb(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 1.0, (48, 64, 3)).astype(np.float32)
+
+
+def test_identity_lut_is_exact() -> None:
+    img = _rgb()
+    lut = bake_lut3d(lambda x: x, 17)
+    assert np.max(np.abs(apply_lut3d(img, lut) - img)) < 1e-4
+
+    # Shaped lattice: identity is linear in x, so only interpolation error remains
+    shaped = bake_lut3d(lambda x: x, 17, shaper_gamma=2.0)
+    assert np.max(np.abs(apply_lut3d(img, shaped) - img)) < 1.5e-3
+
+
+def test_tetrahedral_is_exact_for_affine_transform() -> None:
+    matrix = np.array(
+        [[0.8, 0.1, 0.1], [0.2, 0.7, 0.1], [0.05, 0.15, 0.8]], dtype=np.float32
+    )
+
+    def affine(x: np.ndarray) -> np.ndarray:
+        return (x @ matrix.T + 0.02).astype(np.float32)
+
+    img = _rgb(1)
+    lut = bake_lut3d(affine, 9)
+    assert np.max(np.abs(apply_lut3d(img, lut) - affine(img))) < 1e-4
+
+
+def test_cube_round_trip() -> None:
+    lut = bake_lut3d(lambda x: (x**1.5).astype(np.float32), 5, title="roundtrip")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "look.cube")
+        write_cube(path, lut)
+        with open(path) as f:
+            header = f.read().splitlines()[:2]
+        loaded = read_cube(path)
+
+    assert header == ['TITLE "roundtrip"', "LUT_3D_SIZE 5"]
+    assert loaded.title == "roundtrip"
+    assert np.allclose(loaded.table, lut.table, atol=1e-6)
+    # Red varies fastest in the file, the table is indexed [r, g, b]
+    assert np.allclose(loaded.table[4, 0, 0], lut.table[4, 0, 0])
+
+
+def test_identity_lattice_layout() -> None:
+    lattice = identity_lattice(3)
+    assert lattice.shape == (3, 9, 3)
+    assert np.allclose(lattice[2, 1 * 3 + 0], [1.0, 0.5, 0.0])
+
+
+def test_look_lut_tracks_reference_stages() -> None:
+    settings = WorkspaceConfig.from_flat_dict(
+        {"color_separation": 1.5, "saturation": 1.3, "paper_profile": "Warm Fiber"}
+    )
+    img = np.clip(_rgb(2), 0.05, 1.0)
+    expected = np.clip(_look_transform(settings, img), 0, 1)
+    # sqrt-spaced lattice: crosstalk is steep near black
+    res = np.clip(apply_lut3d(img, get_look_lut(settings, 65, 2.0)), 0, 1)
+
+    diff = np.abs(res - expected)
+    assert np.percentile(diff, 99) < 0.01
+    assert diff.mean() < 1e-3
+
+
+def test_look_lut_is_cached_per_config() -> None:
+    a = WorkspaceConfig.from_flat_dict({"saturation": 1.2})
+    b = WorkspaceConfig.from_flat_dict({"saturation": 1.2, "density": 0.7})
+    c = WorkspaceConfig.from_flat_dict({"saturation": 1.4})
+
+    # Exposure is upstream of the look and does not invalidate it
+    assert get_look_lut(a, 9) is get_look_lut(b, 9)
+    assert get_look_lut(a, 9) is not get_look_lut(c, 9)
+
+
+def test_export_look_cube_appends_extension() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_look_cube(WorkspaceConfig(), os.path.join(tmp, "look"), 5)
+        assert path.endswith(".cube")
+        assert read_cube(path).size == 5
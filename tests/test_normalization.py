@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from src.features.exposure.normalization import (
+    bounds_stride,
+    log_percentiles,
+    measure_linear_bounds,
+    measure_log_negative_bounds,
+)
+
+
+def _negative(h: int = 300, w: int = 400, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    img = rng.lognormal(-2.0, 1.0, (h, w, 3)).astype(np.float32)
+    # Clipped tails on both ends
+    img[:5] = 0.0
+    img[-5:] = 2.0
+    return img
+
+
+def _reference(img: np.ndarray, percents: list) -> np.ndarray:
+    log = np.log10(np.clip(img, 1e-6, 1.0))
+    return np.stack([np.percentile(log[..., ch], percents) for ch in range(3)])
+
+
+@pytest.mark.parametrize("percents", [[0.5, 99.5], [0.0, 1.0, 50.0, 100.0]])
+def test_log_percentiles_match_numpy(percents: list) -> None:
+    img = _negative()
+    res = log_percentiles(img, percents)
+    assert np.max(np.abs(res - _reference(img, percents))) < 1e-5
+
+
+def test_strided_views_and_subsample() -> None:
+    img = _negative(seed=1)
+    view = img[20:280, 30:370]
+    res = log_percentiles(view, [0.5, 99.5])
+    assert np.max(np.abs(res - _reference(view, [0.5, 99.5]))) < 1e-5
+
+    sub = log_percentiles(img, [0.5, 99.5], stride=2)
+    expected = _reference(img[::2, ::2], [0.5, 99.5])
+    assert np.max(np.abs(sub - expected)) < 1e-5
+
+
+def test_non_finite_values_clip_to_range() -> None:
+    img = _negative(seed=3)
+    img[5, 5:20, 0] = np.nan
+    img[40, 10:15, 1] = np.inf
+    img[80, 30:35, 2] = -np.inf
+    res = log_percentiles(img, [0.5, 50.0, 99.5])
+    assert np.all(np.isfinite(res))
+
+    clean = np.nan_to_num(img, nan=1e-6, posinf=1.0, neginf=1e-6)
+    assert np.max(np.abs(res - _reference(clean, [0.5, 50.0, 99.5]))) < 1e-5
+
+
+def test_linear_bounds_match_log_bounds() -> None:
+    img = _negative(seed=2)
+    ref = measure_log_negative_bounds(np.log10(np.clip(img, 1e-6, 1.0)))
+    res = measure_linear_bounds(img)
+    assert np.allclose(res.floors, ref.floors, atol=1e-5)
+    assert np.allclose(res.ceils, ref.ceils, atol=1e-5)
+
+
+def test_bounds_stride_caps_sample() -> None:
+    assert bounds_stride(1000, 1000) == 1
+    stride = bounds_stride(6000, 4000, max_pixels=4_000_000)
+    assert stride == 3
+    assert -(-6000 // stride) * -(-4000 // stride) <= 4_000_000
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from src.domain.interfaces import PipelineContext
+from src.domain.models import ProcessMode
+from src.features.exposure.fused import PointwiseChain
+from src.features.exposure.models import ExposureConfig
+from src.features.exposure.normalization import LogNegativeBounds
+from src.features.exposure.processor import (
+    FusedPhotometricProcessor,
+    NormalizationProcessor,
+    PhotometricProcessor,
+)
+from src.features.toning.logic import apply_chemical_toning, simulate_paper_substrate
+from src.features.toning.models import ToningConfig
+from src.features.toning.processor import ToningProcessor
+
+
+def _linear(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.01, 0.9, (64, 48, 3)).astype(np.float32)
+
+
+def _context(mode: str) -> PipelineContext:
+    return PipelineContext(original_size=(64, 48), scale_factor=1.0, process_mode=mode)
+
+
+def _reference(
+    img: np.ndarray, exposure: ExposureConfig, toning: ToningConfig, mode: str
+) -> np.ndarray:
+    ctx = _context(mode)
+    res = NormalizationProcessor(exposure).process(img, ctx)
+    res = PhotometricProcessor(exposure).process(res, ctx)
+    res = simulate_paper_substrate(res, toning.paper_profile)
+    if mode == ProcessMode.BW:
+        res = apply_chemical_toning(
+            res, toning.selenium_strength, toning.sepia_strength
+        )
+    return res
+
+
+@pytest.mark.parametrize(
+    "mode, exposure, toning",
+    [
+        (ProcessMode.C41, ExposureConfig(), ToningConfig()),
+        (
+            ProcessMode.C41,
+            ExposureConfig(density=0.6, grade=3.0, wb_magenta=0.3, toe=0.4),
+            ToningConfig(paper_profile="Warm Fiber"),
+        ),
+        (
+            ProcessMode.BW,
+            ExposureConfig(shoulder=0.5, wb_yellow=-0.2),
+            ToningConfig(
+                paper_profile="Cool Glossy", selenium_strength=0.6, sepia_strength=0.3
+            ),
+        ),
+    ],
+)
+def test_fused_chain_matches_separate_stages(
+    mode: str, exposure: ExposureConfig, toning: ToningConfig
+) -> None:
+    img = _linear()
+    expected = _reference(img, exposure, toning, mode)
+
+    ctx = _context(mode)
+    chain = FusedPhotometricProcessor(exposure).chain(img, ctx)
+    chain = chain.then(ToningProcessor(toning).chain(ctx))
+    res = chain.apply(img)
+
+    assert res.dtype == np.float32
+    assert np.max(np.abs(res - expected)) < 1e-4
+
+
+def test_fused_photometric_uses_cached_bounds() -> None:
+    img = _linear()
+    bounds = LogNegativeBounds(floors=(-1.5, -1.5, -1.5), ceils=(-0.1, -0.1, -0.1))
+    ctx = _context(ProcessMode.C41)
+    ctx.metrics["log_bounds"] = bounds
+    ctx.metrics["log_bounds_buffer_val"] = ExposureConfig().analysis_buffer
+
+    FusedPhotometricProcessor(ExposureConfig()).process(img, ctx)
+    assert ctx.metrics["log_bounds"] is bounds
+
+
+def test_chain_order_is_enforced() -> None:
+    toning = PointwiseChain().paper("Warm Fiber")
+    curve = PointwiseChain().curve(ExposureConfig())
+    with pytest.raises(ValueError):
+        toning.then(curve)
+    assert not curve.then(toning).is_empty
+
+
+def test_empty_chain_is_passthrough() -> None:
+    img = _linear()
+    assert PointwiseChain().apply(img) is img
@@ -0,0 +1,68 @@
+import threading
+import numpy as np
+from src.services.rendering.prefetch import PrefetchRequest, PreviewPrefetcher
+
+
+def _req(key: str) -> PrefetchRequest:
+    return PrefetchRequest(key, f"/roll/{key}.dng", key, "Adobe RGB")
+
+
+def _array_prefetcher(max_bytes: int, load=None) -> PreviewPrefetcher[np.ndarray]:
+    def _load(req: PrefetchRequest) -> np.ndarray:
+        return np.zeros(100, dtype=np.uint8)
+
+    return PreviewPrefetcher(load or _load, lambda a: a.nbytes, max_bytes)
+
+
+def test_hits_misses_and_eviction() -> None:
+    prefetcher = _array_prefetcher(250)
+    prefetcher.schedule([_req("a"), _req("b"), _req("c")])
+    prefetcher.shutdown(cancel_pending=False)
+
+    # Byte cap holds two entries, oldest evicted
+    assert "a" not in prefetcher
+    assert prefetcher.take("b") is not None
+    assert prefetcher.take("c") is not None
+    assert prefetcher.take("a") is None
+    assert prefetcher.total_bytes == 200
+
+    stats = prefetcher.stats.snapshot()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_jump_away_cancels_queued_decodes() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    loaded = []
+
+    def _load(req: PrefetchRequest) -> np.ndarray:
+        started.set()
+        release.wait(5)
+        loaded.append(req.key)
+        return np.zeros(10, dtype=np.uint8)
+
+    prefetcher = _array_prefetcher(1 << 20, _load)
+    prefetcher.schedule([_req("a"), _req("b"), _req("c")])
+    assert started.wait(5)
+
+    # "a" is running; "b" and "c" are dropped for the new neighbourhood
+    prefetcher.schedule([_req("a"), _req("x")])
+    release.set()
+    assert prefetcher.take("a") is not None
+    prefetcher.shutdown(cancel_pending=False)
+
+    assert loaded == ["a", "x"]
+    assert prefetcher.stats.cancelled == 2
+    assert prefetcher.stats.waited + prefetcher.stats.hits == 1
+
+
+def test_failed_decode_is_a_miss() -> None:
+    def _load(req: PrefetchRequest) -> np.ndarray:
+        raise OSError("corrupt")
+
+    prefetcher = _array_prefetcher(1 << 20, _load)
+    prefetcher.schedule([_req("a")])
+    prefetcher.shutdown(cancel_pending=False)
+    assert prefetcher.take("a") is None
+    assert prefetcher.stats.failed == 1
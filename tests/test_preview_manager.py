@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+import numpy as np
+import tifffile
+from src.infrastructure.loaders.factory import loader_factory
+from src.infrastructure.loaders.tiff_loader import NonStandardFileWrapper
+from src.infrastructure.storage.array_cache import ArrayDiskCache
+from src.kernel.system.config import APP_CONFIG
+from src.services.rendering.preview_manager import PreviewManager
+
+
+def test_draft_skipped_for_scans(tmp_path) -> None:
+    src = str(tmp_path / "scan.tif")
+    tifffile.imwrite(src, np.zeros((40, 60, 3), dtype=np.uint16))
+    assert not loader_factory.is_camera_raw(src)
+    assert PreviewManager.load_linear_draft(src) is None
+
+
+def test_draft_is_half_size_decode(tmp_path, monkeypatch) -> None:
+    src = tmp_path / "frame.dng"
+    src.write_bytes(b"\x00" * 16)
+    h, w = 3000, 4500
+    raw = NonStandardFileWrapper(np.full((h, w, 3), 0.25, dtype=np.float32))
+    raw.sizes = SimpleNamespace(height=h, width=w)  # type: ignore[attr-defined]
+    calls = []
+
+    def _postprocess(**kwargs):
+        calls.append(kwargs)
+        return NonStandardFileWrapper.postprocess(raw, **kwargs)
+
+    raw.postprocess = _postprocess  # type: ignore[method-assign]
+    monkeypatch.setattr(loader_factory, "get_loader", lambda _: (raw, {}))
+
+    assert loader_factory.is_camera_raw(str(src))
+    draft = PreviewManager.load_linear_draft(str(src))
+    assert draft is not None
+    img, dims, _ = draft
+    assert calls[0]["half_size"] is True
+    assert dims == (h, w)
+    assert max(img.shape[:2]) == APP_CONFIG.preview_render_size
+
+
+def test_cached_preview_only_reads_disk(tmp_path) -> None:
+    src = str(tmp_path / "frame.tif")
+    tifffile.imwrite(src, np.full((30, 40, 3), 30000, dtype=np.uint16))
+    manager = PreviewManager(ArrayDiskCache(str(tmp_path / "previews"), 1 << 24))
+
+    assert manager.cached_preview("hash", "Adobe RGB") is None
+    loaded, dims, _ = manager.load_preview(src, "hash", "Adobe RGB")
+    hit = manager.cached_preview("hash", "Adobe RGB")
+    assert hit is not None
+    assert hit[1] == dims and np.array_equal(hit[0], loaded)
+    assert manager.cached_preview("hash", "Adobe RGB", use_camera_wb=True) is None
@@ -0,0 +1,42 @@
+import numpy as np
+from src.services.rendering.preview_pyramid import PreviewPyramid
+
+
+def _preview(h: int = 1333, w: int = 2000) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.0, 1.0, (h, w, 3)).astype(np.float32)
+
+
+def test_build_levels_ascending_with_full_on_top() -> None:
+    full = _preview()
+    pyramid = PreviewPyramid.build(full)
+
+    assert pyramid.full is full
+    assert [max(lvl.shape[:2]) for lvl in pyramid.levels] == [500, 1000, 2000]
+    for lvl in pyramid.levels:
+        assert lvl.dtype == np.float32
+        assert abs(lvl.shape[1] / lvl.shape[0] - 2000 / 1333) < 0.01
+
+
+def test_small_preview_has_no_coarse_levels() -> None:
+    pyramid = PreviewPyramid.build(_preview(300, 400))
+    assert pyramid.top == 0
+    assert pyramid.interactive_level() == 0
+
+
+def test_interactive_level_follows_frame_budget() -> None:
+    pyramid = PreviewPyramid.build(_preview())
+    assert pyramid.interactive_level() == 0
+
+    # Fast coarse frames extrapolate (~4x pixels) to the middle level
+    pyramid.record_frame(0, 0.005)
+    assert pyramid.interactive_level(0.030) == 1
+
+    # Measured middle level over budget falls back to the smallest
+    pyramid.record_frame(1, 0.200)
+    pyramid.record_frame(1, 0.200)
+    assert pyramid.interactive_level(0.030) == 0
+
+    # Never picks the full preview for coarse frames
+    pyramid.frame_times = {0: 0.001, 1: 0.001, 2: 0.001}
+    assert pyramid.interactive_level(0.030) == 1
@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 import numpy as np
+from src.infrastructure.loaders.pakon_loader import PakonLoader
 from src.infrastructure.loaders.tiff_loader import NonStandardFileWrapper
 
 
@@ -7,6 +10,48 @@ class TestRawHandlers(unittest.TestCase):
     def test_pakon_detection(self):
         pass
 
+    def _write_pakon(self, planar: np.ndarray) -> str:
+        fd, path = tempfile.mkstemp(suffix=".raw")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        planar.astype("<u2").tofile(path)
+        return path
+
+    def test_pakon_planar_is_memory_mapped(self):
+        rng = np.random.default_rng(0)
+        planar = rng.integers(0, 65535, (3, 1000, 1500), dtype=np.uint16)
+        path = self._write_pakon(planar)
+        self.assertTrue(PakonLoader.can_handle(path))
+
+        wrapper, _ = PakonLoader().load(path)
+        with wrapper as raw:
+            self.assertEqual(raw.data.dtype, np.uint16)
+            self.assertIsInstance(raw.data.base, np.memmap)
+            full = raw.postprocess(output_bps=16)
+            half = raw.postprocess(output_bps=16, half_size=True)
+            crop = raw.read(step=2, region=(10, 50, 20, 80))
+
+        expected = planar.transpose(1, 2, 0)
+        np.testing.assert_array_equal(full, expected)
+        self.assertTrue(full.flags.writeable and full.flags.c_contiguous)
+        np.testing.assert_array_equal(half, expected[::2, ::2])
+        np.testing.assert_array_equal(crop, expected[10:50:2, 20:80:2])
+
+    def test_pakon_interleaved_bgr(self):
+        rgb = np.zeros((1000, 1500, 3), dtype=np.uint16)
+        rgb[..., 0] = 60000
+        rgb[..., 2] = 1000
+        # File order: B, G, R per pixel
+        path = self._write_pakon(np.ascontiguousarray(rgb[..., ::-1]))
+
+        wrapper, _ = PakonLoader().load(path)
+        with wrapper as raw:
+            out = raw.postprocess(output_bps=16)
+            out8 = raw.postprocess()
+        np.testing.assert_array_equal(out, rgb)
+        self.assertEqual(out8.dtype, np.uint8)
+        self.assertEqual(tuple(out8[0, 0]), (233, 0, 3))
+
     def test_non_standard_wrapper(self):
         data = np.ones((10, 10, 3), dtype=np.float32) * 0.5
         wrapper = NonStandardFileWrapper(data)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from src.domain.models import WorkspaceConfig
+from src.services.rendering.engine import DarkroomEngine
+from src.services.rendering.scheduler import (
+    CancellationToken,
+    RenderCancelled,
+    RenderScheduler,
+)
+
+
+def test_idle_scheduler_dispatches_immediately() -> None:
+    scheduler: RenderScheduler[str] = RenderScheduler()
+    ticket = scheduler.submit("a", CancellationToken())
+    assert ticket is not None and ticket.task == "a"
+    assert scheduler.busy
+    assert scheduler.complete() is None
+    assert not scheduler.busy
+
+
+def test_latest_request_wins() -> None:
+    scheduler: RenderScheduler[str] = RenderScheduler()
+    first = CancellationToken()
+    scheduler.submit("a", first, preemptible=False)
+
+    assert scheduler.submit("b", CancellationToken()) is None
+    assert scheduler.submit("c", CancellationToken()) is None
+    assert not first.cancelled
+
+    # Pending request is dispatched when the in-flight frame lands
+    nxt = scheduler.complete()
+    assert nxt is not None and nxt.task == "c"
+    assert scheduler.complete() is None
+
+    stats = scheduler.stats.snapshot()
+    assert stats["completed"] == 2
+    assert stats["superseded"] == 1
+    assert stats["frame_time_max"] >= 0.0
+    assert len(scheduler.stats.queue_latency) == 2
+
+
+def test_preemptible_frame_is_cancelled_by_newer_request() -> None:
+    scheduler: RenderScheduler[str] = RenderScheduler()
+    token = CancellationToken()
+    scheduler.submit("full", token, preemptible=True)
+    scheduler.submit("newer", CancellationToken())
+    assert token.cancelled
+
+    nxt = scheduler.complete(cancelled=True)
+    assert nxt is not None and nxt.task == "newer"
+    assert scheduler.stats.cancelled == 1
+
+
+def test_engine_stops_between_stages() -> None:
+    img = np.random.default_rng(0).uniform(0.1, 0.9, (64, 96, 3)).astype(np.float32)
+    engine = DarkroomEngine()
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(RenderCancelled):
+        engine.process(img, WorkspaceConfig(), "h", cancel_token=token)
+    assert engine.cache.stats.misses == 0
+
+    res = engine.process(img, WorkspaceConfig(), "h", cancel_token=CancellationToken())
+    assert res.ndim == 3
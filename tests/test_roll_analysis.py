@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+import tifffile
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig
+from src.features.exposure.normalization import LogNegativeBounds
+from src.features.exposure.processor import seed_log_bounds
+from src.services.rendering.engine import DarkroomEngine
+from src.services.rendering.roll_analysis import (
+    FrameAnalysisTask,
+    aggregate_roll_bounds,
+    analyze_roll,
+)
+
+
+def _write_frame(path: str, gain: float, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    img = rng.uniform(0.05, 0.6, (240, 360, 3)) * gain
+    tifffile.imwrite(path, (np.clip(img, 0, 1) * 65535).astype(np.uint16))
+
+
+def _bounds(floor: float, ceil: float) -> LogNegativeBounds:
+    return LogNegativeBounds(floors=(floor,) * 3, ceils=(ceil,) * 3)
+
+
+def test_aggregate_is_robust_to_outlier_frames() -> None:
+    frames = [_bounds(-1.2, -0.3), _bounds(-1.1, -0.2), _bounds(-4.0, 0.0)]
+    roll = aggregate_roll_bounds(frames)
+    assert roll.floors == (-1.2, -1.2, -1.2)
+    assert roll.ceils == (-0.2, -0.2, -0.2)
+
+    with pytest.raises(ValueError):
+        aggregate_roll_bounds([])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_analyze_roll(tmp_path, workers: int) -> None:
+    tasks = []
+    for i, gain in enumerate([1.0, 1.1, 0.9]):
+        path = str(tmp_path / f"frame_{i}.tif")
+        _write_frame(path, gain, i)
+        tasks.append(FrameAnalysisTask(path, WorkspaceConfig()))
+    tasks.append(FrameAnalysisTask(str(tmp_path / "missing.tif"), WorkspaceConfig()))
+
+    roll = analyze_roll(tasks, max_workers=workers)
+    assert roll is not None
+    assert roll.frames[-1] is None
+    measured = [b for b in roll.frames if b is not None]
+    assert len(measured) == 3
+    for ch in range(3):
+        assert roll.bounds.floors[ch] == np.median([b.floors[ch] for b in measured])
+        assert roll.bounds.floors[ch] < roll.bounds.ceils[ch]
+
+
+def test_engine_uses_seeded_bounds() -> None:
+    img = np.random.default_rng(0).uniform(0.05, 0.6, (64, 96, 3)).astype(np.float32)
+    engine = DarkroomEngine()
+    settings = WorkspaceConfig()
+
+    measured = engine.process(
+        img, settings, "h", PipelineContext(scale_factor=1.0, original_size=(64, 96))
+    )
+
+    roll = _bounds(-1.5, 0.0)
+    context = PipelineContext(scale_factor=1.0, original_size=(64, 96))
+    seed_log_bounds(context.metrics, roll, settings.exposure.analysis_buffer)
+    # Same source hash: seeded bounds must not hit the measured stage cache
+    seeded = engine.process(img, settings, "h", context)
+
+    assert context.metrics["log_bounds"] is roll
+    assert not np.allclose(measured, seeded)
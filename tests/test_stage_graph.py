@@ -0,0 +1,63 @@
+from dataclasses import replace
+import pytest
+from src.domain.models import WorkspaceConfig
+from src.features.lab.processor import (
+    ClaheProcessor,
+    SaturationProcessor,
+    SharpeningProcessor,
+)
+from src.services.rendering.engine import DarkroomEngine
+from src.services.rendering.stage_graph import (
+    StageGraph,
+    StageNode,
+    resolve_config_path,
+)
+
+
+def test_resolve_config_path() -> None:
+    settings = WorkspaceConfig()
+    assert resolve_config_path(settings, "lab.sharpen") == settings.lab.sharpen
+    assert resolve_config_path(settings, "geometry") == settings.geometry
+
+    with pytest.raises(ValueError):
+        resolve_config_path(settings, "lab.does_not_exist")
+
+
+def test_graph_rejects_unknown_dependencies() -> None:
+    with pytest.raises(ValueError):
+        StageGraph([StageNode("clahe", ClaheProcessor, "lab", after="missing")])
+
+
+def test_dirty_stages_minimal_set() -> None:
+    graph = DarkroomEngine().graph
+    base = WorkspaceConfig()
+
+    sharpen = replace(base, lab=replace(base.lab, sharpen=0.9))
+    assert graph.dirty_stages(base, sharpen) == ["lab_lightness"]
+
+    clahe = replace(base, lab=replace(base.lab, clahe_strength=0.4))
+    assert graph.dirty_stages(base, clahe) == ["lab_lightness"]
+
+    density = replace(base, exposure=replace(base.exposure, density=1.3))
+    assert "normalization" not in graph.dirty_stages(base, density)
+    assert "exposure" in graph.dirty_stages(base, density)
+
+    brush = replace(base, retouch=replace(base.retouch, manual_dust_size=12))
+    assert graph.dirty_stages(base, brush) == []
+
+
+def test_stage_hashes_chain_upstream() -> None:
+    graph = StageGraph(
+        [
+            StageNode("saturation", SaturationProcessor, "lab"),
+            StageNode("sharpen", SharpeningProcessor, "lab", after="saturation"),
+        ]
+    )
+    base = WorkspaceConfig()
+    changed = replace(base, lab=replace(base.lab, saturation=1.5))
+
+    old = graph.stage_hashes(base, "root")
+    new = graph.stage_hashes(changed, "root")
+    assert old["saturation"] != new["saturation"]
+    assert old["sharpen"] != new["sharpen"]
+    assert graph.stage_hashes(base, "other")["saturation"] != old["saturation"]
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+import tifffile
+from src.infrastructure.loaders.tiff_loader import TiffLoader
+from src.services.rendering.preview_manager import PreviewManager
+
+
+def _rgb16(h: int, w: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 65535, (h, w, 3), dtype=np.uint16)
+
+
+def _write_pyramid(path: str, full: np.ndarray, reduced: np.ndarray) -> None:
+    with tifffile.TiffWriter(path) as tw:
+        tw.write(full, subifds=1, photometric="rgb")
+        tw.write(reduced, subfiletype=1, photometric="rgb")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"compression": "zlib", "tile": (64, 64)},
+        {"planarconfig": "separate"},
+    ],
+)
+def test_full_decode_matches_source(tmp_path, kwargs) -> None:
+    img = _rgb16(100, 150)
+    path = str(tmp_path / "scan.tif")
+    data = img.transpose(2, 0, 1) if kwargs.get("planarconfig") else img
+    tifffile.imwrite(path, data, photometric="rgb", **kwargs)
+
+    wrapper, meta = TiffLoader().load(path)
+    with wrapper as raw:
+        assert raw.shape == (100, 150)
+        out = raw.postprocess(output_bps=16)
+        crop = raw.read_linear(region=(10, 20, 30, 50))
+
+    assert meta["color_space"] == "Adobe RGB"
+    np.testing.assert_array_equal(out, img)
+    assert crop.dtype == np.float32 and crop.shape == (10, 20, 3)
+    np.testing.assert_allclose(crop, img[10:20, 30:50] / 65535.0, atol=1e-6)
+
+
+def test_uncompressed_is_memory_mapped(tmp_path) -> None:
+    path = str(tmp_path / "scan.tif")
+    tifffile.imwrite(path, _rgb16(40, 60), photometric="rgb")
+    wrapper, _ = TiffLoader().load(path)
+    with wrapper as raw:
+        view = raw.read()
+        assert isinstance(view.base, np.memmap) or isinstance(view, np.memmap)
+
+
+def test_greyscale_8bit_expands_to_rgb(tmp_path) -> None:
+    path = str(tmp_path / "grey.tif")
+    grey = np.arange(200, dtype=np.uint8).reshape(10, 20)
+    tifffile.imwrite(path, grey)
+    wrapper, _ = TiffLoader().load(path)
+    with wrapper as raw:
+        out16 = raw.postprocess(output_bps=16)
+        out8 = raw.postprocess()
+    assert out16.shape == (10, 20, 3)
+    np.testing.assert_array_equal(out16[..., 2], grey.astype(np.uint16) * 257)
+    np.testing.assert_array_equal(out8[..., 0], grey)
+
+
+def test_half_size_uses_stored_level(tmp_path) -> None:
+    path = str(tmp_path / "pyramid.tif")
+    full = _rgb16(200, 300)
+    reduced = _rgb16(100, 150, seed=1)
+    _write_pyramid(path, full, reduced)
+
+    wrapper, _ = TiffLoader().load(path)
+    with wrapper as raw:
+        assert raw.level_shapes == ((200, 300), (100, 150))
+        np.testing.assert_array_equal(
+            raw.postprocess(output_bps=16, half_size=True), reduced
+        )
+
+
+def test_preview_reads_reduced_level(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "pyramid.tif")
+    full = np.full((320, 4000, 3), 10000, dtype=np.uint16)
+    reduced = np.full((160, 2000, 3), 20000, dtype=np.uint16)
+    _write_pyramid(path, full, reduced)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("decoded full resolution")
+
+    monkeypatch.setattr(PreviewManager, "load_linear_full", _fail)
+    preview, dims, _ = PreviewManager.load_linear_preview(path)
+    assert dims == (320, 4000)
+    assert preview.shape == (160, 2000, 3)
+    np.testing.assert_allclose(preview, 20000 / 65535.0, atol=1e-6)
+
+
+def test_big_endian_16bit_decodes(tmp_path) -> None:
+    img = _rgb16(30, 40)
+    path = str(tmp_path / "motorola.tif")
+    tifffile.imwrite(path, img, photometric="rgb", byteorder=">")
+
+    wrapper, _ = TiffLoader().load(path)
+    with wrapper as raw:
+        assert raw.read().dtype.byteorder == ">"
+        out16 = raw.postprocess(output_bps=16)
+        out8 = raw.postprocess()
+        crop = raw.read_linear(region=(5, 15, 10, 30))
+
+    assert out16.dtype == np.uint16
+    np.testing.assert_array_equal(out16, img)
+    np.testing.assert_array_equal(out8, (img // 257).astype(np.uint8))
+    np.testing.assert_allclose(crop, img[5:15, 10:30] / 65535.0, atol=1e-6)
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from src.domain.interfaces import PipelineContext
+from src.domain.models import WorkspaceConfig
+from src.services.rendering.engine import DarkroomEngine
+from src.services.rendering.tiled_engine import (
+    GeometrySampler,
+    TiledExportEngine,
+    parallel_tiles_supported,
+    plan_tiles,
+    tile_halo,
+)
+
+
+def _film_frame(h: int = 240, w: int = 320, seed: int = 0) -> np.ndarray:
+    """Smooth negative with bright film borders and a few dust specks."""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    img = np.stack(
+        [
+            0.2 + 0.3 * (xx / w),
+            0.25 + 0.25 * (yy / h),
+            0.3 + 0.2 * np.sin(xx / 17.0) * np.cos(yy / 23.0),
+        ],
+        axis=-1,
+    ).astype(np.float32)
+    img += rng.normal(0, 0.01, img.shape).astype(np.float32)
+    img[:12], img[-12:], img[:, :15], img[:, -15:] = 0.98, 0.98, 0.98, 0.98
+    for y, x in [(60, 80), (150, 200), (100, 260)]:
+        img[y : y + 2, x : x + 2] = 0.02
+    return np.clip(img, 0.0, 1.0)
+
+
+def _compare(settings: WorkspaceConfig, img: np.ndarray, scale: float = 1.0) -> float:
+    ctx = PipelineContext(
+        original_size=img.shape[:2],
+        scale_factor=scale,
+        process_mode=settings.process_mode,
+    )
+    reference = DarkroomEngine().process(img, settings, source_hash="ref", context=ctx)
+    tiled = TiledExportEngine(tile_size=64).process(img, settings, scale_factor=scale)
+    assert reference.shape == tiled.shape
+    return float(np.max(np.abs(reference - tiled)))
+
+
+def _settings(**kwargs: object) -> WorkspaceConfig:
+    return WorkspaceConfig.from_flat_dict(kwargs)
+
+
+def test_plan_tiles_covers_rect() -> None:
+    tiles = plan_tiles((10, 250, 5, 130), 64)
+    covered = np.zeros((260, 140), dtype=np.int32)
+    for y1, y2, x1, x2 in tiles:
+        covered[y1:y2, x1:x2] += 1
+    assert np.all(covered[10:250, 5:130] == 1)
+    assert covered.sum() == 240 * 125
+
+
+def test_sampler_matches_full_geometry() -> None:
+    from src.features.geometry.processor import GeometryProcessor
+
+    img = _film_frame()
+    settings = _settings(rotation=1, flip_horizontal=True, fine_rotation=1.5)
+    ctx = PipelineContext(original_size=img.shape[:2], scale_factor=1.0)
+    full = GeometryProcessor(settings.geometry).process(img, ctx)
+
+    sampler = GeometrySampler(img, settings.geometry)
+    assert sampler.shape == full.shape[:2]
+    window = (40, 170, 30, 200)
+    assert np.allclose(sampler.read(window), full[40:170, 30:200], atol=1e-3)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"sharpen": 0.0},
+        {"rotation": 1, "flip_vertical": True},
+        {"dust_remove": True, "dust_size": 2},
+        {"clahe_strength": 0.4},
+        {"process_mode": "B&W"},
+        {"color_separation": 1.5, "saturation": 1.3},
+    ],
+)
+def test_tiled_matches_full_pipeline(params: dict) -> None:
+    assert _compare(_settings(**params), _film_frame()) < 2e-3
+
+
+def test_tiled_manual_crop_fine_rotation() -> None:
+    settings = _settings(
+        fine_rotation=2.0, manual_crop_rect=(0.1, 0.1, 0.9, 0.85), sharpen=0.0
+    )
+    assert _compare(settings, _film_frame()) < 2e-3
+
+
+def test_halo_grows_with_neighbourhood_stages() -> None:
+    base = tile_halo(_settings(sharpen=0.0), 1.0)
+    assert tile_halo(_settings(sharpen=0.5), 1.0) > base
+    assert tile_halo(_settings(sharpen=0.0, dust_remove=True), 4.0) > base
+
+
+def test_budget_shrinks_tiles_and_fails_when_too_small() -> None:
+    img = _film_frame()
+    settings = _settings()
+
+    engine = TiledExportEngine(memory_budget=8 * 1024 * 1024, tile_size=2048)
+    res = engine.process(img, settings, scale_factor=1.0)
+    assert res.ndim == 3
+
+    with pytest.raises(MemoryError):
+        TiledExportEngine(memory_budget=64 * 1024).process(
+            img, settings, scale_factor=1.0
+        )
+
+
+def test_uint16_source_and_workers_match_serial_float() -> None:
+    img = _film_frame()
+    img16 = np.round(img * 65535.0).astype(np.uint16)
+    settings = _settings(sharpen=0.5, dust_remove=True, fine_rotation=1.5)
+
+    serial = TiledExportEngine(tile_size=64, workers=1).process(
+        img16.astype(np.float32) / 65535.0, settings, scale_factor=1.0
+    )
+    engine = TiledExportEngine(tile_size=64, workers=4)
+    if parallel_tiles_supported():
+        assert engine.prepare(img16, settings, 1.0).workers == 4
+    pooled = engine.process(img16, settings, scale_factor=1.0)
+    assert pooled.shape == serial.shape
+    assert float(np.max(np.abs(pooled - serial))) < 1e-5
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from src.domain.models import WorkspaceConfig
+from src.features.exposure.normalization import LogNegativeBounds
+from src.kernel.system.config import APP_CONFIG
+from src.services.rendering.tiled_engine import TiledExportEngine
+from src.services.rendering.viewport import (
+    Viewport,
+    ViewportRenderer,
+    grid_tiles,
+    viewport_to_frame_rect,
+)
+from tests.test_tiled_engine import _film_frame
+
+
+def _settings(**kwargs: object) -> WorkspaceConfig:
+    return WorkspaceConfig.from_flat_dict(kwargs)
+
+
+def _reference_crop(
+    img: np.ndarray,
+    settings: WorkspaceConfig,
+    renderer: ViewportRenderer,
+    viewport: Viewport,
+) -> np.ndarray:
+    scale = max(img.shape[:2]) / float(APP_CONFIG.preview_render_size)
+    full = TiledExportEngine(tile_size=64).process(img, settings, scale_factor=scale)
+    assert renderer._plan is not None
+    roi = renderer._plan[1].roi
+    y1, y2, x1, x2 = viewport_to_frame_rect(viewport, roi)
+    return full[y1 - roi[0] : y2 - roi[0], x1 - roi[2] : x2 - roi[2]]
+
+
+def test_viewport_rect_mapping() -> None:
+    roi = (10, 110, 20, 220)
+    assert viewport_to_frame_rect((0.0, 0.0, 1.0, 1.0), roi) == roi
+    assert viewport_to_frame_rect((0.5, 0.25, 0.75, 0.5), roi) == (35, 60, 120, 170)
+    # Degenerate viewports still cover one pixel
+    y1, y2, x1, x2 = viewport_to_frame_rect((1.0, 1.0, 1.0, 1.0), roi)
+    assert y2 - y1 == 1 and x2 - x1 == 1
+
+
+def test_grid_tiles_are_aligned() -> None:
+    tiles = grid_tiles((70, 130, 10, 60), 64, (240, 320))
+    assert tiles == [(64, 128, 0, 64), (128, 192, 0, 64)]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"dust_remove": True, "dust_size": 2, "rotation": 1},
+        {"color_separation": 1.4, "sharpen": 0.5},
+    ],
+)
+def test_viewport_matches_full_render(params: dict) -> None:
+    img = _film_frame()
+    settings = _settings(**params)
+    renderer = ViewportRenderer(tile_size=64)
+    viewport = (0.2, 0.3, 0.7, 0.8)
+
+    res = renderer.render(img, settings, "src", viewport)
+    expected = np.clip(_reference_crop(img, settings, renderer, viewport), 0, 1)
+    assert res.shape == expected.shape
+    assert np.max(np.abs(res - expected)) < 1e-5
+
+
+def test_pan_reuses_cached_tiles() -> None:
+    img = _film_frame()
+    settings = _settings()
+    renderer = ViewportRenderer(tile_size=64)
+
+    renderer.render(img, settings, "src", (0.1, 0.1, 0.5, 0.5))
+    misses = renderer.cache.stats.misses
+    renderer.render(img, settings, "src", (0.15, 0.1, 0.55, 0.5))
+    assert renderer.cache.stats.hits > 0
+    assert renderer.cache.stats.misses - misses < misses
+
+
+def test_bw_uses_preview_black_point_and_out_size() -> None:
+    img = _film_frame()
+    settings = _settings(process_mode="B&W")
+    renderer = ViewportRenderer(tile_size=64)
+
+    plain = renderer.render(img, settings, "src", (0.0, 0.0, 1.0, 1.0))
+    lifted = renderer.render(
+        img, settings, "src", (0.0, 0.0, 1.0, 1.0), metrics={"bw_black_point": 0.1}
+    )
+    assert lifted.mean() < plain.mean()
+
+    small = renderer.render(
+        img, settings, "src", (0.0, 0.0, 1.0, 1.0), out_size=(50, 50)
+    )
+    assert max(small.shape[:2]) == 50
+
+
+def test_new_preview_bounds_invalidate_plan() -> None:
+    img = _film_frame()
+    settings = _settings()
+    renderer = ViewportRenderer(tile_size=64)
+    viewport = (0.2, 0.3, 0.7, 0.8)
+
+    base = renderer.render(img, settings, "src", viewport)
+    bounds = renderer._plan[1].base_metrics["log_bounds"] if renderer._plan else None
+    assert bounds is not None
+    narrowed = LogNegativeBounds(
+        tuple(f + 0.1 for f in bounds.floors),  # type: ignore[arg-type]
+        bounds.ceils,
+    )
+    metrics = {
+        "log_bounds": narrowed,
+        "log_bounds_buffer_val": settings.exposure.analysis_buffer,
+    }
+    res = renderer.render(img, settings, "src", viewport, metrics=metrics)
+    assert np.max(np.abs(res - base)) > 1e-3